@@ -1,10 +1,65 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, CompileError, LinkError
+
+OPENMP_FLAG = "-fopenmp"
+
+
+class OptionalBuildExt(build_ext):
+    """
+    Retry the native kernel without OpenMP when the compiler lacks it.
+
+    The extension is marked optional, so if that build fails as well it is
+    skipped with a warning and the package installs as pure Python.
+    """
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, CompileError, LinkError) as e:
+            if OPENMP_FLAG not in ext.extra_compile_args:
+                raise
+            # e.g. Apple clang; the prange loops then run serially
+            print(f"warning: building {ext.name} with OpenMP failed ({e}), retrying")
+            ext.extra_compile_args = [
+                arg for arg in ext.extra_compile_args if arg != OPENMP_FLAG
+            ]
+            ext.extra_link_args = [
+                arg for arg in ext.extra_link_args if arg != OPENMP_FLAG
+            ]
+            super().build_extension(ext)
+
+
+# The native cleaning kernel is optional: without Cython the package installs
+# as pure Python and data_cleaner uses its numba/NumPy fallbacks. pip builds in
+# an isolated environment, so install Cython first and pass
+# --no-build-isolation to compile it.
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "trading_data_pipeline.ingest._clean_kernel",
+                ["src/trading_data_pipeline/ingest/_clean_kernel.pyx"],
+                extra_compile_args=["-O3", OPENMP_FLAG],
+                extra_link_args=[OPENMP_FLAG],
+            )
+        ]
+    )
+    # cythonize does not carry Extension(optional=...) over, so set it here
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    ext_modules = []
 
 setup(
     name="trading-data-pipeline",
     version="0.1.0",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": OptionalBuildExt},
     install_requires=[
         "pandas>=1.5.0",
         "numpy>=1.22.0",
@@ -15,6 +70,25 @@ setup(
         "kiteconnect>=4.1.0",
         "pyyaml>=6.0",
     ],
+    extras_require={
+        # Faster cleaning/validation kernels and metadata serialization
+        "fast": [
+            "numba>=0.59",
+            "bottleneck>=1.3.6",
+            "polars>=0.20",
+            "joblib>=1.3",
+            "scipy>=1.11",
+            "orjson>=3.9",
+        ],
+        # Storage Write/Read API, Arrow results and the query result cache
+        "bigquery": [
+            "google-cloud-bigquery-storage>=2.24",
+            "pyarrow>=14.0",
+            "cachetools>=5.3",
+        ],
+        # Compiles the _clean_kernel extension (see note above)
+        "native": ["Cython>=3.0"],
+    },
     python_requires=">=3.11",
     entry_points={
         "console_scripts": [
@@ -9,13 +9,79 @@ This module provides a unified interface for managing SQLite databases used in a
 
 """
 
+import atexit
 import json
 import logging
+import queue
 import sqlite3
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Serialize metadata columns with orjson when it is installed
+USE_ORJSON = ORJSON_AVAILABLE
+
+
+def _builtin_keys(value: Any) -> Any:
+    """Copy of value with NumPy scalar dict keys converted to Python scalars"""
+    if isinstance(value, dict):
+        return {
+            (key.item() if isinstance(key, np.generic) else key): _builtin_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_builtin_keys(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps fallback for NumPy scalars and arrays"""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_metadata(metadata: dict[str, Any] | None) -> bytes:
+    """Serialize a metadata dict to bytes for a BLOB column
+
+    Like json.dumps, non-string keys (int, float, bool, None) are written as
+    strings; NumPy scalar keys are accepted too.
+    """
+    metadata = metadata or {}
+    if USE_ORJSON:
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        try:
+            return orjson.dumps(metadata, option=options)
+        except TypeError:
+            # orjson rejects NumPy scalars as dict keys
+            return orjson.dumps(_builtin_keys(metadata), option=options)
+    return json.dumps(_builtin_keys(metadata), default=_json_default).encode("utf-8")
+
+
+def decode_metadata(value: bytes | str | None) -> dict[str, Any]:
+    """Deserialize a metadata column (BLOB, or TEXT written by older versions)"""
+    if not value:
+        return {}
+    if USE_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
 
 
 class DatabaseMode(Enum):
@@ -23,15 +89,339 @@ class DatabaseMode(Enum):
     PRODUCTION = "production"
 
 
+SOURCE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS market_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    timestamp DATETIME NOT NULL,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(symbol, timestamp, source)
+);
+
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    signal_id TEXT UNIQUE NOT NULL,
+    symbol TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    action TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    timestamp DATETIME NOT NULL,
+    metadata BLOB,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS sync_tracking (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    symbol TEXT NOT NULL,
+    last_sync DATETIME NOT NULL,
+    sync_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    records_count INTEGER DEFAULT 0,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+RESULTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backtest_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    backtest_id TEXT UNIQUE NOT NULL,
+    strategy TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    initial_capital REAL NOT NULL,
+    final_value REAL NOT NULL,
+    total_return_pct REAL NOT NULL,
+    sharpe_ratio REAL,
+    max_drawdown_pct REAL,
+    trades_count INTEGER NOT NULL,
+    win_rate_pct REAL,
+    metadata BLOB,
+    mode TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS paper_trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_id TEXT UNIQUE NOT NULL,
+    strategy TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    action TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    price REAL,
+    timestamp DATETIME NOT NULL,
+    status TEXT NOT NULL,
+    pnl REAL,
+    mode TEXT NOT NULL,
+    metadata BLOB,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS performance_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    metrics_id TEXT UNIQUE NOT NULL,
+    period_start DATE NOT NULL,
+    period_end DATE NOT NULL,
+    strategy TEXT,
+    symbol TEXT,
+    metric_type TEXT NOT NULL,
+    metric_value REAL NOT NULL,
+    mode TEXT NOT NULL,
+    metadata BLOB,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+ANALYTICS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analytics_reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    report_id TEXT UNIQUE NOT NULL,
+    report_type TEXT NOT NULL,
+    period_start DATE NOT NULL,
+    period_end DATE NOT NULL,
+    summary TEXT NOT NULL,
+    details TEXT,
+    mode TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS risk_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    metric_id TEXT UNIQUE NOT NULL,
+    symbol TEXT,
+    strategy TEXT,
+    risk_type TEXT NOT NULL,
+    risk_value REAL NOT NULL,
+    threshold_value REAL,
+    status TEXT NOT NULL,
+    timestamp DATETIME NOT NULL,
+    mode TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS compliance_audits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    audit_id TEXT UNIQUE NOT NULL,
+    audit_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    violations_count INTEGER DEFAULT 0,
+    details TEXT,
+    auditor TEXT,
+    mode TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Indexes are kept separate from the table DDL so they can also be applied to
+# databases created by older versions.
+SOURCE_INDEXES = """
+-- Covers get_recent_data_arr: symbol filter, timestamp order and the OHLCV
+-- columns are all served from the index without a table lookup.
+-- get_recent_data (SELECT *) still reads the table rows.
+CREATE INDEX IF NOT EXISTS idx_market_data_cover
+    ON market_data(symbol, timestamp DESC, open, high, low, close, volume);
+DROP INDEX IF EXISTS idx_market_data_symbol_timestamp;
+CREATE INDEX IF NOT EXISTS idx_signals_symbol_timestamp
+    ON signals(symbol, timestamp);
+"""
+
+RESULTS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_backtest_strategy_symbol
+    ON backtest_results(strategy, symbol);
+CREATE INDEX IF NOT EXISTS idx_paper_trades_symbol_timestamp
+    ON paper_trades(symbol, timestamp);
+"""
+
+INDEX_SCRIPTS = {
+    "source_db": SOURCE_INDEXES,
+    "results_db": RESULTS_INDEXES,
+}
+
+# Idempotent market data write: re-ingesting an unchanged bar is a no-op, a
+# corrected bar is updated in place instead of being deleted and re-inserted.
+MARKET_DATA_UPSERT_TEMPLATE = """
+INSERT INTO main.market_data
+(symbol, timestamp, open, high, low, close, volume, source)
+VALUES {values}
+ON CONFLICT(symbol, timestamp, source) DO UPDATE SET
+    open = excluded.open,
+    high = excluded.high,
+    low = excluded.low,
+    close = excluded.close,
+    volume = excluded.volume
+WHERE market_data.open != excluded.open
+   OR market_data.high != excluded.high
+   OR market_data.low != excluded.low
+   OR market_data.close != excluded.close
+   OR market_data.volume != excluded.volume
+"""
+
+# Rows bound per multi-row INSERT (8 parameters each, well under SQLite's
+# 999 host-parameter limit)
+MARKET_DATA_INSERT_CHUNK = 64
+
+
+@lru_cache(maxsize=None)
+def _market_data_upsert_sql(n_rows: int) -> str:
+    """Build (once per row count) the multi-row VALUES market data upsert"""
+    values = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?)"] * n_rows)
+    return MARKET_DATA_UPSERT_TEMPLATE.format(values=values)
+
+
+BACKTEST_RESULT_UPSERT = """
+INSERT INTO results.backtest_results
+(backtest_id, strategy, symbol, start_date, end_date, initial_capital,
+ final_value, total_return_pct, sharpe_ratio, max_drawdown_pct,
+ trades_count, win_rate_pct, metadata, mode)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(backtest_id) DO UPDATE SET
+    strategy = excluded.strategy,
+    symbol = excluded.symbol,
+    start_date = excluded.start_date,
+    end_date = excluded.end_date,
+    initial_capital = excluded.initial_capital,
+    final_value = excluded.final_value,
+    total_return_pct = excluded.total_return_pct,
+    sharpe_ratio = excluded.sharpe_ratio,
+    max_drawdown_pct = excluded.max_drawdown_pct,
+    trades_count = excluded.trades_count,
+    win_rate_pct = excluded.win_rate_pct,
+    metadata = excluded.metadata,
+    mode = excluded.mode
+"""
+
+# Schema name of each database on the hub writer connection: the source
+# database is ``main`` and the others are ATTACHed under these names. A hub
+# transaction that touches several of them is not atomic across files in WAL
+# mode (see _get_writer).
+SCHEMA_ALIASES = {
+    "source_db": "main",
+    "results_db": "results",
+    "analytics_db": "analytics",
+}
+
+# Row layout returned by DatabaseManager.get_recent_data_arr
+RECENT_DATA_DTYPE = np.dtype(
+    [
+        ("timestamp", "U32"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "i8"),
+    ]
+)
+
+SCHEMA_SCRIPTS = {
+    "source_db": SOURCE_SCHEMA,
+    "results_db": RESULTS_SCHEMA,
+    "analytics_db": ANALYTICS_SCHEMA,
+}
+
+
+# Managers not yet closed. One atexit hook closes them, committing their
+# queued writes, without keeping them alive the way a per-instance
+# atexit.register(self.close) would.
+_OPEN_MANAGERS: "weakref.WeakSet[DatabaseManager]" = weakref.WeakSet()
+
+
+def _close_open_managers():
+    for manager in list(_OPEN_MANAGERS):
+        manager.close()
+
+
+atexit.register(_close_open_managers)
+
+
+def _writer_main(manager_ref: weakref.ref, write_q: queue.Queue):
+    """Body of a manager's writer thread
+
+    The thread holds the manager only while queued writes remain, so a
+    manager that is dropped without close() can still be garbage collected;
+    its finalizer then queues the ``None`` sentinel that ends the thread.
+    Writes queued just before the last reference is dropped may be lost, so
+    call flush() or close() first.
+    """
+    manager = None
+    while True:
+        if manager is not None and write_q.empty():
+            manager = None
+        item = write_q.get()
+        if item is not None and manager is None:
+            manager = manager_ref()
+        if item is None or manager is None:
+            write_q.task_done()
+            if item is None:
+                return
+            continue
+        if manager._write_queued(item):
+            return
+
+
+def _run_checkpoint(manager_ref: weakref.ref):
+    """Checkpoint timer callback, holding the manager only while it runs"""
+    manager = manager_ref()
+    if manager is not None:
+        manager._run_checkpoint()
+
+
 class DatabaseManager:
     """Manages database connections and operations for testing and production"""
 
     def __init__(self, mode: DatabaseMode = DatabaseMode.TESTING):
         self.mode = mode
         self.config = self._load_database_config()
+
+        # Resolve the active mode's settings once instead of on every call
+        mode_config = self.config[mode.value]
+        self._db_paths: dict[str, str] = {
+            k: v for k, v in mode_config.items() if k.endswith("_db")
+        }
+        self._enable_wal = bool(mode_config.get("enable_wal", False))
+        self._reader_pragmas = self._build_pragma_script(mode_config)
+        self._writer_pragmas = self._build_pragma_script(
+            mode_config, [SCHEMA_ALIASES[db_type] for db_type in self._db_paths]
+        )
+        self._checkpoint_interval = mode_config.get("checkpoint_interval_seconds", 0)
+        self._checkpoint_every = mode_config.get("checkpoint_every_commits", 0)
+        self._analyze_after = mode_config.get("analyze_after_rows", 0)
+        self._writer_batch_size = mode_config.get("writer_batch_size", 256)
+
         self.setup_logging()
         self._ensure_databases_exist()
 
+        # Long-lived hub writer connection (see _get_writer), serialized by a lock
+        self._hub: sqlite3.Connection | None = None
+        self._writer_lock = threading.Lock()
+        self._commits_since_checkpoint = 0
+        self._checkpoint_timer: threading.Timer | None = None
+        self._closed = False
+        # Orders close() against enqueues, so nothing is queued after the
+        # writer thread's sentinel
+        self._close_lock = threading.Lock()
+        self._schedule_checkpoint()
+
+        # All writes are funneled through one queue drained by a single
+        # writer thread, so concurrent callers never contend for the lock.
+        self._write_q: queue.Queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=_writer_main,
+            args=(weakref.ref(self), self._write_q),
+            name=f"db_writer_{mode.value}",
+            daemon=True,
+        )
+        self._writer_thread.start()
+        # Stops the writer thread on close(), or when the manager is collected
+        self._stop_writer = weakref.finalize(self, self._write_q.put, None)
+        # Queued writes are drained at interpreter exit if close() was not called
+        _OPEN_MANAGERS.add(self)
+
     def _load_database_config(self) -> dict[str, Any]:
         """Load database configuration"""
         config = {
@@ -41,6 +431,11 @@ class DatabaseManager:
                 "analytics_db": "data/testing/analytics.db",
                 "max_connections": 5,
                 "enable_wal": True,
+                "wal_autocheckpoint": 10000,
+                "checkpoint_interval_seconds": 300,
+                "checkpoint_every_commits": 1000,
+                "analyze_after_rows": 10000,
+                "writer_batch_size": 256,
             },
             "production": {
                 "source_db": "data/production/source.db",
@@ -48,6 +443,11 @@ class DatabaseManager:
                 "analytics_db": "data/production/analytics.db",
                 "max_connections": 20,
                 "enable_wal": True,
+                "wal_autocheckpoint": 10000,
+                "checkpoint_interval_seconds": 300,
+                "checkpoint_every_commits": 1000,
+                "analyze_after_rows": 10000,
+                "writer_batch_size": 256,
             },
         }
 
@@ -62,334 +462,406 @@ class DatabaseManager:
 
         return config
 
+    @staticmethod
+    def _build_pragma_script(
+        mode_config: dict[str, Any], writer_schemas: list[str] | None = None
+    ) -> str:
+        """Build the PRAGMA script run on every new reader or writer connection
+
+        Reader connections get the plain script. For the hub writer, pass the
+        schema names it has attached: journal_mode and synchronous are
+        per-database settings and must be set on each one.
+        """
+        if not mode_config.get("enable_wal", False):
+            return ""
+
+        if writer_schemas is None:
+            return "PRAGMA journal_mode=WAL;"
+
+        pragmas = []
+        for schema in writer_schemas:
+            pragmas += [
+                f"PRAGMA {schema}.journal_mode=WAL;",
+                f"PRAGMA {schema}.synchronous=NORMAL;",
+            ]
+        # Checkpoints are run explicitly by checkpoint(); a large
+        # threshold keeps COMMITs from stalling on an auto-checkpoint.
+        pragmas.append(
+            f"PRAGMA wal_autocheckpoint={int(mode_config.get('wal_autocheckpoint', 10000))};"
+        )
+        return "\n".join(pragmas)
+
     def setup_logging(self):
         """Setup database logging"""
-        self.logger = logging.getLogger("db_manager_{self.mode.value}")
+        self.logger = logging.getLogger(f"db_manager_{self.mode.value}")
 
     def _ensure_databases_exist(self):
         """Ensure all required databases exist"""
-        mode_config = self.config[self.mode.value]
+        for db_type, db_path in self._db_paths.items():
+            full_path = Path(db_path)
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            created = not full_path.exists()
+            conn = sqlite3.connect(str(full_path))
+            try:
+                if created:
+                    # Initialize the WAL files in the same session that
+                    # creates the schema instead of on first use.
+                    if self._enable_wal:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                    self._create_database(conn, db_type)
+                self._create_indexes(conn, db_type, analyze=created)
+            finally:
+                conn.close()
+
+            if created:
+                self.logger.info(f"✅ Created {db_type}: {full_path}")
+
+    def _create_database(self, conn: sqlite3.Connection, db_type: str):
+        """Create the schema for ``db_type`` on an already-open connection"""
+        script = SCHEMA_SCRIPTS.get(db_type)
+        if script is None:
+            return
 
-        for db_type, db_path in mode_config.items():
-            if db_type.endswith("_db"):
-                full_path = Path(db_path)
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-
-                if not full_path.exists():
-                    self._create_database(full_path, db_type)
-                    self.logger.info("✅ Created {db_type}: {full_path}")
+        try:
+            # executescript runs the whole multi-statement script; wrapping it
+            # in an explicit transaction means a single commit per database.
+            conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+            self.logger.info(f"📊 Created schema for {db_type}")
 
-    def _create_database(self, db_path: Path, db_type: str):
-        """Create a new database with appropriate schema"""
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
+        except Exception as e:
+            self.logger.error(f"❌ Error creating {db_type}: {e}")
+            if conn.in_transaction:
+                conn.rollback()
 
-        try:
-            if db_type == "source_db":
-                self._create_source_schema(cursor)
-            elif db_type == "results_db":
-                self._create_results_schema(cursor)
-            elif db_type == "analytics_db":
-                self._create_analytics_schema(cursor)
+    def _create_indexes(self, conn: sqlite3.Connection, db_type: str, analyze: bool):
+        """Create (idempotently) the indexes for ``db_type`` and refresh stats
 
-            conn.commit()
-            self.logger.info("📊 Created schema for {db_type}")
+        A full ANALYZE is run for freshly created databases; existing ones
+        use PRAGMA optimize, which only re-analyzes tables that need it.
+        """
+        script = INDEX_SCRIPTS.get(db_type, "")
+        stats = "ANALYZE;" if analyze else "PRAGMA optimize;"
 
+        try:
+            conn.executescript(f"BEGIN;\n{script}\nCOMMIT;\n{stats}")
         except Exception as e:
-            self.logger.error("❌ Error creating {db_type}: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
+            self.logger.error(f"❌ Error creating indexes for {db_type}: {e}")
+            if conn.in_transaction:
+                conn.rollback()
 
-    def _create_source_schema(self, cursor):
-        """Create source database schema"""
-        # Market data table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS market_data (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                timestamp DATETIME NOT NULL,
-                open REAL NOT NULL,
-                high REAL NOT NULL,
-                low REAL NOT NULL,
-                close REAL NOT NULL,
-                volume INTEGER NOT NULL,
-                source TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(symbol, timestamp, source)
-            )
-        """
-        )
+    def analyze(self, db_type: str = "source_db"):
+        """Refresh query planner statistics, e.g. after a bulk load"""
+        with self._writer_lock:
+            self._get_writer().execute(f"ANALYZE {SCHEMA_ALIASES[db_type]}")
 
-        # Signals table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS signals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                signal_id TEXT UNIQUE NOT NULL,
-                symbol TEXT NOT NULL,
-                strategy TEXT NOT NULL,
-                action TEXT NOT NULL,
-                confidence REAL NOT NULL,
-                timestamp DATETIME NOT NULL,
-                metadata TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    def get_connection(self, db_type: str = "source_db"):
+        """Get database connection for specified type"""
+        db_path = self._db_paths.get(db_type)
+        if not db_path:
+            raise ValueError(
+                f"Database type {db_type} not configured for {self.mode.value}"
             )
-        """
-        )
 
-        # Data sync tracking
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sync_tracking (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                last_sync DATETIME NOT NULL,
-                sync_type TEXT NOT NULL,
-                status TEXT NOT NULL,
-                records_count INTEGER DEFAULT 0,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
 
-        # Create indexes
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_market_data_symbol_timestamp ON market_data(symbol, timestamp)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_signals_symbol_timestamp ON signals(symbol, timestamp)"
-        )
+        # Enable WAL mode for better concurrency
+        if self._reader_pragmas:
+            conn.executescript(self._reader_pragmas)
 
-    def _create_results_schema(self, cursor):
-        """Create results database schema"""
-        # Backtest results
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS backtest_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                backtest_id TEXT UNIQUE NOT NULL,
-                strategy TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                start_date DATE NOT NULL,
-                end_date DATE NOT NULL,
-                initial_capital REAL NOT NULL,
-                final_value REAL NOT NULL,
-                total_return_pct REAL NOT NULL,
-                sharpe_ratio REAL,
-                max_drawdown_pct REAL,
-                trades_count INTEGER NOT NULL,
-                win_rate_pct REAL,
-                metadata TEXT,
-                mode TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
+        return conn
 
-        # Paper trades
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS paper_trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                trade_id TEXT UNIQUE NOT NULL,
-                strategy TEXT NOT NULL,
-                symbol TEXT NOT NULL,
-                action TEXT NOT NULL,
-                quantity INTEGER NOT NULL,
-                price REAL,
-                timestamp DATETIME NOT NULL,
-                status TEXT NOT NULL,
-                pnl REAL,
-                mode TEXT NOT NULL,
-                metadata TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
+    def _get_writer(self) -> sqlite3.Connection:
+        """Get (or open) the hub writer connection.
 
-        # Performance metrics
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS performance_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                metrics_id TEXT UNIQUE NOT NULL,
-                period_start DATE NOT NULL,
-                period_end DATE NOT NULL,
-                strategy TEXT,
-                symbol TEXT,
-                metric_type TEXT NOT NULL,
-                metric_value REAL NOT NULL,
-                mode TEXT NOT NULL,
-                metadata TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
+        The source database is opened as ``main`` and the other databases are
+        ATTACHed under their SCHEMA_ALIASES name, so a batch of writes to
+        several of them needs only one BEGIN/COMMIT. Must be called with
+        ``self._writer_lock`` held.
+
+        In WAL mode SQLite commits each database file on its own: a crash
+        during COMMIT can leave a batch applied to some databases and not
+        others. The hub saves commits, it does not make them atomic.
         """
+        if self._hub is not None:
+            return self._hub
+
+        # isolation_level=None lets us issue BEGIN IMMEDIATE ourselves, so the
+        # write lock is taken up front instead of on the first write statement.
+        # BEGIN IMMEDIATE locks every attached database, not just the ones the
+        # batch writes to, so writers in other processes wait on any of them.
+        conn = sqlite3.connect(
+            self._db_paths["source_db"], isolation_level=None, check_same_thread=False
         )
+        for db_type, db_path in self._db_paths.items():
+            if db_type != "source_db":
+                conn.execute(
+                    f"ATTACH DATABASE ? AS {SCHEMA_ALIASES[db_type]}", (db_path,)
+                )
+        if self._writer_pragmas:
+            conn.executescript(self._writer_pragmas)
 
-        # Create indexes
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_backtest_strategy_symbol ON backtest_results(strategy, symbol)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_paper_trades_symbol_timestamp ON paper_trades(symbol, timestamp)"
-        )
+        self._hub = conn
+        return conn
 
-    def _create_analytics_schema(self, cursor):
-        """Create analytics database schema"""
-        # Analytics reports
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS analytics_reports (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                report_id TEXT UNIQUE NOT NULL,
-                report_type TEXT NOT NULL,
-                period_start DATE NOT NULL,
-                period_end DATE NOT NULL,
-                summary TEXT NOT NULL,
-                details TEXT,
-                mode TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block of writes in a single BEGIN IMMEDIATE transaction
 
-        # Risk metrics
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS risk_metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                metric_id TEXT UNIQUE NOT NULL,
-                symbol TEXT,
-                strategy TEXT,
-                risk_type TEXT NOT NULL,
-                risk_value REAL NOT NULL,
-                threshold_value REAL,
-                status TEXT NOT NULL,
-                timestamp DATETIME NOT NULL,
-                mode TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
+        The write lock is held on all of the hub's databases until COMMIT,
+        even if the block only writes to one of them.
         """
+        with self._writer_lock:
+            conn = self._get_writer()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                conn.commit()
+            except BaseException:
+                # Also covers a failed COMMIT, which leaves the transaction open
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+
+            self._commits_since_checkpoint += 1
+            if (
+                self._checkpoint_every
+                and self._commits_since_checkpoint >= self._checkpoint_every
+            ):
+                self._checkpoint_locked()
+
+    def _checkpoint_locked(self):
+        """Checkpoint the hub's databases; ``self._writer_lock`` must be held"""
+        if self._hub is not None:
+            try:
+                # With no schema name this checkpoints every attached database
+                self._hub.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                self.logger.warning(f"⚠️ Checkpoint failed: {e}")
+        self._commits_since_checkpoint = 0
+
+    def checkpoint(self):
+        """Fold the WAL back into the main database files and truncate it"""
+        with self._writer_lock:
+            self._checkpoint_locked()
+
+    def _schedule_checkpoint(self):
+        """Arm the background timer that periodically calls checkpoint()"""
+        if self._closed or not self._checkpoint_interval or not self._enable_wal:
+            return
+
+        self._checkpoint_timer = threading.Timer(
+            self._checkpoint_interval, _run_checkpoint, args=(weakref.ref(self),)
         )
+        self._checkpoint_timer.daemon = True
+        self._checkpoint_timer.start()
 
-        # Compliance audits
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS compliance_audits (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                audit_id TEXT UNIQUE NOT NULL,
-                audit_type TEXT NOT NULL,
-                status TEXT NOT NULL,
-                violations_count INTEGER DEFAULT 0,
-                details TEXT,
-                auditor TEXT,
-                mode TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
+    def _run_checkpoint(self):
+        """Timer callback: checkpoint, then re-arm the timer"""
+        try:
+            self.checkpoint()
+        finally:
+            self._schedule_checkpoint()
+
+    def close(self):
+        """Drain pending writes, stop background threads and close connections"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        _OPEN_MANAGERS.discard(self)
+        if self._checkpoint_timer is not None:
+            self._checkpoint_timer.cancel()
+
+        self._stop_writer()
+        self._writer_thread.join()
+
+        with self._writer_lock:
+            self._checkpoint_locked()
+            if self._hub is not None:
+                self._hub.close()
+                self._hub = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def flush(self):
+        """Block until every queued write has been committed"""
+        self._write_q.join()
+
+    def _enqueue(self, kind: str, payload: Any) -> bool:
+        """Queue a write for the writer thread; False once the manager is closed"""
+        with self._close_lock:
+            if self._closed:
+                self.logger.error(f"❌ Database manager is closed, {kind} not saved")
+                return False
+            self._write_q.put((kind, payload))
+        return True
+
+    def _write_queued(self, item: tuple[str, Any]) -> bool:
+        """Commit ``item`` and the writes queued behind it, on the writer thread
+
+        Up to ``writer_batch_size`` queued writes, whichever databases they
+        target, share one BEGIN/COMMIT on the hub connection (atomic per
+        database file only, see _get_writer).
+        Returns True if the ``None`` sentinel was reached.
         """
-        )
+        batch = [item]
+        stop = False
+        while len(batch) < self._writer_batch_size:
+            try:
+                item = self._write_q.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+                break
+            batch.append(item)
 
-    def get_connection(self, db_type: str = "source_db"):
-        """Get database connection for specified type"""
-        mode_config = self.config[self.mode.value]
-        db_path = mode_config.get(db_type)
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            # Keep the thread alive; otherwise later writes are never
+            # consumed and flush() blocks forever
+            self.logger.error(f"❌ Writer failed on a batch of {len(batch)}: {e}")
+        finally:
+            for _ in range(len(batch) + stop):
+                self._write_q.task_done()
 
-        if not db_path:
-            raise ValueError(
-                "Database type {db_type} not configured for {self.mode.value}"
-            )
+        return stop
 
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+    def _write_batch(self, batch: list[tuple[str, Any]]):
+        """Commit a batch of queued writes with a single BEGIN/COMMIT"""
+        try:
+            with self._write_transaction() as cursor:
+                counts = [
+                    self._apply_write(cursor, kind, payload) for kind, payload in batch
+                ]
+        except Exception as e:
+            # Retry one write per transaction so a single bad record does
+            # not take the rest of the batch down with it.
+            self.logger.warning(f"⚠️ Batch write failed ({e}), retrying individually")
+            counts = []
+            for kind, payload in batch:
+                try:
+                    with self._write_transaction() as cursor:
+                        counts.append(self._apply_write(cursor, kind, payload))
+                except Exception as e:
+                    self.logger.error(f"❌ Error saving {kind}: {e}")
+                    counts.append(None)
+
+        market_rows = 0
+        for (kind, payload), written in zip(batch, counts):
+            if written is not None:
+                self._log_write(kind, payload, written)
+                if kind == "market_data":
+                    market_rows += written
+
+        if self._analyze_after and market_rows >= self._analyze_after:
+            try:
+                self.analyze("source_db")
+            except sqlite3.Error as e:
+                self.logger.warning(f"⚠️ ANALYZE failed: {e}")
+
+    def _apply_write(self, cursor: sqlite3.Cursor, kind: str, payload: Any) -> int:
+        """Execute one queued write and return the number of rows changed"""
+        if kind == "market_data":
+            _, _, rows = payload
+            written = 0
+            for start in range(0, len(rows), MARKET_DATA_INSERT_CHUNK):
+                chunk = rows[start : start + MARKET_DATA_INSERT_CHUNK]
+                cursor.execute(
+                    _market_data_upsert_sql(len(chunk)),
+                    list(chain.from_iterable(chunk)),
+                )
+                written += cursor.rowcount
+            return written
 
-        # Enable WAL mode for better concurrency
-        if mode_config.get("enable_wal", False):
-            conn.execute("PRAGMA journal_mode=WAL")
+        if kind == "backtest_result":
+            cursor.execute(BACKTEST_RESULT_UPSERT, payload)
+            return cursor.rowcount
 
-        return conn
+        raise ValueError(f"Unknown write kind: {kind}")
+
+    def _log_write(self, kind: str, payload: Any, written: int):
+        """Log a committed write"""
+        if kind == "market_data":
+            symbol, source, rows = payload
+            self.logger.info(
+                f"💾 Saved {written} new/changed of {len(rows)} records for {symbol} from {source}"
+            )
+        elif kind == "backtest_result":
+            self.logger.info(
+                f"💾 Saved backtest result for {payload[1]} on {payload[2]}"
+            )
 
     def save_market_data(
         self, symbol: str, data: list[dict[str, Any]], source: str = "yfinance"
-    ):
-        """Save market data to source database"""
-        conn = self.get_connection("source_db")
-        cursor = conn.cursor()
+    ) -> bool:
+        """Queue market data for the source database writer
+
+        The write is asynchronous: this returns once the rows are queued and
+        the writer thread commits them later. Call flush() to wait until they
+        are committed, or close() when done. Write errors are logged by the
+        writer thread, not raised here.
 
+        Returns True if the rows were queued, False if they could not be
+        converted or the manager is closed.
+        """
         try:
-            for record in data:
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO market_data
-                    (symbol, timestamp, open, high, low, close, volume, source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        symbol,
-                        record["timestamp"],
-                        record["open"],
-                        record["high"],
-                        record["low"],
-                        record["close"],
-                        record["volume"],
-                        source,
-                    ),
+            rows = [
+                (
+                    symbol,
+                    record["timestamp"],
+                    record["open"],
+                    record["high"],
+                    record["low"],
+                    record["close"],
+                    record["volume"],
+                    source,
                 )
-
-            conn.commit()
-            self.logger.info("💾 Saved {len(data)} records for {symbol} from {source}")
+                for record in data
+            ]
+            return self._enqueue("market_data", (symbol, source, rows))
 
         except Exception as e:
-            self.logger.error("❌ Error saving market data: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
+            self.logger.error(f"❌ Error saving market data: {e}")
+            return False
 
-    def save_backtest_result(self, result: dict[str, Any]):
-        """Save backtest result to results database"""
-        conn = self.get_connection("results_db")
-        cursor = conn.cursor()
+    def save_backtest_result(self, result: dict[str, Any]) -> bool:
+        """Queue a backtest result for the results database writer
 
+        Asynchronous like save_market_data: call flush() to wait until it is
+        committed. Write errors are logged, not raised. Returns True if the
+        result was queued.
+        """
         try:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO backtest_results
-                (backtest_id, strategy, symbol, start_date, end_date, initial_capital,
-                 final_value, total_return_pct, sharpe_ratio, max_drawdown_pct,
-                 trades_count, win_rate_pct, metadata, mode)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    result.get(
-                        "backtest_id", "BT_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    ),
-                    result["strategy"],
-                    result["symbol"],
-                    result.get("start_date"),
-                    result.get("end_date"),
-                    result.get("initial_capital", 100000),
-                    result.get("final_value", 0),
-                    result.get("total_return_pct", 0),
-                    result.get("sharpe_ratio"),
-                    result.get("max_drawdown_pct"),
-                    result.get("trades", 0),
-                    result.get("win_rate", 0),
-                    json.dumps(result.get("metadata", {})),
-                    self.mode.value,
-                ),
-            )
-
-            conn.commit()
-            self.logger.info(
-                "💾 Saved backtest result for {result['strategy']} on {result['symbol']}"
+            params = (
+                result.get("backtest_id") or f"BT_{uuid4().hex[:16]}",
+                result["strategy"],
+                result["symbol"],
+                result.get("start_date"),
+                result.get("end_date"),
+                result.get("initial_capital", 100000),
+                result.get("final_value", 0),
+                result.get("total_return_pct", 0),
+                result.get("sharpe_ratio"),
+                result.get("max_drawdown_pct"),
+                result.get("trades", 0),
+                result.get("win_rate", 0),
+                encode_metadata(result.get("metadata")),
+                self.mode.value,
             )
+            return self._enqueue("backtest_result", params)
 
         except Exception as e:
-            self.logger.error("❌ Error saving backtest result: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
+            self.logger.error(f"❌ Error saving backtest result: {e}")
+            return False
 
     def get_recent_data(self, symbol: str, hours: int = 24) -> list[dict[str, Any]]:
         """Get recent market data for a symbol"""
@@ -401,9 +873,7 @@ class DatabaseManager:
             SELECT * FROM market_data
             WHERE symbol = ? AND timestamp >= datetime('now', '-{} hours')
             ORDER BY timestamp DESC
-        """.format(
-                hours
-            ),
+        """.format(hours),
             (symbol,),
         )
 
@@ -412,6 +882,62 @@ class DatabaseManager:
 
         return results
 
+    def get_backtest_results(
+        self, strategy: str | None = None, symbol: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get backtest results, optionally filtered by strategy and/or symbol
+
+        The metadata column is stored as a serialized BLOB and is returned
+        decoded to a dict.
+        """
+        conditions = []
+        params = []
+        if strategy is not None:
+            conditions.append("strategy = ?")
+            params.append(strategy)
+        if symbol is not None:
+            conditions.append("symbol = ?")
+            params.append(symbol)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        conn = self.get_connection("results_db")
+        try:
+            cursor = conn.execute(
+                f"SELECT * FROM backtest_results {where} "
+                "ORDER BY created_at DESC, id DESC",
+                params,
+            )
+            results = []
+            for row in cursor:
+                result = dict(row)
+                result["metadata"] = decode_metadata(result["metadata"])
+                results.append(result)
+            return results
+        finally:
+            conn.close()
+
+    def get_recent_data_arr(self, symbol: str, hours: int = 24) -> np.ndarray:
+        """Get recent OHLCV data for a symbol as a NumPy structured array
+
+        Skips the sqlite3.Row -> dict materialization of get_recent_data; rows
+        are plain tuples streamed straight into the array.
+        """
+        conn = self.get_connection("source_db")
+        conn.row_factory = None
+
+        try:
+            cursor = conn.execute(
+                """
+                SELECT timestamp, open, high, low, close, volume FROM market_data
+                WHERE symbol = ? AND timestamp >= datetime('now', ?)
+                ORDER BY timestamp DESC
+            """,
+                (symbol, f"-{int(hours)} hours"),
+            )
+            return np.fromiter(cursor, dtype=RECENT_DATA_DTYPE)
+        finally:
+            conn.close()
+
     def get_database_stats(self) -> dict[str, Any]:
         """Get database statistics for current mode"""
         stats = {
@@ -420,34 +946,35 @@ class DatabaseManager:
             "databases": {},
         }
 
-        mode_config = self.config[self.mode.value]
-
-        for db_type, db_path in mode_config.items():
-            if db_type.endswith("_db"):
-                try:
-                    conn = self.get_connection(db_type)
-                    cursor = conn.cursor()
-
-                    # Get table info
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = [row[0] for row in cursor.fetchall()]
+        for db_type, db_path in self._db_paths.items():
+            try:
+                conn = self.get_connection(db_type)
+                cursor = conn.cursor()
 
-                    table_stats = {}
-                    for table in tables:
-                        cursor.execute("SELECT COUNT(*) FROM {table}")
-                        count = cursor.fetchone()[0]
-                        table_stats[table] = count
-
-                    stats["databases"][db_type] = {
-                        "path": db_path,
-                        "tables": table_stats,
-                        "total_records": sum(table_stats.values()),
-                    }
+                # Get table info; internal tables (sqlite_sequence, and
+                # sqlite_stat1 from ANALYZE) are not data
+                cursor.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'"
+                )
+                tables = [row[0] for row in cursor.fetchall()]
+
+                table_stats = {}
+                for table in tables:
+                    cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+                    count = cursor.fetchone()[0]
+                    table_stats[table] = count
+
+                stats["databases"][db_type] = {
+                    "path": db_path,
+                    "tables": table_stats,
+                    "total_records": sum(table_stats.values()),
+                }
 
-                    conn.close()
+                conn.close()
 
-                except Exception as e:
-                    stats["databases"][db_type] = {"error": str(e)}
+            except Exception as e:
+                stats["databases"][db_type] = {"error": str(e)}
 
         return stats
 
@@ -493,9 +1020,11 @@ def create_test_data(mode: DatabaseMode = DatabaseMode.TESTING):
         }
         db_manager.save_backtest_result(test_result)
 
+    db_manager.flush()
     print("✅ Created test data for {mode.value} database")
     stats = db_manager.get_database_stats()
     print("📊 Database stats: {json.dumps(stats, indent=2)}")
+    db_manager.close()
 
 
 def main():
@@ -510,6 +1039,7 @@ def main():
         # Get stats
         stats = db_manager.get_database_stats()
         print("📊 {mode.value} stats: {json.dumps(stats, indent=2)}")
+        db_manager.close()
 
     # Create test data for testing mode
     print("\n🧪 Creating test data...")
@@ -17,378 +17,1062 @@ Author: AI Trading Machine
 Licensed by SJ Trading
 """
 
+import atexit
+import json
 import logging
 import os
-from datetime import date, datetime
+import queue
+import threading
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from io import BytesIO
 from typing import Any
 
-from google.cloud import bigquery, firestore
+import google.auth
+import pandas as pd
+from google.api_core import retry as api_retry
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import bigquery
+from requests.adapters import HTTPAdapter
+
+try:
+    from google.cloud import bigquery_storage_v1
+    from google.cloud.bigquery_storage_v1 import types as storage_types
+    from google.cloud.bigquery_storage_v1 import writer as storage_writer
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+    BQ_STORAGE_AVAILABLE = True
+except ImportError:
+    BQ_STORAGE_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from cachetools import TTLCache
+
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# BigQuery recommends ~500 rows per streaming insert request
+MAX_INSERT_BATCH = 500
+
+# Market data batches larger than this go through a load job instead of
+# streaming inserts; load jobs are capped at 1,500 per table per day.
+BULK_LOAD_THRESHOLD = 10_000
+MAX_LOAD_JOBS_PER_DAY = 1500
+
+# Shared HTTP connection pool for the BigQuery client, and the backoff
+# applied to streaming inserts on transient (429/5xx/connection) errors.
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 64
+INSERT_RETRY = api_retry.Retry(
+    predicate=api_retry.if_transient_error, initial=0.5, maximum=8.0, timeout=60.0
+)
+
+# Full batches waiting for a writer thread (~50k rows at the default batch
+# size); producers block once it is full.
+WRITE_QUEUE_MAXSIZE = 100
+
+# Short-lived cache of get_daily_performance results per date range
+QUERY_CACHE_SIZE = 128
+QUERY_CACHE_TTL_SECONDS = 60
+
+# Firestore caps a single batched write at 500 documents
+FIRESTORE_BATCH_LIMIT = 500
+
+# Trading Signals Table
+TRADING_SIGNALS_SCHEMA = (
+    bigquery.SchemaField("signal_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("signal_type", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("confidence", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("entry_price", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("target_price", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("stop_loss", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("quantity_suggestion", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("risk_reward_ratio", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("signal_time", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("strategy_name", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("reason", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("market_data", "JSON", mode="NULLABLE"),
+    bigquery.SchemaField(
+        "created_at",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        default_value_expression="CURRENT_TIMESTAMP()",
+    ),
+)
+
+# Paper Trades Table
+PAPER_TRADES_SCHEMA = (
+    bigquery.SchemaField("trade_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("signal_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("action", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("quantity", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("entry_price", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("target_price", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("stop_loss", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("entry_time", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("exit_time", "TIMESTAMP", mode="NULLABLE"),
+    bigquery.SchemaField("exit_price", "FLOAT", mode="NULLABLE"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("pnl", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("pnl_percent", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("trade_type", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("strategy_name", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("notes", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField(
+        "created_at",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        default_value_expression="CURRENT_TIMESTAMP()",
+    ),
+)
+
+# Manual Trades Table (for when user executes trades)
+MANUAL_TRADES_SCHEMA = (
+    bigquery.SchemaField("trade_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("signal_id", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("action", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("quantity", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("entry_price", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("target_price", "FLOAT", mode="NULLABLE"),
+    bigquery.SchemaField("stop_loss", "FLOAT", mode="NULLABLE"),
+    bigquery.SchemaField("entry_time", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("exit_time", "TIMESTAMP", mode="NULLABLE"),
+    bigquery.SchemaField("exit_price", "FLOAT", mode="NULLABLE"),
+    bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("pnl", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("pnl_percent", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("trade_type", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("broker_order_id", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("execution_notes", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField(
+        "created_at",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        default_value_expression="CURRENT_TIMESTAMP()",
+    ),
+)
+
+# Daily Performance Table
+DAILY_PERFORMANCE_SCHEMA = (
+    bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("total_signals", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("paper_trades_executed", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("manual_trades_suggested", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("manual_trades_executed", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("paper_total_pnl", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("paper_win_rate", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("paper_avg_win", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("paper_avg_loss", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("paper_profit_factor", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("manual_total_pnl", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("manual_win_rate", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("paper_portfolio_value", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("manual_portfolio_value", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField(
+        "created_at",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        default_value_expression="CURRENT_TIMESTAMP()",
+    ),
+)
+
+# Portfolio Snapshots Table
+PORTFOLIO_SNAPSHOTS_SCHEMA = (
+    bigquery.SchemaField("snapshot_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("time", "TIME", mode="REQUIRED"),
+    bigquery.SchemaField(
+        "portfolio_type", "STRING", mode="REQUIRED"
+    ),  # PAPER or MANUAL
+    bigquery.SchemaField("total_value", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("cash_value", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("positions_value", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("day_pnl", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("total_pnl", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("active_positions", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("positions_detail", "JSON", mode="NULLABLE"),
+    bigquery.SchemaField(
+        "created_at",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        default_value_expression="CURRENT_TIMESTAMP()",
+    ),
+)
+
+# Market Data Table
+MARKET_DATA_SCHEMA = (
+    bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("time", "TIME", mode="REQUIRED"),
+    bigquery.SchemaField("open", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("high", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("low", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("close", "FLOAT", mode="REQUIRED"),
+    bigquery.SchemaField("volume", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("interval", "STRING", mode="REQUIRED"),  # minute, day, etc.
+    bigquery.SchemaField(
+        "source", "STRING", mode="REQUIRED"
+    ),  # kiteconnect, yahoo, etc.
+    bigquery.SchemaField(
+        "created_at",
+        "TIMESTAMP",
+        mode="REQUIRED",
+        default_value_expression="CURRENT_TIMESTAMP()",
+    ),
+)
+
+TABLE_SCHEMAS = {
+    "trading_signals": TRADING_SIGNALS_SCHEMA,
+    "paper_trades": PAPER_TRADES_SCHEMA,
+    "manual_trades": MANUAL_TRADES_SCHEMA,
+    "daily_performance": DAILY_PERFORMANCE_SCHEMA,
+    "portfolio_snapshots": PORTFOLIO_SNAPSHOTS_SCHEMA,
+    "market_data": MARKET_DATA_SCHEMA,
+}
+
+# Daily per-(strategy, confidence) signal outcome aggregates. Sums and
+# counts (not averages/rates) are stored so any day window can be rolled up
+# exactly; BigQuery refreshes the view incrementally from the base tables.
+SIGNAL_PERFORMANCE_MV = "signal_performance_mv"
+SIGNAL_PERFORMANCE_MV_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{dataset}.signal_performance_mv`
+PARTITION BY signal_date
+CLUSTER BY strategy_name
+OPTIONS (enable_refresh = true, refresh_interval_minutes = 30)
+AS
+SELECT
+    DATE(s.created_at) AS signal_date,
+    s.strategy_name,
+    s.confidence,
+    COUNT(*) AS total_signals,
+    SUM(p.pnl) AS paper_pnl_sum,
+    COUNT(p.pnl) AS paper_pnl_count,
+    COUNTIF(p.pnl > 0) AS paper_wins,
+    SUM(m.pnl) AS manual_pnl_sum,
+    COUNT(m.pnl) AS manual_pnl_count,
+    COUNTIF(m.pnl > 0) AS manual_wins
+FROM `{dataset}.trading_signals` s
+LEFT JOIN `{dataset}.paper_trades` p
+    ON s.signal_id = p.signal_id
+LEFT JOIN `{dataset}.manual_trades` m
+    ON s.signal_id = m.signal_id
+GROUP BY signal_date, s.strategy_name, s.confidence
+"""
+
+# Day-partitioning column and clustering keys for the large tables.
+# market_data is partitioned by trading date so historical range queries
+# prune partitions; the rest by insertion time.
+PARTITION_FIELDS = {
+    "market_data": "date",
+    "trading_signals": "created_at",
+    "paper_trades": "created_at",
+    "manual_trades": "created_at",
+}
+CLUSTERING_FIELDS = {
+    "market_data": ["symbol", "date"],
+    "trading_signals": ["symbol", "strategy_name"],
+    "paper_trades": ["signal_id", "symbol"],
+    "manual_trades": ["signal_id", "symbol"],
+}
+
+# Proto field types used to encode each BigQuery column type for the
+# Storage Write API (TIMESTAMP as epoch micros, DATE as epoch days).
+_PROTO_FIELD_TYPES = (
+    {
+        "STRING": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+        "JSON": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+        "TIME": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+        "FLOAT": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+        "INTEGER": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+        "TIMESTAMP": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+        "DATE": descriptor_pb2.FieldDescriptorProto.TYPE_INT32,
+        "BOOLEAN": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    }
+    if BQ_STORAGE_AVAILABLE
+    else {}
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _schema_to_proto(table_name: str, schema: list[bigquery.SchemaField]):
+    """Build a proto2 DescriptorProto and message class for a table schema."""
+    descriptor = descriptor_pb2.DescriptorProto(name=f"{table_name}_row")
+    for number, field in enumerate(schema, start=1):
+        descriptor.field.add(
+            name=field.name,
+            number=number,
+            type=_PROTO_FIELD_TYPES[field.field_type],
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+        )
+
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f"{table_name}_row.proto", syntax="proto2"
+    )
+    file_proto.message_type.add().CopyFrom(descriptor)
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    message_cls = message_factory.GetMessageClass(
+        pool.FindMessageTypeByName(descriptor.name)
+    )
+    return descriptor, message_cls
+
+
+def _to_proto_value(field_type: str, value: Any) -> Any:
+    """Convert a JSON-insert style value to its Storage Write proto encoding."""
+    if field_type == "TIMESTAMP":
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH) // datetime.resolution
+    if field_type == "DATE":
+        if isinstance(value, str):
+            value = date.fromisoformat(value)
+        return (value - _EPOCH.date()).days
+    if field_type == "JSON" and not isinstance(value, str):
+        return json.dumps(value)
+    if field_type in ("STRING", "TIME"):
+        return str(value)
+    return value
+
+
+def _stamp_created_at(rows: list[dict[str, Any]]):
+    """Set created_at on rows that lack it, one timestamp for the batch.
+
+    The created_at column default only exists on tables created with this
+    schema; tables created earlier keep a REQUIRED column with no default.
+    """
+    created_at = datetime.now(timezone.utc).isoformat()
+    for row in rows:
+        row.setdefault("created_at", created_at)
+
+
+def _dataframe_to_rows(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to JSON-insert rows (ISO dates, NaN as None)."""
+    rows = df.astype(object).where(df.notna(), None).to_dict("records")
+    for row in rows:
+        for key, value in row.items():
+            if isinstance(value, (date, datetime)):
+                row[key] = value.isoformat()
+    return rows
+
 
 class DatabaseManager:
     """Manages BigQuery and Firestore operations."""
 
-    def __init__(self, project_id: str = None):
-        """Initialize database connections."""
+    def __init__(
+        self,
+        project_id: str = None,
+        max_batch: int = MAX_INSERT_BATCH,
+        flush_interval: float = 5.0,
+        use_storage_write: bool = True,
+        writer_threads: int = 2,
+    ):
+        """Initialize database connections.
+
+        Rows passed to the ``insert_*`` methods are buffered per table and
+        handed to background writer threads once ``max_batch`` rows are
+        pending, after ``flush_interval`` seconds, or when ``flush()`` is
+        called, so producers never wait on BigQuery. Each batch is committed
+        through a Storage Write API pending stream when the client library is
+        installed, else sent as legacy streaming inserts.
+        """
         self.project_id = project_id or os.getenv(
             "GOOGLE_CLOUD_PROJECT", "ai-trading-machine"
         )
-        self.bq_client = None
-        self.firestore_client = None
+        self._bq_client = None
+        self._firestore_client = None
+        self._firestore_bulk = None
         self.dataset_id = "trading_data"
+        self._dataset_path = f"{self.project_id}.{self.dataset_id}"
+        self._table_refs: dict[str, bigquery.TableReference] = {}
+
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+
+        self.writer_threads = writer_threads
+        self._write_q: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+        self._writers: list[threading.Thread] = []
+        # Failed batch count per table, consumed by flush()
+        self._failed_batches: Counter[str] = Counter()
+
+        self.use_storage_write = use_storage_write and BQ_STORAGE_AVAILABLE
+        self._storage_write_client = None
+        self._storage_read_client = None
+        self._storage_protos: dict[str, tuple] = {}
+
+        self._daily_perf_cache = (
+            TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL_SECONDS)
+            if CACHETOOLS_AVAILABLE
+            else None
+        )
+        self._daily_perf_lock = threading.Lock()
+
+        self._load_job_day: date | None = None
+        self._load_job_count_today = 0
+
+    @property
+    def bq_client(self) -> bigquery.Client:
+        """BigQuery client, constructed on first access.
+
+        The client shares one pooled, authorized HTTP session so TLS
+        connections are reused across calls.
+        """
+        if self._bq_client is None:
+            credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+            session = AuthorizedSession(credentials)
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                ),
+            )
+            self._bq_client = bigquery.Client(
+                project=self.project_id, credentials=credentials, _http=session
+            )
+        return self._bq_client
+
+    @bq_client.setter
+    def bq_client(self, client: bigquery.Client):
+        self._bq_client = client
+        self._table_refs.clear()
+
+    @property
+    def firestore_client(self):
+        """Firestore client, constructed on first access.
+
+        The firestore package is imported here so processes that only touch
+        BigQuery never load it.
+        """
+        if self._firestore_client is None:
+            from google.cloud import firestore
+
+            self._firestore_client = firestore.Client(project=self.project_id)
+        return self._firestore_client
+
+    @firestore_client.setter
+    def firestore_client(self, client):
+        self._firestore_client = client
+        self._firestore_bulk = None
 
     def initialize_bigquery(self):
-        """Initialize BigQuery client and create dataset/tables."""
+        """Create the BigQuery dataset/tables if missing."""
         try:
-            self.bq_client = bigquery.Client(project=self.project_id)
-
             # Create dataset if not exists
-            dataset_ref = self.bq_client.dataset(self.dataset_id)
-            try:
-                self.bq_client.get_dataset(dataset_ref)
-                logger.info("✅ BigQuery dataset {self.dataset_id} exists")
-            except Exception:
-                dataset = bigquery.Dataset(dataset_ref)
-                dataset.location = "US"
-                self.bq_client.create_dataset(dataset)
-                logger.info("✅ Created BigQuery dataset {self.dataset_id}")
+            dataset = bigquery.Dataset(self.bq_client.dataset(self.dataset_id))
+            dataset.location = "US"
+            self.bq_client.create_dataset(dataset, exists_ok=True, timeout=30)
+            logger.info("✅ BigQuery dataset %s ready", self.dataset_id)
 
             # Create tables
             self._create_bigquery_tables()
 
         except Exception as e:
-            logger.error("❌ BigQuery initialization failed: {e}")
+            logger.error("❌ BigQuery initialization failed: %s", e)
 
     def initialize_firestore(self):
-        """Initialize Firestore client."""
+        """Eagerly initialize the Firestore client (otherwise lazy)."""
         try:
-            self.firestore_client = firestore.Client(project=self.project_id)
+            _ = self.firestore_client
             logger.info("✅ Firestore client initialized")
         except Exception as e:
-            logger.error("❌ Firestore initialization failed: {e}")
+            logger.error("❌ Firestore initialization failed: %s", e)
 
     def _create_bigquery_tables(self):
         """Create BigQuery tables with proper schema."""
+        # Each check/create is an independent control-plane round-trip, so
+        # issue them in parallel and wait for all of them.
+        dataset_ref = self.bq_client.dataset(self.dataset_id)
+        self._table_refs.update(
+            {table_name: dataset_ref.table(table_name) for table_name in TABLE_SCHEMAS}
+        )
+        with ThreadPoolExecutor(max_workers=len(TABLE_SCHEMAS)) as executor:
+            wait(
+                [
+                    executor.submit(
+                        self._create_table_if_not_exists,
+                        table_name,
+                        schema,
+                        dataset_ref,
+                    )
+                    for table_name, schema in TABLE_SCHEMAS.items()
+                ]
+            )
 
-        # Trading Signals Table
-        signals_schema = [
-            bigquery.SchemaField("signal_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("signal_type", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("confidence", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("entry_price", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("target_price", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("stop_loss", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("quantity_suggestion", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("risk_reward_ratio", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("signal_time", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("strategy_name", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("reason", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("market_data", "JSON", mode="NULLABLE"),
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
-
-        # Paper Trades Table
-        paper_trades_schema = [
-            bigquery.SchemaField("trade_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("signal_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("action", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("quantity", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("entry_price", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("target_price", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("stop_loss", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("entry_time", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("exit_time", "TIMESTAMP", mode="NULLABLE"),
-            bigquery.SchemaField("exit_price", "FLOAT", mode="NULLABLE"),
-            bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("pnl", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("pnl_percent", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("trade_type", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("strategy_name", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("notes", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
+        self._create_signal_performance_view()
 
-        # Manual Trades Table (for when user executes trades)
-        manual_trades_schema = [
-            bigquery.SchemaField("trade_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("signal_id", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("action", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("quantity", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("entry_price", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("target_price", "FLOAT", mode="NULLABLE"),
-            bigquery.SchemaField("stop_loss", "FLOAT", mode="NULLABLE"),
-            bigquery.SchemaField("entry_time", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("exit_time", "TIMESTAMP", mode="NULLABLE"),
-            bigquery.SchemaField("exit_price", "FLOAT", mode="NULLABLE"),
-            bigquery.SchemaField("status", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("pnl", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("pnl_percent", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("trade_type", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("broker_order_id", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("execution_notes", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
+    def _create_signal_performance_view(self):
+        """Create the signal performance materialized view if it doesn't exist."""
+        try:
+            self.bq_client.query(
+                SIGNAL_PERFORMANCE_MV_DDL.format(dataset=self._dataset_path)
+            ).result()
+            logger.info("✅ Materialized view %s ready", SIGNAL_PERFORMANCE_MV)
+        except Exception as e:
+            logger.error(
+                "❌ Failed to create materialized view %s: %s",
+                SIGNAL_PERFORMANCE_MV,
+                e,
+            )
 
-        # Daily Performance Table
-        daily_performance_schema = [
-            bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
-            bigquery.SchemaField("total_signals", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("paper_trades_executed", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("manual_trades_suggested", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("manual_trades_executed", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("paper_total_pnl", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("paper_win_rate", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("paper_avg_win", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("paper_avg_loss", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("paper_profit_factor", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("manual_total_pnl", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("manual_win_rate", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("paper_portfolio_value", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("manual_portfolio_value", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
+    def _create_table_if_not_exists(
+        self,
+        table_name: str,
+        schema: tuple[bigquery.SchemaField, ...],
+        dataset_ref: bigquery.DatasetReference = None,
+    ):
+        """Create BigQuery table if it doesn't exist."""
+        try:
+            if dataset_ref is None:
+                table_ref = self._table_ref(table_name)
+            else:
+                table_ref = dataset_ref.table(table_name)
 
-        # Portfolio Snapshots Table
-        portfolio_snapshots_schema = [
-            bigquery.SchemaField("snapshot_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
-            bigquery.SchemaField("time", "TIME", mode="REQUIRED"),
-            bigquery.SchemaField(
-                "portfolio_type", "STRING", mode="REQUIRED"
-            ),  # PAPER or MANUAL
-            bigquery.SchemaField("total_value", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("cash_value", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("positions_value", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("day_pnl", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("total_pnl", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("active_positions", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField("positions_detail", "JSON", mode="NULLABLE"),
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
+            table = bigquery.Table(table_ref, schema=schema)
 
-        # Market Data Table
-        market_data_schema = [
-            bigquery.SchemaField("symbol", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
-            bigquery.SchemaField("time", "TIME", mode="REQUIRED"),
-            bigquery.SchemaField("open", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("high", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("low", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("close", "FLOAT", mode="REQUIRED"),
-            bigquery.SchemaField("volume", "INTEGER", mode="REQUIRED"),
-            bigquery.SchemaField(
-                "interval", "STRING", mode="REQUIRED"
-            ),  # minute, day, etc.
-            bigquery.SchemaField(
-                "source", "STRING", mode="REQUIRED"
-            ),  # kiteconnect, yahoo, etc.
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
+            # Set partitioning and clustering for large tables
+            if table_name in PARTITION_FIELDS:
+                table.time_partitioning = bigquery.TimePartitioning(
+                    type_=bigquery.TimePartitioningType.DAY,
+                    field=PARTITION_FIELDS[table_name],
+                )
+                table.clustering_fields = CLUSTERING_FIELDS[table_name]
 
-        # Create tables
-        tables = {
-            "trading_signals": signals_schema,
-            "paper_trades": paper_trades_schema,
-            "manual_trades": manual_trades_schema,
-            "daily_performance": daily_performance_schema,
-            "portfolio_snapshots": portfolio_snapshots_schema,
-            "market_data": market_data_schema,
-        }
+            self.bq_client.create_table(table, exists_ok=True)
+            logger.info("✅ Table %s ready", table_name)
 
-        for table_name, schema in tables.items():
-            self._create_table_if_not_exists(table_name, schema)
+        except Exception as e:
+            logger.error("❌ Failed to create table %s: %s", table_name, e)
 
-    def _create_table_if_not_exists(
-        self, table_name: str, schema: list[bigquery.SchemaField]
-    ):
-        """Create BigQuery table if it doesn't exist."""
-        try:
+    def _table_ref(self, table_name: str) -> bigquery.TableReference:
+        """Cached TableReference for a table in the trading dataset."""
+        table_ref = self._table_refs.get(table_name)
+        if table_ref is None:
             table_ref = self.bq_client.dataset(self.dataset_id).table(table_name)
-
+            self._table_refs[table_name] = table_ref
+        return table_ref
+
+    # Insert Buffering
+
+    def _buffer_rows(self, table_name: str, rows: list[dict[str, Any]]):
+        """Buffer rows for ``table_name``; queue them at ``max_batch`` rows.
+
+        The rows are copied, so callers may reuse or mutate their dicts once
+        an ``insert_*`` call returns, and the writer threads only ever touch
+        the copies.
+        """
+        rows = [dict(row) for row in rows]
+        with self._pending_lock:
+            pending = self._pending.setdefault(table_name, [])
+            pending.extend(rows)
+            if len(pending) >= self.max_batch:
+                batch = self._pending.pop(table_name)
+            else:
+                batch = None
+                if self._flush_timer is None and self.flush_interval:
+                    self._flush_timer = threading.Timer(
+                        self.flush_interval, self._timed_flush
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+
+        if batch:
+            self._enqueue_batch(table_name, batch)
+
+    def _enqueue_batch(self, table_name: str, rows: list[dict[str, Any]]):
+        """Hand a batch to the writer threads, starting them on first use."""
+        if not self._writers:
+            with self._pending_lock:
+                if not self._writers:
+                    self._start_writers()
+        self._write_q.put((table_name, rows))
+
+    def _start_writers(self):
+        for i in range(self.writer_threads):
+            thread = threading.Thread(
+                target=self._writer_loop, name=f"bq-writer-{i}", daemon=True
+            )
+            thread.start()
+            self._writers.append(thread)
+        atexit.register(self.close)
+
+    def _writer_loop(self):
+        """Write queued batches until a ``None`` sentinel arrives."""
+        while True:
+            item = self._write_q.get()
             try:
-                self.bq_client.get_table(table_ref)
-                logger.info("✅ Table {table_name} exists")
-            except Exception:
-                table = bigquery.Table(table_ref, schema=schema)
-
-                # Set partitioning for large tables
-                if table_name in [
-                    "market_data",
-                    "trading_signals",
-                    "paper_trades",
-                    "manual_trades",
-                ]:
-                    table.time_partitioning = bigquery.TimePartitioning(
-                        type_=bigquery.TimePartitioningType.DAY, field="created_at"
+                if item is None:
+                    return
+                table_name, rows = item
+                try:
+                    errors = self._write_rows(table_name, rows)
+                    if errors:
+                        logger.error(
+                            "❌ Error inserting into %s: %s", table_name, errors
+                        )
+                except Exception as e:
+                    errors = True
+                    logger.error("❌ Failed to flush %s: %s", table_name, e)
+                if errors:
+                    with self._pending_lock:
+                        self._failed_batches[table_name] += 1
+            finally:
+                self._write_q.task_done()
+
+    def _write_rows(self, table_name: str, rows: list[dict[str, Any]]) -> list:
+        """Write one batch in MAX_INSERT_BATCH chunks; return insert errors."""
+        _stamp_created_at(rows)
+        if self.use_storage_write:
+            errors = self._append_rows_pending(table_name, rows)
+        else:
+            table_ref = self._table_ref(table_name)
+            errors = []
+            for i in range(0, len(rows), MAX_INSERT_BATCH):
+                errors.extend(
+                    self.bq_client.insert_rows_json(
+                        table_ref, rows[i : i + MAX_INSERT_BATCH], retry=INSERT_RETRY
                     )
+                )
+
+        if not errors:
+            logger.info("✅ Inserted %d rows into %s", len(rows), table_name)
+        return errors
+
+    def _storage_proto(self, table_name: str) -> tuple:
+        """Cached (ProtoSchema, message class, schema) for a table."""
+        if table_name not in self._storage_protos:
+            schema = self.bq_client.get_table(self._table_ref(table_name)).schema
+            descriptor, message_cls = _schema_to_proto(table_name, schema)
+            self._storage_protos[table_name] = (
+                storage_types.ProtoSchema(proto_descriptor=descriptor),
+                message_cls,
+                schema,
+            )
+        return self._storage_protos[table_name]
+
+    def _append_rows_pending(self, table_name: str, rows: list[dict[str, Any]]) -> list:
+        """Write rows through a Storage Write API pending stream.
+
+        Rows only become visible when the stream is committed, so each
+        flush lands atomically (all rows or none).
+        """
+        if self._storage_write_client is None:
+            self._storage_write_client = bigquery_storage_v1.BigQueryWriteClient()
+        client = self._storage_write_client
+
+        proto_schema, message_cls, schema = self._storage_proto(table_name)
+        field_types = {field.name: field.field_type for field in schema}
+
+        parent = client.table_path(self.project_id, self.dataset_id, table_name)
+        stream = client.create_write_stream(
+            parent=parent,
+            write_stream=storage_types.WriteStream(
+                type_=storage_types.WriteStream.Type.PENDING
+            ),
+        )
 
-                self.bq_client.create_table(table)
-                logger.info("✅ Created table {table_name}")
+        template = storage_types.AppendRowsRequest(
+            write_stream=stream.name,
+            proto_rows=storage_types.AppendRowsRequest.ProtoData(
+                writer_schema=proto_schema
+            ),
+            default_missing_value_interpretation=(
+                storage_types.AppendRowsRequest.MissingValueInterpretation.DEFAULT_VALUE
+            ),
+        )
+        append_stream = storage_writer.AppendRowsStream(client, template)
+        try:
+            futures = []
+            for offset in range(0, len(rows), MAX_INSERT_BATCH):
+                serialized = [
+                    message_cls(
+                        **{
+                            key: _to_proto_value(field_types[key], value)
+                            for key, value in row.items()
+                            if value is not None and key in field_types
+                        }
+                    ).SerializeToString()
+                    for row in rows[offset : offset + MAX_INSERT_BATCH]
+                ]
+                request = storage_types.AppendRowsRequest(
+                    offset=offset,
+                    proto_rows=storage_types.AppendRowsRequest.ProtoData(
+                        rows=storage_types.ProtoRows(serialized_rows=serialized)
+                    ),
+                )
+                futures.append(append_stream.send(request))
+            for future in futures:
+                future.result()
+        finally:
+            append_stream.close()
+
+        client.finalize_write_stream(name=stream.name)
+        commit = client.batch_commit_write_streams(
+            storage_types.BatchCommitWriteStreamsRequest(
+                parent=parent, write_streams=[stream.name]
+            )
+        )
+        return [
+            {"code": error.code, "entity": error.entity, "message": error.error_message}
+            for error in commit.stream_errors
+        ]
 
-        except Exception as e:
-            logger.error("❌ Failed to create table {table_name}: {e}")
+    def _dispatch_pending(self, table: str = None):
+        """Queue the buffered rows of one table, or of all tables."""
+        with self._pending_lock:
+            tables = [table] if table else list(self._pending)
+            if table is None and self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batches = [(name, self._pending.pop(name, [])) for name in tables]
+
+        for table_name, rows in batches:
+            if rows:
+                self._enqueue_batch(table_name, rows)
+
+    def flush(self, table: str = None) -> bool:
+        """Write buffered rows to BigQuery and wait for the writers to finish.
+
+        ``table`` limits which buffer is queued and whose failures are
+        reported; batches already queued for other tables are waited on as
+        well, but their failures are left for a flush of those tables.
+        Returns True if no batch of ``table`` (or of any table, when None)
+        failed since its failures were last reported.
+        """
+        self._dispatch_pending(table)
+        self._write_q.join()
+        with self._pending_lock:
+            if table is None:
+                failed = sum(self._failed_batches.values())
+                self._failed_batches.clear()
+            else:
+                failed = self._failed_batches.pop(table, 0)
+        return failed == 0
+
+    def close(self):
+        """Flush buffered rows and stop the writer threads."""
+        self.flush()
+        writers, self._writers = self._writers, []
+        for _ in writers:
+            self._write_q.put(None)
+        for thread in writers:
+            thread.join()
+        if writers:
+            atexit.unregister(self.close)
+
+    def _timed_flush(self):
+        """Timer callback queuing whatever is buffered."""
+        with self._pending_lock:
+            self._flush_timer = None
+        self._dispatch_pending()
+
+    @contextmanager
+    def batch(self):
+        """Buffer inserts made inside the block and flush them on exit."""
+        try:
+            yield self
+        finally:
+            self.flush()
 
     # BigQuery Insert Methods
 
     def insert_trading_signal(self, signal_data: dict[str, Any]) -> bool:
-        """Insert trading signal into BigQuery."""
-        try:
-            table_ref = self.bq_client.dataset(self.dataset_id).table("trading_signals")
-
-            # Add metadata
-            signal_data["created_at"] = datetime.utcnow().isoformat()
+        """Buffer a trading signal for insertion into BigQuery.
 
-            errors = self.bq_client.insert_rows_json(table_ref, [signal_data])
-
-            if errors:
-                logger.error("❌ Error inserting signal: {errors}")
-                return False
+        Returns True once the signal is buffered, not once BigQuery has
+        accepted it. A rejected batch is only logged; call
+        ``flush("trading_signals")`` to learn whether it was written.
+        """
+        try:
+            self._buffer_rows("trading_signals", [signal_data])
 
-            logger.info("✅ Signal inserted: {signal_data.get('symbol', 'Unknown')}")
+            logger.debug("✅ Signal buffered: %s", signal_data.get("symbol", "Unknown"))
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to insert signal: {e}")
+            logger.error("❌ Failed to insert signal: %s", e)
             return False
 
     def insert_paper_trade(self, trade_data: dict[str, Any]) -> bool:
-        """Insert paper trade into BigQuery."""
-        try:
-            table_ref = self.bq_client.dataset(self.dataset_id).table("paper_trades")
-
-            # Add metadata
-            trade_data["created_at"] = datetime.utcnow().isoformat()
-
-            errors = self.bq_client.insert_rows_json(table_ref, [trade_data])
+        """Buffer a paper trade for insertion into BigQuery.
 
-            if errors:
-                logger.error("❌ Error inserting paper trade: {errors}")
-                return False
+        Returns True once the trade is buffered, not once BigQuery has
+        accepted it. A rejected batch is only logged; call
+        ``flush("paper_trades")`` to learn whether it was written.
+        """
+        try:
+            self._buffer_rows("paper_trades", [trade_data])
 
-            logger.info(
-                "✅ Paper trade inserted: {trade_data.get('symbol', 'Unknown')}"
+            logger.debug(
+                "✅ Paper trade buffered: %s", trade_data.get("symbol", "Unknown")
             )
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to insert paper trade: {e}")
+            logger.error("❌ Failed to insert paper trade: %s", e)
             return False
 
     def insert_manual_trade(self, trade_data: dict[str, Any]) -> bool:
-        """Insert manual trade into BigQuery."""
-        try:
-            table_ref = self.bq_client.dataset(self.dataset_id).table("manual_trades")
-
-            # Add metadata
-            trade_data["created_at"] = datetime.utcnow().isoformat()
-
-            errors = self.bq_client.insert_rows_json(table_ref, [trade_data])
+        """Buffer a manual trade for insertion into BigQuery.
 
-            if errors:
-                logger.error("❌ Error inserting manual trade: {errors}")
-                return False
+        Returns True once the trade is buffered, not once BigQuery has
+        accepted it. A rejected batch is only logged; call
+        ``flush("manual_trades")`` to learn whether it was written.
+        """
+        try:
+            self._buffer_rows("manual_trades", [trade_data])
 
-            logger.info(
-                "✅ Manual trade inserted: {trade_data.get('symbol', 'Unknown')}"
+            logger.debug(
+                "✅ Manual trade buffered: %s", trade_data.get("symbol", "Unknown")
             )
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to insert manual trade: {e}")
+            logger.error("❌ Failed to insert manual trade: %s", e)
             return False
 
     def insert_daily_performance(self, performance_data: dict[str, Any]) -> bool:
-        """Insert daily performance into BigQuery."""
+        """Buffer daily performance for insertion into BigQuery.
+
+        Returns True once the row is buffered, not once BigQuery has
+        accepted it. A rejected batch is only logged; call
+        ``flush("daily_performance")`` to learn whether it was written.
+        """
         try:
-            table_ref = self.bq_client.dataset(self.dataset_id).table(
-                "daily_performance"
+            self._buffer_rows("daily_performance", [performance_data])
+
+            logger.debug(
+                "✅ Daily performance buffered: %s",
+                performance_data.get("date", "Unknown"),
             )
+            return True
 
-            # Add metadata
-            performance_data["created_at"] = datetime.utcnow().isoformat()
+        except Exception as e:
+            logger.error("❌ Failed to insert daily performance: %s", e)
+            return False
 
-            errors = self.bq_client.insert_rows_json(table_ref, [performance_data])
+    def insert_portfolio_snapshot(self, snapshot_data: dict[str, Any]) -> bool:
+        """Buffer a portfolio snapshot for insertion into BigQuery.
 
-            if errors:
-                logger.error("❌ Error inserting daily performance: {errors}")
-                return False
+        Returns True once the snapshot is buffered, not once BigQuery has
+        accepted it. A rejected batch is only logged; call
+        ``flush("portfolio_snapshots")`` to learn whether it was written.
+        """
+        try:
+            self._buffer_rows("portfolio_snapshots", [snapshot_data])
 
-            logger.info(
-                "✅ Daily performance inserted: {performance_data.get('date', 'Unknown')}"
-            )
+            logger.debug("✅ Portfolio snapshot buffered")
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to insert daily performance: {e}")
+            logger.error("❌ Failed to insert portfolio snapshot: %s", e)
             return False
 
-    def insert_portfolio_snapshot(self, snapshot_data: dict[str, Any]) -> bool:
-        """Insert portfolio snapshot into BigQuery."""
+    def insert_market_data(self, market_data: list[dict[str, Any]]) -> bool:
+        """Buffer market data for insertion into BigQuery.
+
+        Returns True once the data is buffered, not once BigQuery has
+        accepted it. A rejected batch is only logged; call
+        ``flush("market_data")`` to learn whether it was written.
+        """
         try:
-            table_ref = self.bq_client.dataset(self.dataset_id).table(
-                "portfolio_snapshots"
-            )
+            self._buffer_rows("market_data", market_data)
 
-            # Add metadata
-            snapshot_data["created_at"] = datetime.utcnow().isoformat()
+            logger.debug("✅ Market data buffered: %d records", len(market_data))
+            return True
 
-            errors = self.bq_client.insert_rows_json(table_ref, [snapshot_data])
+        except Exception as e:
+            logger.error("❌ Failed to insert market data: %s", e)
+            return False
 
-            if errors:
-                logger.error("❌ Error inserting portfolio snapshot: {errors}")
+    def _reserve_load_job(self) -> bool:
+        """Count a load job against today's (UTC) quota; False if exhausted."""
+        today = datetime.utcnow().date()
+        with self._pending_lock:
+            if self._load_job_day != today:
+                self._load_job_day = today
+                self._load_job_count_today = 0
+            if self._load_job_count_today >= MAX_LOAD_JOBS_PER_DAY:
                 return False
+            self._load_job_count_today += 1
+            return True
+
+    def insert_market_data_bulk(
+        self,
+        records: list[dict[str, Any]] | pd.DataFrame,
+        use_load_job: bool = True,
+    ) -> bool:
+        """Insert a large batch of market data into BigQuery.
+
+        Batches above BULK_LOAD_THRESHOLD are written with a load job, which
+        is much faster than streaming and costs no streaming quota. Smaller
+        batches, or any batch once today's load-job budget is used up, fall
+        back to the streaming path and are flushed immediately, so unlike
+        ``insert_market_data`` the return value reflects whether BigQuery
+        accepted the rows.
+
+        A DataFrame is loaded via Arrow, without iterating rows in Python.
+        """
+        if (
+            not use_load_job
+            or len(records) <= BULK_LOAD_THRESHOLD
+            or not self._reserve_load_job()
+        ):
+            if isinstance(records, pd.DataFrame):
+                records = _dataframe_to_rows(records)
+            inserted = self.insert_market_data(records)
+            return self.flush("market_data") and inserted
 
-            logger.info("✅ Portfolio snapshot inserted")
+        try:
+            job_config = bigquery.LoadJobConfig(
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                schema=MARKET_DATA_SCHEMA,
+            )
+            if isinstance(records, pd.DataFrame):
+                # The client checks the frame against the job schema, so
+                # created_at is broadcast here rather than left to the default.
+                job = self.bq_client.load_table_from_dataframe(
+                    records.assign(created_at=datetime.now(timezone.utc)),
+                    self._table_ref("market_data"),
+                    job_config=job_config,
+                )
+            else:
+                # Stamp copies rather than the caller's dicts
+                records = [dict(record) for record in records]
+                _stamp_created_at(records)
+                job = self.bq_client.load_table_from_json(
+                    records, self._table_ref("market_data"), job_config=job_config
+                )
+            job.result()  # Wait for job to complete
+
+            logger.info("✅ Market data loaded: %d records", len(records))
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to insert portfolio snapshot: {e}")
+            logger.error("❌ Failed to load market data: %s", e)
             return False
 
-    def insert_market_data(self, market_data: list[dict[str, Any]]) -> bool:
-        """Insert market data into BigQuery."""
-        try:
-            table_ref = self.bq_client.dataset(self.dataset_id).table("market_data")
-
-            # Add metadata to each record
-            for record in market_data:
-                record["created_at"] = datetime.utcnow().isoformat()
+    def bulk_load_market_data_via_gcs(self, df: pd.DataFrame, bucket: str) -> bool:
+        """Backfill market data by staging it as Parquet in GCS.
 
-            errors = self.bq_client.insert_rows_json(table_ref, market_data)
+        The frame is written as a Snappy-compressed Parquet object under
+        ``stage/`` in ``bucket``, appended with a Parquet load job, and the
+        staged object is deleted afterwards.
+        """
+        from google.cloud import storage
 
-            if errors:
-                logger.error("❌ Error inserting market data: {errors}")
-                return False
+        blob = (
+            storage.Client(project=self.project_id)
+            .bucket(bucket)
+            .blob(f"stage/market_data_{uuid.uuid4().hex}.parquet")
+        )
+        try:
+            if "created_at" not in df.columns:
+                df = df.assign(created_at=datetime.now(timezone.utc))
+            buffer = BytesIO()
+            df.to_parquet(buffer, index=False, compression="snappy")
+            buffer.seek(0)
+            blob.upload_from_file(buffer, content_type="application/octet-stream")
+
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            )
+            job = self.bq_client.load_table_from_uri(
+                f"gs://{bucket}/{blob.name}",
+                self._table_ref("market_data"),
+                job_config=job_config,
+            )
+            job.result()  # Wait for job to complete
 
-            logger.info("✅ Market data inserted: {len(market_data)} records")
+            logger.info("✅ Market data loaded from GCS: %d records", len(df))
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to insert market data: {e}")
+            logger.error("❌ Failed to load market data from GCS: %s", e)
             return False
 
+        finally:
+            try:
+                blob.delete()
+            except Exception:
+                pass
+
     # Firestore Methods (for real-time data)
 
     def save_live_signal_to_firestore(self, signal_data: dict[str, Any]) -> bool:
-        """Save live signal to Firestore for real-time updates."""
+        """Queue a live signal on the Firestore BulkWriter.
+
+        Writes are pipelined in the background; call ``flush_firestore()``
+        to wait until they have been sent.
+        """
         try:
             doc_ref = self.firestore_client.collection("live_signals").document(
                 signal_data["signal_id"]
             )
-            doc_ref.set(signal_data)
+            if self._firestore_bulk is None:
+                self._firestore_bulk = self.firestore_client.bulk_writer()
+            self._firestore_bulk.set(doc_ref, signal_data)
 
-            logger.info(
-                "✅ Live signal saved to Firestore: {signal_data.get('symbol', 'Unknown')}"
+            logger.debug(
+                "✅ Live signal queued for Firestore: %s",
+                signal_data.get("symbol", "Unknown"),
             )
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to save live signal: {e}")
+            logger.error("❌ Failed to save live signal: %s", e)
+            return False
+
+    def save_live_signals(self, signals: list[dict[str, Any]]) -> bool:
+        """Save many live signals with batched commits of up to 500 docs."""
+        try:
+            collection = self.firestore_client.collection("live_signals")
+            for i in range(0, len(signals), FIRESTORE_BATCH_LIMIT):
+                batch = self.firestore_client.batch()
+                for signal_data in signals[i : i + FIRESTORE_BATCH_LIMIT]:
+                    batch.set(
+                        collection.document(signal_data["signal_id"]), signal_data
+                    )
+                batch.commit()
+
+            logger.info("✅ Live signals saved to Firestore: %d", len(signals))
+            return True
+
+        except Exception as e:
+            logger.error("❌ Failed to save live signals: %s", e)
+            return False
+
+    def flush_firestore(self) -> bool:
+        """Send all writes queued on the Firestore BulkWriter."""
+        if self._firestore_bulk is None:
+            return True
+        try:
+            self._firestore_bulk.flush()
+            return True
+        except Exception as e:
+            logger.error("❌ Failed to flush Firestore writes: %s", e)
             return False
 
     def save_portfolio_status_to_firestore(
@@ -405,92 +1089,139 @@ class DatabaseManager:
             return True
 
         except Exception as e:
-            logger.error("❌ Failed to save portfolio status: {e}")
+            logger.error("❌ Failed to save portfolio status: %s", e)
             return False
 
     # Query Methods
 
+    def _query_rows(self, query_job) -> list[dict[str, Any]]:
+        """Fetch query results as a list of dicts.
+
+        Results are downloaded as Arrow record batches over the Storage Read
+        API when available, instead of paging through REST JSON rows.
+        """
+        if not PYARROW_AVAILABLE:
+            return [dict(row) for row in query_job.result()]
+
+        if BQ_STORAGE_AVAILABLE and self._storage_read_client is None:
+            self._storage_read_client = bigquery_storage_v1.BigQueryReadClient()
+        return query_job.to_arrow(
+            bqstorage_client=self._storage_read_client
+        ).to_pylist()
+
     def get_daily_performance(
         self, start_date: date, end_date: date
     ) -> list[dict[str, Any]]:
-        """Get daily performance data from BigQuery."""
+        """Get daily performance data from BigQuery.
+
+        Results are kept for QUERY_CACHE_TTL_SECONDS per date range, so
+        repeated dashboard requests don't rerun the query.
+        """
+        key = (start_date, end_date)
+        if self._daily_perf_cache is not None:
+            with self._daily_perf_lock:
+                cached = self._daily_perf_cache.get(key)
+            if cached is not None:
+                # Copy the rows too, so callers can't mutate the cached ones
+                return [dict(row) for row in cached]
+
         try:
-            query = """
+            query = f"""
             SELECT *
-            FROM `{self.project_id}.{self.dataset_id}.daily_performance`
-            WHERE date BETWEEN '{start_date}' AND '{end_date}'
+            FROM `{self._dataset_path}.daily_performance`
+            WHERE date BETWEEN @start_date AND @end_date
             ORDER BY date DESC
             """
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+                    bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+                ],
+                use_query_cache=True,
+            )
 
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
+            query_job = self.bq_client.query(query, job_config=job_config)
+            rows = self._query_rows(query_job)
 
-            return [dict(row) for row in results]
+            if self._daily_perf_cache is not None:
+                with self._daily_perf_lock:
+                    self._daily_perf_cache[key] = rows
+            return [dict(row) for row in rows]
 
         except Exception as e:
-            logger.error("❌ Failed to get daily performance: {e}")
+            logger.error("❌ Failed to get daily performance: %s", e)
             return []
 
     def get_signal_performance(self, days: int = 30) -> list[dict[str, Any]]:
-        """Get signal performance analysis."""
+        """Get signal performance analysis from the materialized view."""
         try:
-            query = """
-            WITH signal_trades AS (
-                SELECT
-                    s.signal_id,
-                    s.symbol,
-                    s.signal_type,
-                    s.confidence,
-                    s.strategy_name,
-                    p.pnl as paper_pnl,
-                    p.pnl_percent as paper_pnl_percent,
-                    m.pnl as manual_pnl,
-                    m.pnl_percent as manual_pnl_percent
-                FROM `{self.project_id}.{self.dataset_id}.trading_signals` s
-                LEFT JOIN `{self.project_id}.{self.dataset_id}.paper_trades` p
-                    ON s.signal_id = p.signal_id
-                LEFT JOIN `{self.project_id}.{self.dataset_id}.manual_trades` m
-                    ON s.signal_id = m.signal_id
-                WHERE s.created_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {days} DAY)
-            )
+            query = f"""
             SELECT
                 strategy_name,
                 confidence,
-                COUNT(*) as total_signals,
-                AVG(paper_pnl) as avg_paper_pnl,
-                AVG(manual_pnl) as avg_manual_pnl,
-                COUNTIF(paper_pnl > 0) / COUNT(paper_pnl) * 100 as paper_win_rate,
-                COUNTIF(manual_pnl > 0) / COUNT(manual_pnl) * 100 as manual_win_rate
-            FROM signal_trades
+                SUM(total_signals) as total_signals,
+                SAFE_DIVIDE(SUM(paper_pnl_sum), SUM(paper_pnl_count)) as avg_paper_pnl,
+                SAFE_DIVIDE(SUM(manual_pnl_sum), SUM(manual_pnl_count)) as avg_manual_pnl,
+                SAFE_DIVIDE(SUM(paper_wins), SUM(paper_pnl_count)) * 100 as paper_win_rate,
+                SAFE_DIVIDE(SUM(manual_wins), SUM(manual_pnl_count)) * 100 as manual_win_rate
+            FROM `{self._dataset_path}.{SIGNAL_PERFORMANCE_MV}`
+            WHERE signal_date >= DATE_SUB(CURRENT_DATE(), INTERVAL @days DAY)
             GROUP BY strategy_name, confidence
             ORDER BY total_signals DESC
             """
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("days", "INT64", days),
+                ],
+                use_query_cache=True,
+            )
 
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
-
-            return [dict(row) for row in results]
+            query_job = self.bq_client.query(query, job_config=job_config)
+            return self._query_rows(query_job)
 
         except Exception as e:
-            logger.error("❌ Failed to get signal performance: {e}")
+            logger.error("❌ Failed to get signal performance: %s", e)
             return []
 
-    def cleanup_old_data(self, days_to_keep: int = 90):
-        """Cleanup old data beyond retention period."""
+    def cleanup_old_data(self, days_to_keep: int = 90, by_trading_date: bool = False):
+        """Cleanup old data beyond retention period.
+
+        By default rows are kept for ``days_to_keep`` days after they were
+        inserted, so backfilled history survives. With ``by_trading_date``
+        rows are instead dropped once their trading date is that old; this
+        filters on the partitioning column, so BigQuery prunes partitions
+        instead of scanning the whole table.
+        """
         try:
             # Clean up old market data (keep only last 90 days)
-            cleanup_query = """
-            DELETE FROM `{self.project_id}.{self.dataset_id}.market_data`
-            WHERE created_at < TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {days_to_keep} DAY)
+            if by_trading_date:
+                condition = (
+                    "date < DATE_SUB(CURRENT_DATE(), INTERVAL @days_to_keep DAY)"
+                )
+            else:
+                condition = (
+                    "created_at < "
+                    "TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days_to_keep DAY)"
+                )
+            cleanup_query = f"""
+            DELETE FROM `{self._dataset_path}.market_data`
+            WHERE {condition}
             """
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter(
+                        "days_to_keep", "INT64", days_to_keep
+                    ),
+                ],
+            )
 
-            query_job = self.bq_client.query(cleanup_query)
+            query_job = self.bq_client.query(cleanup_query, job_config=job_config)
             query_job.result()
 
-            logger.info("✅ Cleaned up market data older than {days_to_keep} days")
+            logger.info("✅ Cleaned up market data older than %s days", days_to_keep)
 
         except Exception as e:
-            logger.error("❌ Failed to cleanup old data: {e}")
+            logger.error("❌ Failed to cleanup old data: %s", e)
 
 
 # Example usage and setup script
@@ -504,9 +1235,6 @@ def setup_database():
     print("📊 Initializing BigQuery...")
     db_manager.initialize_bigquery()
 
-    print("🔥 Initializing Firestore...")
-    db_manager.initialize_firestore()
-
     print("✅ Database setup complete!")
     print("\nDatabase Tables Created:")
     print("• trading_signals - All generated signals")
@@ -2,28 +2,45 @@
 Trading data pipeline ingest module
 
 This module provides data ingestion functionality for the trading system.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+``import trading_data_pipeline.ingest`` does not load the fetcher,
+validator and cleaner until one of their names is used.
 """
 
-from trading_data_pipeline.ingest.tiered_data_fetcher import (
-    TieredDataFetcher,
-    DataSourceTier,
-    FetchStrategy,
-    ImputationMethod,
-)
-from trading_data_pipeline.ingest.data_validator import (
-    DataValidator,
-    ValidationResult,
-    validate_data_integrity,
-)
-from trading_data_pipeline.ingest.data_cleaner import (
-    clean_ohlcv_data,
-    handle_negative_prices,
-)
-
-# For backward compatibility
+import importlib
+
+_LAZY_ATTRS = {
+    "TieredDataFetcher": "tiered_data_fetcher",
+    "DataSourceTier": "tiered_data_fetcher",
+    "FetchStrategy": "tiered_data_fetcher",
+    "ImputationMethod": "tiered_data_fetcher",
+    "DataValidator": "data_validator",
+    "ValidationResult": "data_validator",
+    "validate_data_integrity": "data_validator",
+    "clean_ohlcv_data": "data_cleaner",
+    "clean_ohlcv_batch": "data_cleaner",
+    "handle_negative_prices": "data_cleaner",
+}
+
 # Alias for backward compatibility
-data_fetcher = TieredDataFetcher
-data_fetcher = TieredDataFetcher
+_ALIASES = {"data_fetcher": "TieredDataFetcher"}
+
+
+def __getattr__(name):
+    target = _ALIASES.get(name, name)
+    if target not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{_LAZY_ATTRS[target]}")
+    value = getattr(module, target)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_ALIASES))
+
 
 __all__ = [
     "TieredDataFetcher",
@@ -31,6 +48,7 @@ __all__ = [
     "DataValidator",
     "ValidationResult",
     "clean_ohlcv_data",
+    "clean_ohlcv_batch",
     "handle_negative_prices",
     "data_fetcher",
 ]
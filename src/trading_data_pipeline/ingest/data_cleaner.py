@@ -15,6 +15,12 @@ Features:
 Dependencies:
 - pandas
 - numpy
+- bottleneck (optional, faster forward/backward fill)
+- polars (optional, faster imputation and outlier bounds)
+- numba (optional, native kernels for the single-pass clean)
+- Cython (optional, build-time only: compiles the _clean_kernel extension)
+- joblib (optional, process pool for clean_ohlcv_batch)
+- scipy (optional, cubic spline imputation)
 - scikit-learn (optional for advanced imputation)
 
 Usage:
@@ -27,14 +33,66 @@ Licensed by SJ Trading
 """
 
 import logging
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Literal, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+try:
+    import bottleneck as bn
+
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+try:
+    import polars as pl
+
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from joblib import Parallel, delayed
+
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+try:
+    from scipy.interpolate import CubicSpline
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Imputation and outlier bounds run on Polars when it is installed, unless
+# DATA_CLEANER_BACKEND=pandas is set.
+USE_POLARS = POLARS_AVAILABLE and os.getenv("DATA_CLEANER_BACKEND") != "pandas"
+
 from ..utils.data_utils import check_dataframe_validity
-from .data_validator import validate_data_integrity
+
+try:
+    from . import _clean_kernel
+
+    CLEAN_KERNEL_AVAILABLE = True
+except ImportError:
+    CLEAN_KERNEL_AVAILABLE = False
+
+from .data_validator import validate_data
+
+OHLC_COLUMNS = ["Open", "High", "Low", "Close"]
 
 
 class ImputationMethod(Enum):
@@ -57,7 +115,9 @@ def clean_ohlcv_data(
     handle_missing: bool = True,
     handle_outliers: bool = True,
     imputation_method: ImputationMethod = ImputationMethod.FORWARD_FILL,
-    validate: bool = True,
+    validate: Union[bool, Literal["none", "pre", "post", "both"]] = "pre",
+    downcast: bool = False,
+    symbol: str = "UNKNOWN",
 ) -> pd.DataFrame:
     """
     Clean and preprocess OHLCV (Open, High, Low, Close, Volume) data.
@@ -67,42 +127,333 @@ def clean_ohlcv_data(
         handle_missing: Whether to handle missing values
         handle_outliers: Whether to handle outliers
         imputation_method: Method to use for imputing missing values
-        validate: Whether to validate data integrity before and after cleaning
+        validate: When to validate the data: 'pre' (before cleaning), 'post'
+            (after), 'both' or 'none'. True and False are accepted as
+            'both' and 'none'.
+        downcast: Store float columns as float32, halving the memory each
+            cleaning pass reads and writes. Means and standard deviations
+            are still accumulated in float64.
+        symbol: Symbol of the data, used in validation messages
 
     Returns:
         Cleaned DataFrame with OHLCV data
     """
+    if validate is True:
+        validate = "both"
+    elif validate is False:
+        validate = "none"
+    if validate not in ("none", "pre", "post", "both"):
+        raise ValueError(f"Unknown validate mode: {validate}")
+
     if data is None or len(data) == 0:
         logging.warning("Empty dataframe provided for cleaning")
         return pd.DataFrame()
 
-    # Make a copy to avoid modifying the original
+    # Copy once here; every stage below works on this frame in place
     df = data.copy()
 
-    # Validate input data
-    if validate:
-        df = validate_data_integrity(df)
+    if downcast:
+        float_cols = df.select_dtypes(include=["float64"]).columns
+        df[float_cols] = df[float_cols].astype(np.float32)
 
-    # Handle missing values
-    if handle_missing:
-        df = impute_missing_values(df, method=imputation_method)
+    # Validate input data
+    if validate in ("pre", "both"):
+        _validate(df, symbol)
 
-    # Handle outliers
-    if handle_outliers:
-        df = remove_outliers(df)
+    # Handle missing values; ffill/bfill run inside the fused clean below
+    fill = imputation_method if handle_missing else ImputationMethod.NONE
+    if fill not in _FUSED_FILLS:
+        df = impute_missing_values(df, method=fill, _copy=False)
+        fill = ImputationMethod.NONE
 
-    # Ensure OHLC values are consistent (High >= Open >= Close >= Low)
-    df = enforce_ohlc_consistency(df)
+    # Cap outliers and ensure OHLC values are consistent (High >= Open >= Close >= Low)
+    # on one float block instead of one frame per stage
+    df = _clean_fused(df, fill, handle_outliers)
 
     # Final validation
-    if validate:
-        df = validate_data_integrity(df, strict=False)
+    if validate in ("post", "both"):
+        _validate(df, symbol)
 
     return df
 
 
+def _validate(df: pd.DataFrame, symbol: str) -> None:
+    """
+    Run the market data validator and log its verdict.
+
+    The validator's cleaned frame has lowercased column labels, so it is not
+    used; cleaning continues on the caller's frame and labels.
+    """
+    result = validate_data(df, symbol=symbol)
+    if not result["is_valid"]:
+        logging.warning(f"{symbol}: {result['message']}")
+
+
+def _clean_item(item: Tuple[str, pd.DataFrame], kwargs: dict) -> pd.DataFrame:
+    """Clean one (symbol, frame) pair in a worker process."""
+    return clean_ohlcv_data(item[1], symbol=item[0], **kwargs)
+
+
+def clean_ohlcv_batch(
+    frames: Dict[str, pd.DataFrame], n_jobs: int = -1, **kwargs
+) -> Dict[str, pd.DataFrame]:
+    """
+    Clean the OHLCV frames of many symbols in parallel worker processes.
+
+    Symbols are independent, so they are split into chunks of about
+    len(frames) / (4 * workers) and cleaned with joblib's loky backend, or a
+    ProcessPoolExecutor when joblib is not installed.
+
+    Args:
+        frames: DataFrames keyed by symbol
+        n_jobs: Number of worker processes; -1 uses all CPUs, 1 cleans in-process
+        **kwargs: Arguments passed to clean_ohlcv_data
+
+    Returns:
+        Cleaned DataFrames keyed by symbol, in the input order
+    """
+    items = list(frames.items())
+    n_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+    n_workers = min(n_workers, len(items))
+
+    if n_workers <= 1:
+        return {
+            symbol: clean_ohlcv_data(df, symbol=symbol, **kwargs)
+            for symbol, df in items
+        }
+
+    batch_size = max(1, len(items) // (n_workers * 4))
+    if JOBLIB_AVAILABLE:
+        cleaned = Parallel(n_jobs=n_workers, backend="loky", batch_size=batch_size)(
+            delayed(clean_ohlcv_data)(df, symbol=symbol, **kwargs)
+            for symbol, df in items
+        )
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            cleaned = list(
+                executor.map(
+                    _clean_item, items, [kwargs] * len(items), chunksize=batch_size
+                )
+            )
+
+    return {symbol: df for (symbol, _), df in zip(items, cleaned)}
+
+
+def _push_fill(df: pd.DataFrame, backward_first: bool = False) -> pd.DataFrame:
+    """
+    Forward fill then backward fill (or the reverse) every column.
+
+    Float columns are filled with bottleneck.push directly on the numpy block
+    when bottleneck is installed; other dtypes use pandas ffill/bfill.
+
+    Args:
+        df: DataFrame to fill
+        backward_first: Fill backward first, then forward
+
+    Returns:
+        Filled DataFrame
+    """
+    other_cols = df.columns
+    if BOTTLENECK_AVAILABLE:
+        # One 2D block per float dtype so float32 columns stay float32
+        for dtype in {dtype for dtype in df.dtypes if dtype.kind == "f"}:
+            cols = df.columns[df.dtypes == dtype]
+            arr = df[cols].to_numpy()
+            if backward_first:
+                arr = bn.push(arr[::-1], axis=0)[::-1]
+                arr = bn.push(arr, axis=0)
+            else:
+                arr = bn.push(arr, axis=0)
+                arr = bn.push(arr[::-1], axis=0)[::-1]
+            df[cols] = arr
+            other_cols = other_cols.difference(cols, sort=False)
+
+    if len(other_cols):
+        if backward_first:
+            df[other_cols] = df[other_cols].bfill().ffill()
+        else:
+            df[other_cols] = df[other_cols].ffill().bfill()
+    return df
+
+
+# Polars expression builders for the imputation methods it supports
+_POLARS_FILLS = {
+    ImputationMethod.FORWARD_FILL: lambda col: col.forward_fill().backward_fill(),
+    ImputationMethod.BACKWARD_FILL: lambda col: col.backward_fill().forward_fill(),
+    # pandas carries the last value into trailing gaps; leading gaps stay NaN
+    ImputationMethod.LINEAR: lambda col: col.interpolate().forward_fill(),
+    ImputationMethod.MEAN: lambda col: col.fill_null(col.mean()),
+    ImputationMethod.MEDIAN: lambda col: col.fill_null(col.median()),
+    ImputationMethod.ZERO: lambda col: col.fill_null(0.0),
+}
+
+
+def _is_numpy_numeric(df: pd.DataFrame) -> bool:
+    """Whether every column is a plain NumPy bool, integer or float dtype."""
+    return all(
+        isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in df.dtypes
+    )
+
+
+def _float_block(df: pd.DataFrame) -> np.ndarray:
+    """Float columns of a frame as one 2D array, a view when possible."""
+    return df.loc[:, [dtype.kind == "f" for dtype in df.dtypes]].to_numpy(
+        dtype=np.float64
+    )
+
+
+def _has_nan(arr: np.ndarray) -> bool:
+    """Whether a float array holds any NaN, stopping at the first one found."""
+    return bool(bn.anynan(arr) if BOTTLENECK_AVAILABLE else np.isnan(arr).any())
+
+
+def _nan_count(data: Union[pd.DataFrame, np.ndarray]) -> int:
+    """
+    Count missing values with a single pass over the underlying array.
+
+    Args:
+        data: Float array, or a DataFrame of any dtypes
+
+    Returns:
+        Number of NaN/NA values
+    """
+    if isinstance(data, np.ndarray):
+        return int(np.count_nonzero(np.isnan(data)))
+    if _is_numpy_numeric(data):
+        return _nan_count(_float_block(data))
+    return int(np.count_nonzero(data.isna().to_numpy()))
+
+
+def _polars_compatible(df: pd.DataFrame) -> bool:
+    """Whether a frame can take the Polars path without changing its dtypes."""
+    return all(isinstance(col, str) for col in df.columns) and _is_numpy_numeric(df)
+
+
+def _polars_impute(df: pd.DataFrame, method: ImputationMethod) -> pd.DataFrame:
+    """
+    Impute the float columns of an all-numeric frame in one Polars query.
+
+    Integer and boolean columns cannot hold NaN and are left untouched.
+
+    Args:
+        df: DataFrame accepted by _polars_compatible
+        method: Imputation method with an entry in _POLARS_FILLS
+
+    Returns:
+        DataFrame with imputed values
+    """
+    float_cols = [col for col, dtype in df.dtypes.items() if dtype.kind == "f"]
+    if not float_cols:
+        return df
+
+    filled = (
+        pl.from_pandas(df[float_cols])
+        .lazy()
+        .with_columns(_POLARS_FILLS[method](pl.all()))
+        .collect()
+    )
+    for col in float_cols:
+        df[col] = filled.get_column(col).to_numpy()
+    return df
+
+
+def _spline_fill(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fill interior gaps of each float column with a cubic spline.
+
+    Fits scipy's CubicSpline through the valid points of every column of the
+    float block, so results match pandas' interpolate(method="polynomial",
+    order=3) without a Series round trip per column. Gaps before the first
+    or after the last valid value stay NaN, and columns with fewer than four
+    valid points are left as-is.
+
+    Args:
+        df: DataFrame owned by the caller
+
+    Returns:
+        DataFrame with imputed values
+    """
+    view = _numeric_view(df)
+    index = df.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8.astype(np.float64)
+    elif pd.api.types.is_numeric_dtype(index.dtype):
+        x = index.to_numpy(dtype=np.float64)
+    else:
+        x = np.arange(len(index), dtype=np.float64)
+
+    filled = False
+    for j in range(view.arr.shape[1]):
+        values = view.arr[:, j]
+        missing = np.isnan(values)
+        if not missing.any() or len(values) - np.count_nonzero(missing) < 4:
+            continue
+        spline = CubicSpline(x[~missing], values[~missing], extrapolate=False)
+        values[missing] = spline(x[missing])
+        filled = True
+
+    if filled:
+        view.write_to(df)
+    return df
+
+
+def _mode_fill(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fill missing values with the mode of each column.
+
+    Float columns take their mode from one sort per column of the float
+    block instead of DataFrame.mode(). Ties resolve to the smallest value,
+    as with df.mode().iloc[0]; other columns still use pandas.
+
+    Args:
+        df: DataFrame owned by the caller
+
+    Returns:
+        DataFrame with imputed values
+    """
+    view = _numeric_view(df)
+    missing = np.isnan(view.arr)
+    if missing.any():
+        modes = np.full(len(view.cols), np.nan)
+        for j, values in enumerate(view.arr.T):
+            values = np.sort(values[~missing[:, j]])
+            if values.size:
+                starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+                counts = np.diff(np.r_[starts, values.size])
+                modes[j] = values[starts[np.argmax(counts)]]
+        np.copyto(view.arr, modes, where=missing, casting="same_kind")
+        view.write_to(df)
+
+    other_cols = df.columns.difference(view.cols, sort=False)
+    if len(other_cols) and df[other_cols].isna().any().any():
+        df[other_cols] = df[other_cols].fillna(df[other_cols].mode().iloc[0])
+    return df
+
+
+# Pandas/NumPy imputation handlers, keyed by method. Each takes a frame the
+# caller owns and returns the imputed frame.
+_IMPUTERS = {
+    # If still has NaN at the beginning, fill backward
+    ImputationMethod.FORWARD_FILL: _push_fill,
+    # If still has NaN at the end, fill forward
+    ImputationMethod.BACKWARD_FILL: lambda df: _push_fill(df, backward_first=True),
+    ImputationMethod.LINEAR: lambda df: df.interpolate(method="linear"),
+    ImputationMethod.POLYNOMIAL: (
+        _spline_fill
+        if SCIPY_AVAILABLE
+        else lambda df: df.interpolate(method="polynomial", order=3)
+    ),
+    ImputationMethod.MEAN: lambda df: df.fillna(df.mean()),
+    ImputationMethod.MEDIAN: lambda df: df.fillna(df.median()),
+    ImputationMethod.MODE: _mode_fill,
+    ImputationMethod.ZERO: lambda df: df.fillna(0),
+}
+
+
 def impute_missing_values(
-    data: pd.DataFrame, method: ImputationMethod = ImputationMethod.FORWARD_FILL
+    data: pd.DataFrame,
+    method: ImputationMethod = ImputationMethod.FORWARD_FILL,
+    _copy: bool = True,
 ) -> pd.DataFrame:
     """
     Impute missing values in the dataframe using specified method.
@@ -110,149 +461,390 @@ def impute_missing_values(
     Args:
         data: DataFrame containing time series data
         method: Imputation method to use
+        _copy: Work on a copy; when False, data is modified in place
 
     Returns:
         DataFrame with imputed values
     """
-    df = data.copy()
+    df = data.copy() if _copy else data
 
-    # Skip if no missing values
-    if not df.isna().any().any():
+    # Skip if no missing values. In an all-numeric frame only the float
+    # columns can hold NaN, so check that block without a boolean frame.
+    if _is_numpy_numeric(df):
+        if not _has_nan(_float_block(df)):
+            return df
+    elif not df.isna().any().any():
         return df
 
-    # Count missing values before imputation
-    missing_before = df.isna().sum().sum()
-
-    # Apply imputation based on method
-    if method == ImputationMethod.FORWARD_FILL:
-        df.fillna(method="ffill", inplace=True)
-        # If still has NaN at the beginning, fill backward
-        df.fillna(method="bfill", inplace=True)
-    elif method == ImputationMethod.BACKWARD_FILL:
-        df.fillna(method="bfill", inplace=True)
-        # If still has NaN at the end, fill forward
-        df.fillna(method="ffill", inplace=True)
-    elif method == ImputationMethod.LINEAR:
-        df = df.interpolate(method="linear")
-    elif method == ImputationMethod.POLYNOMIAL:
-        df = df.interpolate(method="polynomial", order=3)
-    elif method == ImputationMethod.MEAN:
-        df.fillna(df.mean(), inplace=True)
-    elif method == ImputationMethod.MEDIAN:
-        df.fillna(df.median(), inplace=True)
-    elif method == ImputationMethod.MODE:
-        df.fillna(df.mode().iloc[0], inplace=True)
-    elif method == ImputationMethod.ZERO:
-        df.fillna(0, inplace=True)
-    elif method == ImputationMethod.NONE:
-        # Do nothing, keep NaN values
-        pass
+    # Count missing values before imputation, only when it will be logged
+    log_info = logging.getLogger().isEnabledFor(logging.INFO)
+    if log_info:
+        missing_before = _nan_count(df)
+
+    # Apply imputation based on method; NONE and CUSTOM leave NaN values as-is
+    if USE_POLARS and method in _POLARS_FILLS and _polars_compatible(df):
+        df = _polars_impute(df, method)
+    elif method in _IMPUTERS:
+        df = _IMPUTERS[method](df)
 
     # Count missing values after imputation
-    missing_after = df.isna().sum().sum()
-    if missing_before > 0:
-        logging.info(
-            f"Imputed {missing_before - missing_after} missing values using {method.value} method"
-        )
+    if logging.getLogger().isEnabledFor(logging.WARNING):
+        missing_after = _nan_count(df)
+        if log_info:
+            logging.info(
+                f"Imputed {missing_before - missing_after} missing values using {method.value} method"
+            )
         if missing_after > 0:
             logging.warning(f"{missing_after} missing values remain after imputation")
 
     return df
 
 
-def remove_outliers(
-    data: pd.DataFrame, method: str = "iqr", threshold: float = 3.0
-) -> pd.DataFrame:
+def _nanquantile(arr: np.ndarray, q: List[float]) -> np.ndarray:
     """
-    Detect and handle outliers in the dataframe.
+    Column quantiles of a 2D float array, ignoring NaN.
+
+    Same result as np.nanquantile(arr, q, axis=0). That function loops over
+    the columns in Python through apply_along_axis even when there is no
+    NaN, so NaN-free blocks (the usual case once imputation has run) take a
+    single partition-based np.quantile call instead.
 
     Args:
-        data: DataFrame containing time series data
-        method: Method to use for outlier detection ('iqr', 'zscore', or 'quantile')
-        threshold: Threshold for outlier detection
+        arr: 2D float array, one column per series
+        q: Quantiles to compute, in [0, 1]
 
     Returns:
-        DataFrame with outliers handled
+        Array of shape (len(q), n_columns); all-NaN columns give NaN
     """
-    df = data.copy()
-    numeric_cols = df.select_dtypes(include=["number"]).columns
-    outlier_count = 0
+    if _has_nan(arr):
+        return np.nanquantile(arr, q, axis=0)
+    # Partitioning rows of the transpose walks contiguous memory for the
+    # usual C-ordered block, which is faster than axis=0
+    return np.quantile(arr.T, q, axis=1)
+
+
+def _numpy_outlier_bounds(
+    arr: np.ndarray, method: str, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-column outlier bounds of a 2D float array with NumPy.
 
-    for col in numeric_cols:
+    Args:
+        arr: 2D float array, one column per series
+        method: 'iqr', 'zscore' or 'quantile'
+        threshold: Threshold for the 'iqr' and 'zscore' methods
+
+    Returns:
+        Tuple of (lower_bound, upper_bound) arrays
+    """
+    with warnings.catch_warnings():
+        # All-NaN columns yield NaN bounds and are left untouched
+        warnings.simplefilter("ignore", RuntimeWarning)
         if method == "iqr":
             # IQR method
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
+            Q1, Q3 = _nanquantile(arr, [0.25, 0.75])
             IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)].index
-        elif method == "zscore":
+            return Q1 - threshold * IQR, Q3 + threshold * IQR
+        if method == "zscore":
             # Z-score method
-            mean = df[col].mean()
-            std = df[col].std()
-            outliers = df[abs((df[col] - mean) / std) > threshold].index
-        elif method == "quantile":
-            # Quantile method
-            lower_bound = df[col].quantile(0.01)
-            upper_bound = df[col].quantile(0.99)
-            outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)].index
+            mean = np.nanmean(arr, axis=0, dtype=np.float64)
+            std = np.nanstd(arr, axis=0, ddof=1, dtype=np.float64)
+            return mean - threshold * std, mean + threshold * std
+        # Quantile method
+        Q01, Q99 = _nanquantile(arr, [0.01, 0.99])
+        return Q01, Q99
+
+
+def _polars_outlier_bounds(
+    numeric: pd.DataFrame, method: str, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-column outlier bounds with a single Polars scan.
+
+    Args:
+        numeric: All-numeric DataFrame with string column names
+        method: 'iqr', 'zscore' or 'quantile'
+        threshold: Threshold for the 'iqr' and 'zscore' methods
+
+    Returns:
+        Tuple of (lower_bound, upper_bound) arrays
+    """
+    if method == "iqr":
+        stats = [pl.all().quantile(0.25, "linear"), pl.all().quantile(0.75, "linear")]
+    elif method == "zscore":
+        stats = [pl.all().mean(), pl.all().std()]
+    else:
+        stats = [pl.all().quantile(0.01, "linear"), pl.all().quantile(0.99, "linear")]
+
+    frame = pl.from_pandas(numeric).lazy()
+    first, second = (
+        result.to_numpy().ravel().astype(np.float64)
+        for result in pl.collect_all([frame.select(stat) for stat in stats])
+    )
+
+    if method == "iqr":
+        IQR = second - first
+        return first - threshold * IQR, second + threshold * IQR
+    if method == "zscore":
+        return first - threshold * second, first + threshold * second
+    return first, second
+
+
+class _NumericView(NamedTuple):
+    """Float columns of a frame as one writable 2D array, shared by the stages."""
+
+    arr: np.ndarray
+    cols: pd.Index
+    idx_map: Dict[str, int]
+
+    def write_to(self, df: pd.DataFrame) -> None:
+        """Write the block back into df, keeping each column's float dtype."""
+        dtypes = df.dtypes[self.cols]
+        if (dtypes == self.arr.dtype).all():
+            df[self.cols] = self.arr
         else:
-            logging.warning(f"Unknown outlier detection method: {method}")
-            return df
+            for j, (col, dtype) in enumerate(dtypes.items()):
+                df[col] = self.arr[:, j].astype(dtype, copy=False)
 
-        # Handle outliers by capping them to the bounds
-        if not df.loc[outliers, col].empty:
-            original_count = len(df.loc[outliers, col])
-            outlier_count += original_count
 
-            # Cap values outside the bounds
-            df.loc[df[col] < lower_bound, col] = lower_bound
-            df.loc[df[col] > upper_bound, col] = upper_bound
+def _numeric_view(df: pd.DataFrame) -> _NumericView:
+    """
+    Copy the float columns of a frame into a _NumericView.
+
+    The block stays float32 when every float column is float32 (see the
+    downcast option of clean_ohlcv_data) and is float64 otherwise.
+    """
+    cols = df.columns[
+        [isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in df.dtypes]
+    ]
+    float32 = np.dtype(np.float32)
+    dtype = float32 if set(df.dtypes[cols]) == {float32} else np.float64
+    arr = df[cols].to_numpy(dtype=dtype, copy=True)
+    return _NumericView(arr, cols, {col: i for i, col in enumerate(cols)})
+
+
+_OUTLIER_METHODS = ("iqr", "zscore", "quantile")
+
+
+def _compute_bounds(
+    arr: np.ndarray, cols: pd.Index, method: str, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute outlier bounds for every column of a block at once.
+
+    Args:
+        arr: 2D float array, one column per entry of cols
+        cols: Column labels
+        method: 'iqr', 'zscore' or 'quantile'
+        threshold: Threshold for the 'iqr' and 'zscore' methods
+
+    Returns:
+        Tuple of (lower_bound, upper_bound) arrays
+    """
+    # Polars only beats NumPy quantiles on mean/std; quantiles stay on NumPy
+    if USE_POLARS and method == "zscore" and all(isinstance(c, str) for c in cols):
+        return _polars_outlier_bounds(
+            pd.DataFrame(arr, columns=cols, copy=False), method, threshold
+        )
+    return _numpy_outlier_bounds(arr, method, threshold)
+
+
+def _apply_clip(
+    arr: np.ndarray, cols: pd.Index, lower_bound: np.ndarray, upper_bound: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cap every column of a block to its bounds.
+
+    NaN bounds leave their column untouched.
+
+    Args:
+        arr: 2D float array, one column per entry of cols
+        cols: Column labels
+        lower_bound: Lower bound per column
+        upper_bound: Upper bound per column
+
+    Returns:
+        Tuple of (outlier count per column, clipped values of the columns
+        with a non-zero count)
+    """
+    outlier_counts = np.count_nonzero((arr < lower_bound) | (arr > upper_bound), axis=0)
+    capped = outlier_counts > 0
+    clipped = np.clip(arr[:, capped], lower_bound[capped], upper_bound[capped])
+    return outlier_counts, clipped
+
+
+def _log_outlier_caps(cols: pd.Index, outlier_counts: np.ndarray) -> None:
+    """
+    Log the outliers capped in a frame as one message.
+
+    Formatting is skipped entirely unless INFO is enabled, which matters
+    when thousands of frames are cleaned in a loop.
+    """
+    if not outlier_counts.any() or not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    stats = {col: int(count) for col, count in zip(cols, outlier_counts) if count > 0}
+    logging.info("Outlier caps: %s (total %d)", stats, sum(stats.values()))
+
+
+def get_outlier_bounds(
+    data: pd.DataFrame, method: str = "iqr", threshold: float = 3.0
+) -> pd.DataFrame:
+    """
+    Compute the bounds remove_outliers caps each numeric column to.
+
+    The result can be passed back as precomputed_bounds, so the quantile or
+    mean/std reductions run once for data that is cleaned repeatedly, or
+    once on a historical window and then reused for new bars.
+
+    Args:
+        data: DataFrame containing time series data
+        method: Method to use for outlier detection ('iqr', 'zscore', or 'quantile')
+        threshold: Threshold for outlier detection
+
+    Returns:
+        DataFrame with one column per numeric column of data and rows
+        'lower' and 'upper'
+    """
+    if method not in _OUTLIER_METHODS:
+        raise ValueError(f"Unknown outlier detection method: {method}")
+
+    numeric = data.select_dtypes(include=["number"])
+    lower_bound, upper_bound = _compute_bounds(
+        numeric.to_numpy(dtype=np.float64), numeric.columns, method, threshold
+    )
+    return pd.DataFrame(
+        [lower_bound, upper_bound], index=["lower", "upper"], columns=numeric.columns
+    )
+
+
+def _bounds_for(bounds: pd.DataFrame, cols: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bound arrays for cols; columns without bounds get NaN."""
+    aligned = bounds.reindex(columns=cols)
+    return (
+        aligned.loc["lower"].to_numpy(dtype=np.float64),
+        aligned.loc["upper"].to_numpy(dtype=np.float64),
+    )
+
 
-            logging.info(f"Capped {original_count} outliers in column {col}")
+def remove_outliers(
+    data: pd.DataFrame,
+    method: str = "iqr",
+    threshold: float = 3.0,
+    precomputed_bounds: Optional[pd.DataFrame] = None,
+    _copy: bool = True,
+    _view: Optional[_NumericView] = None,
+) -> pd.DataFrame:
+    """
+    Detect and handle outliers in the dataframe.
+
+    Args:
+        data: DataFrame containing time series data
+        method: Method to use for outlier detection ('iqr', 'zscore', or 'quantile')
+        threshold: Threshold for outlier detection
+        precomputed_bounds: Bounds from get_outlier_bounds to cap to instead
+            of computing them from data (method and threshold are then
+            ignored); numeric columns without bounds are left as-is
+        _copy: Work on a copy; when False, data is modified in place
+        _view: Float block of data to cap in place instead of those columns
+            of data; the caller writes it back
+
+    Returns:
+        DataFrame with outliers handled
+    """
+    df = data.copy() if _copy else data
+    numeric = df.select_dtypes(include=["number"])
+    if numeric.empty:
+        return df
 
-    if outlier_count > 0:
-        logging.info(f"Total outliers handled: {outlier_count}")
+    if precomputed_bounds is None and method not in _OUTLIER_METHODS:
+        logging.warning(f"Unknown outlier detection method: {method}")
+        return df
 
+    def cap(arr: np.ndarray, cols: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        if precomputed_bounds is not None:
+            bounds = _bounds_for(precomputed_bounds, cols)
+        else:
+            bounds = _compute_bounds(arr, cols, method, threshold)
+        return _apply_clip(arr, cols, *bounds)
+
+    # Compute the bounds of every numeric column in one pass over the block
+    capped_cols, capped_counts = [], []
+    if _view is not None:
+        outlier_counts, clipped = cap(_view.arr, _view.cols)
+        _view.arr[:, outlier_counts > 0] = clipped
+        capped_cols.append(_view.cols)
+        capped_counts.append(outlier_counts)
+        numeric = numeric.drop(columns=_view.cols)
+
+    if not numeric.empty:
+        arr = numeric.to_numpy(dtype=np.float64)
+        outlier_counts, clipped = cap(arr, numeric.columns)
+        # Handle outliers by capping them to the bounds
+        if outlier_counts.any():
+            df[numeric.columns[outlier_counts > 0]] = clipped
+        capped_cols.append(numeric.columns)
+        capped_counts.append(outlier_counts)
+
+    _log_outlier_caps(
+        pd.Index(np.concatenate(capped_cols)), np.concatenate(capped_counts)
+    )
     return df
 
 
-def enforce_ohlc_consistency(data: pd.DataFrame) -> pd.DataFrame:
+def _fix_ohlc(o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray) -> int:
+    """
+    Raise High to max(Open, Close) and lower Low to min(Open, Close) in place.
+
+    The writes are unconditional np.maximum/np.minimum passes rather than
+    masked stores. NaN prices are never treated as inconsistent, so a
+    missing High or Low stays missing and a missing Open or Close defers to
+    the other one.
+
+    Returns:
+        Number of values fixed
+    """
+    # fmax/fmin skip a single NaN; the +/-inf floor covers rows where both
+    # Open and Close are NaN, so only a NaN High/Low can propagate below
+    oc_max = np.fmax(np.fmax(o, c), -np.inf)
+    oc_min = np.fmin(np.fmin(o, c), np.inf)
+    fixed = np.count_nonzero(h < oc_max) + np.count_nonzero(l > oc_min)
+    np.maximum(h, oc_max, out=h)
+    np.minimum(l, oc_min, out=l)
+    return fixed
+
+
+def enforce_ohlc_consistency(
+    data: pd.DataFrame, _copy: bool = True, _view: Optional[_NumericView] = None
+) -> pd.DataFrame:
     """
     Ensure OHLC values maintain proper relationships (High >= Open >= Close >= Low).
 
     Args:
         data: DataFrame containing OHLC columns
+        _copy: Work on a copy; when False, data is modified in place
+        _view: Float block of data to fix in place when it holds all four OHLC
+            columns; the caller writes it back
 
     Returns:
         DataFrame with consistent OHLC values
     """
-    df = data.copy()
+    df = data.copy() if _copy else data
 
     # Check if all required columns exist
-    ohlc_cols = ["Open", "High", "Low", "Close"]
-    if not all(col in df.columns for col in ohlc_cols):
+    if not all(col in df.columns for col in OHLC_COLUMNS):
         return df
 
-    # Track the number of inconsistencies fixed
-    inconsistencies = 0
-
-    # Ensure High is the highest value
-    inconsistent_high = df["High"] < df[["Open", "Close"]].max(axis=1)
-    if inconsistent_high.any():
-        inconsistencies += inconsistent_high.sum()
-        df.loc[inconsistent_high, "High"] = df.loc[
-            inconsistent_high, ["Open", "Close"]
-        ].max(axis=1)
-
-    # Ensure Low is the lowest value
-    inconsistent_low = df["Low"] > df[["Open", "Close"]].min(axis=1)
-    if inconsistent_low.any():
-        inconsistencies += inconsistent_low.sum()
-        df.loc[inconsistent_low, "Low"] = df.loc[
-            inconsistent_low, ["Open", "Close"]
-        ].min(axis=1)
+    if _view is not None and all(col in _view.idx_map for col in OHLC_COLUMNS):
+        o, h, l, c = (_view.arr[:, _view.idx_map[col]] for col in OHLC_COLUMNS)
+        inconsistencies = _fix_ohlc(o, h, l, c)
+    else:
+        # Fix High and Low on one 2D block instead of masked .loc writes
+        block = df[OHLC_COLUMNS].to_numpy(copy=True)
+        o, h, l, c = block.T
+        inconsistencies = _fix_ohlc(o, h, l, c)
+        if inconsistencies > 0:
+            df["High"] = h
+            df["Low"] = l
 
     if inconsistencies > 0:
         logging.info(f"Fixed {inconsistencies} OHLC inconsistencies")
@@ -260,8 +852,201 @@ def enforce_ohlc_consistency(data: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+if NUMBA_AVAILABLE:
+    # fastmath is left off: it lets LLVM assume values are never NaN, which
+    # would compile the NaN checks below away.
+
+    @njit(cache=True, parallel=True)
+    def _numba_fill(arr, backward_first):
+        """Forward then backward fill (or the reverse) each column in place."""
+        n_rows, n_cols = arr.shape
+        for j in prange(n_cols):
+            for sweep in range(2):
+                backward = (sweep == 0) == backward_first
+                last = np.nan
+                for k in range(n_rows):
+                    i = n_rows - 1 - k if backward else k
+                    if np.isnan(arr[i, j]):
+                        arr[i, j] = last
+                    else:
+                        last = arr[i, j]
+
+    @njit(cache=True, parallel=True)
+    def _numba_clip_ohlc(arr, lower_bound, upper_bound, ohlc_idx):
+        """Clip each column to its bounds, then fix High/Low, in place."""
+        n_rows, n_cols = arr.shape
+        outlier_counts = np.zeros(n_cols, dtype=np.int64)
+        for j in prange(n_cols):
+            lo = lower_bound[j]
+            hi = upper_bound[j]
+            count = 0
+            for i in range(n_rows):
+                if arr[i, j] < lo:
+                    arr[i, j] = lo
+                    count += 1
+                elif arr[i, j] > hi:
+                    arr[i, j] = hi
+                    count += 1
+            outlier_counts[j] = count
+
+        inconsistencies = 0
+        if ohlc_idx[0] >= 0:
+            o, h, l, c = ohlc_idx[0], ohlc_idx[1], ohlc_idx[2], ohlc_idx[3]
+            for i in prange(n_rows):
+                oc_max = np.fmax(arr[i, o], arr[i, c])
+                oc_min = np.fmin(arr[i, o], arr[i, c])
+                if arr[i, h] < oc_max:
+                    arr[i, h] = oc_max
+                    inconsistencies += 1
+                if arr[i, l] > oc_min:
+                    arr[i, l] = oc_min
+                    inconsistencies += 1
+        return outlier_counts, inconsistencies
+
+
+# Imputation methods that _clean_fused can apply directly on the float block
+_FUSED_FILLS = (
+    ImputationMethod.FORWARD_FILL,
+    ImputationMethod.BACKWARD_FILL,
+    ImputationMethod.NONE,
+)
+
+
+def _fill_2d(arr: np.ndarray, backward_first: bool = False) -> np.ndarray:
+    """
+    Forward fill then backward fill (or the reverse) each column of a 2D array.
+
+    Args:
+        arr: 2D float array, one column per series
+        backward_first: Fill backward first, then forward
+
+    Returns:
+        Filled array
+    """
+
+    if CLEAN_KERNEL_AVAILABLE and arr.dtype == np.float64:
+        arr = np.asfortranarray(arr)
+        _clean_kernel.push_fill(arr, backward_first)
+        return arr
+    if NUMBA_AVAILABLE:
+        _numba_fill(arr, backward_first)
+        return arr
+
+    def ffill(values: np.ndarray) -> np.ndarray:
+        if BOTTLENECK_AVAILABLE:
+            return bn.push(values, axis=0)
+        # Index of the last valid row at or above each row
+        idx = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+        np.maximum.accumulate(idx, axis=0, out=idx)
+        return np.take_along_axis(values, idx, axis=0)
+
+    if backward_first:
+        return ffill(ffill(arr[::-1])[::-1])
+    return ffill(ffill(arr)[::-1])[::-1]
+
+
+def _clean_fused(
+    df: pd.DataFrame, fill: ImputationMethod, handle_outliers: bool
+) -> pd.DataFrame:
+    """
+    Impute, cap outliers and enforce OHLC consistency in a single pass.
+
+    The float columns are pulled into one 2D array, filled, clipped to the
+    default IQR bounds of remove_outliers and OHLC-fixed in place, then
+    written back once. Results match running impute_missing_values,
+    remove_outliers and enforce_ohlc_consistency in sequence.
+
+    Args:
+        df: DataFrame owned by the caller, modified in place
+        fill: Imputation method, one of _FUSED_FILLS
+        handle_outliers: Whether to cap outliers
+
+    Returns:
+        Cleaned DataFrame
+    """
+    view = _numeric_view(df)
+    other_cols = df.columns.difference(view.cols, sort=False)
+
+    if fill != ImputationMethod.NONE:
+        backward_first = fill == ImputationMethod.BACKWARD_FILL
+        others_missing = df[other_cols].isna().any().any()
+        if others_missing or _has_nan(view.arr):
+            log_info = logging.getLogger().isEnabledFor(logging.INFO)
+            if log_info:
+                missing_before = _nan_count(view.arr) + _nan_count(df[other_cols])
+
+            view = view._replace(arr=_fill_2d(view.arr, backward_first=backward_first))
+            if others_missing:
+                df[other_cols] = (
+                    df[other_cols].bfill().ffill()
+                    if backward_first
+                    else df[other_cols].ffill().bfill()
+                )
+
+            if logging.getLogger().isEnabledFor(logging.WARNING):
+                missing_after = _nan_count(view.arr) + _nan_count(df[other_cols])
+                if log_info:
+                    logging.info(
+                        f"Imputed {missing_before - missing_after} missing values using {fill.value} method"
+                    )
+                if missing_after > 0:
+                    logging.warning(
+                        f"{missing_after} missing values remain after imputation"
+                    )
+
+    has_ohlc = all(col in view.idx_map for col in OHLC_COLUMNS)
+    use_clean_kernel = CLEAN_KERNEL_AVAILABLE and view.arr.dtype == np.float64
+    if (use_clean_kernel or NUMBA_AVAILABLE) and len(view.cols):
+        # Clip and OHLC fix in one native pass over the block
+        if handle_outliers:
+            lower_bound, upper_bound = _numpy_outlier_bounds(view.arr, "iqr", 3.0)
+        else:
+            lower_bound = np.full(len(view.cols), -np.inf)
+            upper_bound = np.full(len(view.cols), np.inf)
+        ohlc_idx = [view.idx_map[col] for col in OHLC_COLUMNS] if has_ohlc else [-1] * 4
+
+        if use_clean_kernel:
+            view = view._replace(arr=np.asfortranarray(view.arr))
+            outlier_counts, inconsistencies = _clean_kernel.clip_ohlc(
+                view.arr,
+                np.ascontiguousarray(lower_bound, dtype=np.float64),
+                np.ascontiguousarray(upper_bound, dtype=np.float64),
+                *ohlc_idx,
+            )
+        else:
+            outlier_counts, inconsistencies = _numba_clip_ohlc(
+                view.arr,
+                lower_bound,
+                upper_bound,
+                np.array(ohlc_idx, dtype=np.int64),
+            )
+        _log_outlier_caps(view.cols, outlier_counts)
+        if inconsistencies > 0:
+            logging.info(f"Fixed {inconsistencies} OHLC inconsistencies")
+
+        # Integer columns cannot hold NaN but may still need capping
+        int_cols = df[other_cols].select_dtypes(include=["number"]).columns
+        if handle_outliers and len(int_cols):
+            df[int_cols] = remove_outliers(df[int_cols], _copy=False)
+    else:
+        if handle_outliers:
+            df = remove_outliers(df, _copy=False, _view=view)
+        if has_ohlc:
+            df = enforce_ohlc_consistency(df, _copy=False, _view=view)
+
+    if len(view.cols):
+        view.write_to(df)
+    if not has_ohlc:
+        df = enforce_ohlc_consistency(df, _copy=False)
+
+    return df
+
+
 def handle_negative_prices(
-    data: pd.DataFrame, replace_method: str = "absolute", min_valid_price: float = 0.01
+    data: pd.DataFrame,
+    replace_method: str = "absolute",
+    min_valid_price: float = 0.01,
+    _copy: bool = True,
 ) -> pd.DataFrame:
     """
     Handle negative prices in financial data.
@@ -277,11 +1062,12 @@ def handle_negative_prices(
             - 'minimum': Replace with the minimum valid price
             - 'nan': Replace with NaN and then impute later
         min_valid_price: Minimum valid price for replacement when using 'minimum' method
+        _copy: Work on a copy; when False, data is modified in place
 
     Returns:
         DataFrame with negative prices handled
     """
-    df = data.copy()
+    df = data.copy() if _copy else data
 
     # Price columns to check
     price_cols = ["Open", "High", "Low", "Close", "Adj Close"]
@@ -291,46 +1077,47 @@ def handle_negative_prices(
         logging.warning("No price columns found in data")
         return df
 
-    # Count negative prices
-    neg_price_count = 0
-    for col in price_cols:
-        neg_mask = df[col] < 0
-        neg_count = neg_mask.sum()
-        neg_price_count += neg_count
-
-        if neg_count > 0:
-            logging.warning(f"Found {neg_count} negative values in {col}")
-
-            # Handle based on the specified method
-            if replace_method == "absolute":
-                df.loc[neg_mask, col] = df.loc[neg_mask, col].abs()
-
-            elif replace_method == "previous":
-                # Store original indices for negative values
-                neg_indices = df.index[neg_mask]
-
-                # Forward fill from previous valid values
-                df[col] = df[col].mask(neg_mask).ffill()
-
-                # If there are still NaNs at the beginning, backward fill
-                if df[col].isna().any():
-                    df[col] = df[col].bfill()
+    # Find negative prices in all price columns with one comparison
+    block = df[price_cols].to_numpy(dtype=np.float64, copy=True)
+    neg_mask = block < 0
+    neg_counts = np.count_nonzero(neg_mask, axis=0)
+    neg_price_count = int(neg_counts.sum())
 
-            elif replace_method == "minimum":
-                df.loc[neg_mask, col] = min_valid_price
-
-            elif replace_method == "nan":
-                df.loc[neg_mask, col] = np.nan
-                # Note: These NaNs should be handled later with impute_missing_values
+    if neg_price_count > 0:
+        # Only columns that had negative values are written back
+        has_neg = neg_counts > 0
+        neg_cols = [col for col, neg in zip(price_cols, has_neg) if neg]
+        block = block[:, has_neg]
+        neg_mask = neg_mask[:, has_neg]
+
+        # Handle based on the specified method
+        if replace_method == "previous":
+            # Forward fill from previous valid values, then backward fill any
+            # NaNs left at the beginning
+            block[neg_mask] = np.nan
+            block = _fill_2d(block)
+
+        elif replace_method == "minimum":
+            np.copyto(block, min_valid_price, where=neg_mask)
+
+        elif replace_method == "nan":
+            np.copyto(block, np.nan, where=neg_mask)
+            # Note: These NaNs should be handled later with impute_missing_values
 
-            else:
+        else:
+            if replace_method != "absolute":
+                # Unknown methods default to absolute
                 logging.error(f"Unknown replace_method: {replace_method}")
-                # Default to absolute
-                df.loc[neg_mask, col] = df.loc[neg_mask, col].abs()
-
-    if neg_price_count > 0:
-        logging.info(
-            f"Handled {neg_price_count} negative prices using {replace_method} method"
-        )
+            np.abs(block, out=block)
+
+        df[neg_cols] = block
+        if logging.getLogger().isEnabledFor(logging.WARNING):
+            stats = dict(zip(neg_cols, neg_counts[has_neg].tolist()))
+            logging.warning(
+                "Handled %d negative prices using %s method: %s",
+                neg_price_count,
+                replace_method,
+                stats,
+            )
 
     return df
@@ -14,21 +14,44 @@ Key validations:
 - Technical indicator consistency
 - Real-time data quality monitoring
 
+Dependencies:
+- pandas
+- numpy
+- numba (optional, compiled kernel for the price checks)
+
 Author: AI Trading Machine
 Licensed by SJ Trading
 """
 
-from dataclasses import dataclass
+import io
+import os
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, time
 from enum import Enum
-from typing import Any, Optional, Union, Dict
+from typing import Any, Callable, Optional, Union, Dict
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# numba's default workqueue threading layer aborts when two threads run a
+# parallel kernel at once, so threads (validate_many) take turns on them
+_NUMBA_SCAN_LOCK = threading.Lock()
+
 
 class ValidationSeverity(Enum):
     """Severity levels for validation issues."""
@@ -49,7 +72,21 @@ class DataSource(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Price columns checked by validate_price_data, in the order of its counts
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+
+# Source names accepted by validate_data and DataValidator.validate
+_SOURCE_MAP = {
+    "yahoo": DataSource.YAHOO_FINANCE,
+    "yfinance": DataSource.YAHOO_FINANCE,
+    "kite": DataSource.KITECONNECT,
+    "kiteconnect": DataSource.KITECONNECT,
+    "nse": DataSource.NSE_OFFICIAL,
+    "bse": DataSource.BSE_OFFICIAL,
+}
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a data validation issue."""
 
@@ -63,7 +100,7 @@ class ValidationIssue:
     suggested_action: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation."""
 
@@ -73,6 +110,325 @@ class ValidationResult:
     validation_summary: Optional[dict[str, Any]] = None
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True)
+    def _numba_price_scan(prices, volume, min_price, max_price, volume_limit):
+        """Count the validate_price_data issues in one pass over the rows."""
+        n_rows = prices.shape[0]
+        chunk = max(1, (n_rows + 63) // 64)
+        n_chunks = (n_rows + chunk - 1) // chunk
+        counts = np.zeros((n_chunks, 18), dtype=np.int64)
+        for k in prange(n_chunks):
+            for i in range(k * chunk, min(n_rows, (k + 1) * chunk)):
+                for j in range(4):
+                    price = prices[i, j]
+                    if price < 0:
+                        counts[k, j] += 1
+                    if price < min_price:
+                        counts[k, 4 + j] += 1
+                    if price > max_price:
+                        counts[k, 8 + j] += 1
+                o, h, l, c = prices[i, 0], prices[i, 1], prices[i, 2], prices[i, 3]
+                if h < o:
+                    counts[k, 12] += 1
+                if h < c:
+                    counts[k, 13] += 1
+                if l > o:
+                    counts[k, 14] += 1
+                if l > c:
+                    counts[k, 15] += 1
+                if volume.size:
+                    if volume[i] < 0:
+                        counts[k, 16] += 1
+                    if volume[i] > volume_limit:
+                        counts[k, 17] += 1
+        return counts.sum(axis=0)
+
+    @njit(cache=True, error_model="numpy")
+    def _numba_cross_diffs(
+        close1, close2, volume1, volume2, price_tolerance, volume_tolerance
+    ):
+        """Count price and volume discrepancies in one pass over the rows."""
+        price_count = 0
+        price_total = 0.0
+        volume_count = 0
+        for i in range(max(close1.size, volume1.size)):
+            if i < close1.size:
+                price_diff = abs(close1[i] - close2[i]) / close1[i]
+                if price_diff > price_tolerance:
+                    price_count += 1
+                    price_total += price_diff
+            if i < volume1.size:
+                volume_diff = abs(volume1[i] - volume2[i]) / (volume1[i] + 1)
+                if volume_diff > volume_tolerance:
+                    volume_count += 1
+        price_mean = price_total / price_count if price_count else np.nan
+        return price_count, price_mean, volume_count
+
+    @njit(cache=True, parallel=True, error_model="numpy")
+    def _numba_extreme_changes(prices, threshold):
+        """Count the rows whose change from the previous row exceeds threshold."""
+        n_rows, n_cols = prices.shape
+        counts = np.zeros(n_cols, dtype=np.int64)
+        for j in prange(n_cols):
+            count = 0
+            for i in range(1, n_rows):
+                previous = prices[i - 1, j]
+                if abs((prices[i, j] - previous) / previous) > threshold:
+                    count += 1
+            counts[j] = count
+        return counts
+
+
+def _price_issue_counts(
+    prices: np.ndarray,
+    volume: np.ndarray,
+    min_price: float,
+    max_price: float,
+    volume_limit: float,
+) -> np.ndarray:
+    """
+    Count every issue checked by validate_price_data.
+
+    Uses the numba kernel when numba is installed and NumPy otherwise.
+    NaN never counts as an issue.
+
+    Args:
+        prices: Float64 array of the open, high, low and close columns
+        volume: Float64 volume array, or an empty array to skip volume checks
+        min_price: Prices below this are extremely low
+        max_price: Prices above this are extremely high
+        volume_limit: Volumes above this are suspiciously high
+
+    Returns:
+        Int array of 18 counts: negative, below min_price and above
+        max_price for each of the four price columns, then High < Open,
+        High < Close, Low > Open, Low > Close, negative volume and volume
+        above volume_limit
+    """
+    if NUMBA_AVAILABLE:
+        with _NUMBA_SCAN_LOCK:
+            return _numba_price_scan(prices, volume, min_price, max_price, volume_limit)
+
+    open_, high, low, close = prices.T
+    return np.concatenate(
+        [
+            np.count_nonzero(prices < 0, axis=0),
+            np.count_nonzero(prices < min_price, axis=0),
+            np.count_nonzero(prices > max_price, axis=0),
+            [
+                np.count_nonzero(high < open_),
+                np.count_nonzero(high < close),
+                np.count_nonzero(low > open_),
+                np.count_nonzero(low > close),
+                np.count_nonzero(volume < 0),
+                np.count_nonzero(volume > volume_limit),
+            ],
+        ]
+    )
+
+
+def _count_extreme_changes(prices: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Count the relative changes above threshold in each column.
+
+    Uses the numba kernel when numba is installed and NumPy otherwise.
+    Matches abs(pct_change()) > threshold: a change from zero counts, NaN
+    never does.
+
+    Args:
+        prices: Float64 array with one column per price series
+        threshold: Relative change counted as extreme
+
+    Returns:
+        Int array with the count for each column
+    """
+    if NUMBA_AVAILABLE:
+        with _NUMBA_SCAN_LOCK:
+            return _numba_extreme_changes(prices, threshold)
+
+    return np.count_nonzero(_relative_change(prices) > threshold, axis=0)
+
+
+def _cross_source_diffs(
+    close1: np.ndarray,
+    close2: np.ndarray,
+    volume1: np.ndarray,
+    volume2: np.ndarray,
+    price_tolerance: float,
+    volume_tolerance: float,
+) -> tuple[int, float, int]:
+    """
+    Compare aligned close and volume arrays of two sources.
+
+    Uses the numba kernel when numba is installed and NumPy otherwise.
+    Pass empty arrays to skip the close or volume comparison.
+
+    Args:
+        close1, close2: Close prices of the first and second source
+        volume1, volume2: Volumes of the first and second source
+        price_tolerance: Relative close difference counted as a discrepancy
+        volume_tolerance: Relative volume difference counted as a discrepancy
+
+    Returns:
+        Tuple of (price discrepancy count, mean relative difference of those
+        discrepancies, volume discrepancy count)
+    """
+    if NUMBA_AVAILABLE:
+        return _numba_cross_diffs(
+            close1, close2, volume1, volume2, price_tolerance, volume_tolerance
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price_diff = np.abs(close1 - close2) / close1
+        # +1 to avoid division by zero
+        volume_diff = np.abs(volume1 - volume2) / (volume1 + 1)
+    large_differences = price_diff[price_diff > price_tolerance]
+    price_mean = large_differences.mean() if large_differences.size else np.nan
+    return (
+        large_differences.size,
+        price_mean,
+        int(np.count_nonzero(volume_diff > volume_tolerance)),
+    )
+
+
+def _has_severity(
+    issues: list[ValidationIssue], *severities: ValidationSeverity
+) -> bool:
+    """Whether any of the issues has one of the given severities."""
+    return not {issue.severity for issue in issues}.isdisjoint(severities)
+
+
+def _missing_count(series: pd.Series) -> int:
+    """Number of missing values, from np.isnan for plain float columns."""
+    values = series.to_numpy()
+    if values.dtype.kind == "f":
+        return int(np.count_nonzero(np.isnan(values)))
+    return int(series.isna().sum())
+
+
+def _median(values: np.ndarray) -> float:
+    """
+    Median of a float array, skipping NaN, as Series.median() returns it.
+
+    Uses np.partition (quickselect), which is O(n) and avoids the NaN
+    handling overhead pandas adds around its own median.
+    """
+    if np.isnan(values).any():
+        values = values[~np.isnan(values)]
+    n = values.size
+    if n == 0:
+        return np.nan
+    k = n // 2
+    part = np.partition(values, k)
+    if n % 2:
+        return float(part[k])
+    # Everything left of the k-th element is <= it, so its max is the
+    # other middle value
+    return float((part[:k].max() + part[k]) / 2)
+
+
+def _time_of_day(value: time) -> np.timedelta64:
+    """Offset of a wall-clock time from midnight."""
+    return np.timedelta64(
+        ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000
+        + value.microsecond,
+        "us",
+    )
+
+
+def _aligned_pair(common: pd.DataFrame, col: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Float64 arrays of col from both sides of a suffixed inner join.
+
+    Both arrays are empty when the join does not have the column.
+    """
+    if f"{col}_1" not in common.columns:
+        return np.empty(0), np.empty(0)
+    return (
+        common[f"{col}_1"].to_numpy(dtype=np.float64, na_value=np.nan),
+        common[f"{col}_2"].to_numpy(dtype=np.float64, na_value=np.nan),
+    )
+
+
+def _relative_change(values: np.ndarray) -> np.ndarray:
+    """
+    Absolute relative change of each value (or row) from the previous one.
+
+    Division by a zero or NaN previous value gives inf or NaN, without a
+    warning; NaN never exceeds a threshold.
+    """
+    change = values[1:] - values[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(change, values[:-1], out=change)
+    return np.abs(change, out=change)
+
+
+def _intern_symbol(symbol: Any) -> Any:
+    """Intern a symbol string so every issue for it shares one object."""
+    if isinstance(symbol, str):
+        # str() turns subclasses such as numpy.str_ into plain str
+        return sys.intern(str(symbol))
+    return symbol
+
+
+def _lowercase_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shallow copy of df with lowercase column labels.
+
+    Multi-level columns (Yahoo Finance format) are flattened to their first
+    level (the price names). The copy shares the data with df.
+    """
+    normalized = df.copy(deep=False)
+    if isinstance(df.columns, pd.MultiIndex):
+        normalized.columns = [
+            col[0].lower() if isinstance(col, tuple) else str(col).lower()
+            for col in df.columns
+        ]
+    else:
+        normalized.columns = [str(col).lower() for col in df.columns]
+    return normalized
+
+
+def _symbol_runs(
+    df_work: pd.DataFrame, symbol_column: str, date_column: str
+) -> tuple[list, np.ndarray, np.ndarray, np.ndarray, pd.Index]:
+    """
+    Order the rows of a long frame so every symbol is one run in date order.
+
+    Args:
+        df_work: Long frame with lowercase column labels
+        symbol_column: Column holding the symbol
+        date_column: Column holding the bar date; the index is used when
+            there is no such column
+
+    Returns:
+        Tuple of (symbols in order of first appearance, row order with the
+        rows without a symbol dropped, start and length of each symbol's
+        run in that order, the dates in that order)
+    """
+    codes, symbols = pd.factorize(df_work[symbol_column.lower()])
+    symbols = [_intern_symbol(symbol) for symbol in symbols]
+
+    if date_column.lower() in df_work.columns:
+        dates = pd.Index(df_work[date_column.lower()])
+    else:
+        dates = df_work.index
+    sort_key = dates
+    if isinstance(dates, pd.DatetimeIndex) and dates.tz is not None:
+        # Sort by instant; tz-aware to_numpy() would give Timestamp objects
+        sort_key = dates.tz_convert("UTC").tz_localize(None)
+
+    # Rows without a symbol (code -1) sort first and are dropped
+    order = np.lexsort((sort_key.to_numpy(), codes))
+    order = order[codes[order] >= 0]
+    codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[starts, codes.size])
+    return symbols, order, starts, sizes, dates[order]
+
+
 def validate_data(
     df: pd.DataFrame,
     symbol: str = "UNKNOWN",
@@ -98,15 +454,7 @@ def validate_data(
         - message: Description of validation results
     """
     # Convert source string to DataSource enum
-    data_source = DataSource.UNKNOWN
-    if source.lower() == "yahoo" or source.lower() == "yfinance":
-        data_source = DataSource.YAHOO_FINANCE
-    elif source.lower() == "kite" or source.lower() == "kiteconnect":
-        data_source = DataSource.KITECONNECT
-    elif source.lower() == "nse":
-        data_source = DataSource.NSE_OFFICIAL
-    elif source.lower() == "bse":
-        data_source = DataSource.BSE_OFFICIAL
+    data_source = _SOURCE_MAP.get(source.lower(), DataSource.UNKNOWN)
 
     # Initialize validator
     validator = MarketDataValidator(strict_mode=strict)
@@ -148,6 +496,11 @@ class MarketDataValidator:
             "start": time(9, 15),  # 9:15 AM IST
             "end": time(15, 30),  # 3:30 PM IST
         }
+        # Offsets from midnight, computed once for validate_against_market_hours
+        self._market_hours_bounds = (
+            _time_of_day(self.indian_market_hours["start"]),
+            _time_of_day(self.indian_market_hours["end"]),
+        )
 
         # Price range limits for Indian stocks (reasonable bounds)
         self.price_limits = {
@@ -169,6 +522,7 @@ class MarketDataValidator:
         df: pd.DataFrame,
         symbol: str,
         data_source: DataSource = DataSource.UNKNOWN,
+        _normalized: Optional[pd.DataFrame] = None,
     ) -> ValidationResult:
         """
         Validate basic DataFrame structure and required columns.
@@ -177,11 +531,13 @@ class MarketDataValidator:
             df: Input DataFrame
             symbol: Stock symbol being validated
             data_source: Source of the data
+            _normalized: _lowercase_columns(df), when the caller already has it
 
         Returns:
             ValidationResult with structure validation results
         """
         issues = []
+        now = datetime.now()
 
         # Check if DataFrame is empty
         if df.empty:
@@ -191,23 +547,14 @@ class MarketDataValidator:
                     issue_type="empty_dataframe",
                     severity=ValidationSeverity.CRITICAL,
                     message="DataFrame is empty",
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     data_source=data_source,
                     suggested_action="Check data source connectivity and symbol validity",
                 )
             )
             return ValidationResult(is_valid=False, issues=issues)
 
-        # Handle multi-level columns (Yahoo Finance format)
-        df_check = df.copy()
-        if isinstance(df.columns, pd.MultiIndex):
-            # Flatten multi-level columns by taking the first level (price names)
-            df_check.columns = [
-                col[0].lower() if isinstance(col, tuple) else str(col).lower()
-                for col in df.columns
-            ]
-        else:
-            df_check.columns = [str(col).lower() for col in df.columns]
+        df_check = _normalized if _normalized is not None else _lowercase_columns(df)
 
         # Required columns for OHLCV data
         required_columns = ["open", "high", "low", "close", "volume"]
@@ -221,8 +568,8 @@ class MarketDataValidator:
                     symbol=symbol,
                     issue_type="missing_columns",
                     severity=ValidationSeverity.CRITICAL,
-                    message="Missing required columns: {missing_columns}",
-                    timestamp=datetime.now(),
+                    message=f"Missing required columns: {missing_columns}",
+                    timestamp=now,
                     data_source=data_source,
                     suggested_action="Ensure data source provides complete OHLCV data",
                 )
@@ -239,7 +586,7 @@ class MarketDataValidator:
                     issue_type="missing_date",
                     severity=ValidationSeverity.ERROR,
                     message="No date index or date column found",
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     data_source=data_source,
                     suggested_action="Ensure data has proper date indexing",
                 )
@@ -254,16 +601,14 @@ class MarketDataValidator:
                         symbol=symbol,
                         issue_type="invalid_data_type",
                         severity=ValidationSeverity.WARNING,
-                        message="Column {col} is not numeric: {df[col].dtype}",
-                        timestamp=datetime.now(),
+                        message=f"Column {col} is not numeric: {df[col].dtype}",
+                        timestamp=now,
                         data_source=data_source,
-                        suggested_action="Convert {col} to numeric format",
+                        suggested_action=f"Convert {col} to numeric format",
                     )
                 )
 
-        is_valid = all(
-            issue.severity != ValidationSeverity.CRITICAL for issue in issues
-        )
+        is_valid = not _has_severity(issues, ValidationSeverity.CRITICAL)
         return ValidationResult(is_valid=is_valid, issues=issues)
 
     def validate_price_data(
@@ -271,6 +616,7 @@ class MarketDataValidator:
         df: pd.DataFrame,
         symbol: str,
         data_source: DataSource = DataSource.UNKNOWN,
+        _normalized: Optional[pd.DataFrame] = None,
     ) -> ValidationResult:
         """
         Validate price data for anomalies and inconsistencies.
@@ -279,28 +625,21 @@ class MarketDataValidator:
             df: DataFrame with OHLCV data
             symbol: Stock symbol
             data_source: Source of the data
+            _normalized: _lowercase_columns(df), when the caller already has it
 
         Returns:
             ValidationResult with price validation results
         """
         issues = []
+        now = datetime.now()
 
         if df.empty:
             return ValidationResult(is_valid=False, issues=[])
 
-        # Handle multi-level columns (Yahoo Finance format)
-        df_work = df.copy()
-        if isinstance(df.columns, pd.MultiIndex):
-            # Flatten multi-level columns by taking the first level (price names)
-            df_work.columns = [
-                col[0].lower() if isinstance(col, tuple) else str(col).lower()
-                for col in df.columns
-            ]
-        else:
-            df_work.columns = [str(col).lower() for col in df.columns]
+        df_work = _normalized if _normalized is not None else _lowercase_columns(df)
 
         # Ensure required columns exist
-        required_cols = ["open", "high", "low", "close"]
+        required_cols = list(_PRICE_COLUMNS)
         missing_cols = [col for col in required_cols if col not in df_work.columns]
         if missing_cols:
             issues.append(
@@ -308,192 +647,484 @@ class MarketDataValidator:
                     symbol=symbol,
                     issue_type="missing_price_columns",
                     severity=ValidationSeverity.CRITICAL,
-                    message="Missing price columns: {missing_cols}",
-                    timestamp=datetime.now(),
+                    message=f"Missing price columns: {missing_cols}",
+                    timestamp=now,
                     data_source=data_source,
                 )
             )
             return ValidationResult(is_valid=False, issues=issues)
 
+        # Count every price and volume issue in one scan of a NumPy block
+        # instead of building a filtered DataFrame per check
+        prices = df_work[required_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        volume = np.empty(0)
+        volume_limit = np.inf
+        if "volume" in df.columns:
+            volume = df_work["volume"].to_numpy(dtype=np.float64, na_value=np.nan)
+            # Check for suspiciously high volume (>100x median)
+            if len(df_work) > 10:  # Need enough data for median
+                median_volume = _median(volume)
+                if median_volume > 0:
+                    volume_limit = median_volume * 100
+
+        counts = _price_issue_counts(
+            prices,
+            volume,
+            self.price_limits["min_price"],
+            self.price_limits["max_price"],
+            volume_limit,
+        ).tolist()
+
+        # Daily price change, on the close array sorted by date
+        extreme_changes = 0
+        if len(df_work) > 1:
+            close_series = df_work["close"]
+            if not close_series.index.is_monotonic_increasing:
+                close_series = close_series.sort_index()
+            close = close_series.to_numpy(dtype=np.float64, na_value=np.nan)
+            extreme_changes = int(
+                np.count_nonzero(
+                    _relative_change(close) > self.price_limits["max_daily_change"]
+                )
+            )
+
+        issues.extend(
+            self._price_issues(counts, extreme_changes, symbol, data_source, now)
+        )
+
+        # None of the checks change values, so the lowercased frame is
+        # returned as is rather than a deep copy of it
+        is_valid = not _has_severity(issues, ValidationSeverity.CRITICAL)
+        return ValidationResult(is_valid=is_valid, issues=issues, cleaned_data=df_work)
+
+    def validate_price_batch(
+        self,
+        df_long: pd.DataFrame,
+        symbol_column: str = "symbol",
+        date_column: str = "date",
+        data_source: DataSource = DataSource.UNKNOWN,
+    ) -> dict[str, ValidationResult]:
+        """
+        Run the validate_price_data checks for many symbols at once.
+
+        Takes a long-format frame with one row per symbol and bar, as read
+        from Parquet, and counts the issues of every symbol in a few
+        vectorized passes over the whole frame instead of one
+        validate_price_data call per symbol.
+
+        Args:
+            df_long: Frame with a symbol column and OHLC(V) columns
+            symbol_column: Column holding the symbol
+            date_column: Column holding the bar date; the index is used when
+                there is no such column
+            data_source: Source of the data
+
+        Returns:
+            Dict mapping each symbol to its ValidationResult. cleaned_data is
+            not set, so the frame is never split per symbol.
+        """
+        now = datetime.now()
+        df_work = _lowercase_columns(df_long)
+        symbols, order, starts, sizes, _ = _symbol_runs(
+            df_work, symbol_column, date_column
+        )
+        if not order.size:
+            return {}
+
+        missing_cols = [col for col in _PRICE_COLUMNS if col not in df_work.columns]
+        if missing_cols:
+            return {
+                symbol: ValidationResult(
+                    is_valid=False,
+                    issues=[
+                        ValidationIssue(
+                            symbol=symbol,
+                            issue_type="missing_price_columns",
+                            severity=ValidationSeverity.CRITICAL,
+                            message=f"Missing price columns: {missing_cols}",
+                            timestamp=now,
+                            data_source=data_source,
+                        )
+                    ],
+                )
+                for symbol in symbols
+            }
+
+        prices = df_work[list(_PRICE_COLUMNS)].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )[order]
+        if "volume" in df_work.columns:
+            volume = df_work["volume"].to_numpy(dtype=np.float64, na_value=np.nan)
+            volume = volume[order]
+        else:
+            volume = np.full(order.size, np.nan)
+
+        price_issues = self._price_batch_issues(
+            prices, volume, starts, sizes, symbols, data_source, now
+        )
+        return {
+            symbol: ValidationResult(
+                is_valid=not _has_severity(issues, ValidationSeverity.CRITICAL),
+                issues=issues,
+            )
+            for symbol, issues in zip(symbols, price_issues)
+        }
+
+    def _price_batch_issues(
+        self,
+        prices: np.ndarray,
+        volume: np.ndarray,
+        starts: np.ndarray,
+        sizes: np.ndarray,
+        symbols: list,
+        data_source: DataSource,
+        now: datetime,
+    ) -> list[list[ValidationIssue]]:
+        """
+        Run the price checks over the symbol runs of a sorted long frame.
+
+        Args:
+            prices: Float64 open, high, low and close, in _symbol_runs order
+            volume: Float64 volume in the same order, NaN when there is none
+            starts: Start of each symbol's run
+            sizes: Length of each symbol's run
+            symbols: Symbol of each run
+            data_source: Source of the data
+            now: Timestamp for the issues
+
+        Returns:
+            The validate_price_data issues of each symbol
+        """
+        # 100x median volume per symbol, for symbols with more than 10 bars
+        medians = np.array([_median(run) for run in np.split(volume, starts[1:])])
+        with np.errstate(invalid="ignore"):
+            limits = np.where((sizes > 10) & (medians > 0), medians * 100, np.inf)
+        volume_limit = np.repeat(limits, sizes)
+
+        # The first bar of a symbol has no previous close
+        open_, high, low, close = prices.T
+        extreme_change = np.zeros(len(prices), dtype=bool)
+        extreme_change[1:] = (
+            _relative_change(close) > self.price_limits["max_daily_change"]
+        )
+        extreme_change[starts] = False
+
+        # Same layout as _price_issue_counts, plus the daily changes, one row
+        # per check so each reduceat over the symbol runs reads contiguous bytes
+        price_t = prices.T
+        checks = np.vstack(
+            [
+                price_t < 0,
+                price_t < self.price_limits["min_price"],
+                price_t > self.price_limits["max_price"],
+                high < open_,
+                high < close,
+                low > open_,
+                low > close,
+                volume < 0,
+                volume > volume_limit,
+                extreme_change,
+            ]
+        )
+        counts = np.add.reduceat(checks.view(np.int8), starts, axis=1, dtype=np.int32).T
+
+        return [
+            self._price_issues(row[:18], row[18], symbol, data_source, now)
+            for symbol, row in zip(symbols, counts.tolist())
+        ]
+
+    def _price_issues(
+        self,
+        counts: list[int],
+        extreme_changes: int,
+        symbol: str,
+        data_source: DataSource,
+        now: datetime,
+    ) -> list[ValidationIssue]:
+        """
+        Turn the counts of the price checks into issues.
+
+        Args:
+            counts: The 18 counts returned by _price_issue_counts
+            extreme_changes: Number of daily changes above max_daily_change
+            symbol: Stock symbol
+            data_source: Source of the data
+            now: Timestamp for the issues
+
+        Returns:
+            List of issues, one per non-zero count
+        """
+        issues = []
+        (
+            high_lt_open,
+            high_lt_close,
+            low_gt_open,
+            low_gt_close,
+            negative_volume,
+            high_volume,
+        ) = counts[12:]
+
         # 1. Basic price validations
-        for col in required_cols:
+        for col, negative_count, low_count, high_count in zip(
+            _PRICE_COLUMNS, counts[0:4], counts[4:8], counts[8:12]
+        ):
             # Check for negative prices
-            negative_prices = df_work[df_work[col] < 0]
-            if not negative_prices.empty:
+            if negative_count:
                 issues.append(
                     ValidationIssue(
                         symbol=symbol,
                         issue_type="negative_prices",
                         severity=ValidationSeverity.ERROR,
-                        message="Found {len(negative_prices)} negative {col} prices",
-                        timestamp=datetime.now(),
+                        message=f"Found {negative_count} negative {col} prices",
+                        timestamp=now,
                         data_source=data_source,
-                        affected_rows=len(negative_prices),
-                        suggested_action="Remove or interpolate negative {col} values",
+                        affected_rows=negative_count,
+                        suggested_action=f"Remove or interpolate negative {col} values",
                     )
                 )
 
             # Check for extremely low prices
-            low_prices = df_work[df_work[col] < self.price_limits["min_price"]]
-            if not low_prices.empty:
+            if low_count:
                 issues.append(
                     ValidationIssue(
                         symbol=symbol,
                         issue_type="extremely_low_prices",
                         severity=ValidationSeverity.WARNING,
-                        message="Found {len(low_prices)} {col} prices below ₹{self.price_limits['min_price']}",
-                        timestamp=datetime.now(),
+                        message=f"Found {low_count} {col} prices below ₹{self.price_limits['min_price']}",
+                        timestamp=now,
                         data_source=data_source,
-                        affected_rows=len(low_prices),
+                        affected_rows=low_count,
                     )
                 )
 
             # Check for extremely high prices
-            high_prices = df_work[df_work[col] > self.price_limits["max_price"]]
-            if not high_prices.empty:
+            if high_count:
                 issues.append(
                     ValidationIssue(
                         symbol=symbol,
                         issue_type="extremely_high_prices",
                         severity=ValidationSeverity.WARNING,
-                        message="Found {len(high_prices)} {col} prices above ₹{self.price_limits['max_price']}",
-                        timestamp=datetime.now(),
+                        message=f"Found {high_count} {col} prices above ₹{self.price_limits['max_price']}",
+                        timestamp=now,
                         data_source=data_source,
-                        affected_rows=len(high_prices),
+                        affected_rows=high_count,
                     )
                 )
 
         # 2. OHLC consistency checks
-        df_clean = df_work.copy()
-
         # High should be >= Open, Close
-        high_low_open = df_clean[df_clean["high"] < df_clean["open"]]
-        if not high_low_open.empty:
+        if high_lt_open:
             issues.append(
                 ValidationIssue(
                     symbol=symbol,
                     issue_type="high_less_than_open",
                     severity=ValidationSeverity.ERROR,
-                    message="Found {len(high_low_open)} records where High < Open",
-                    timestamp=datetime.now(),
+                    message=f"Found {high_lt_open} records where High < Open",
+                    timestamp=now,
                     data_source=data_source,
-                    affected_rows=len(high_low_open),
+                    affected_rows=high_lt_open,
                     suggested_action="Fix OHLC data inconsistencies",
                 )
             )
 
-        high_low_close = df_clean[df_clean["high"] < df_clean["close"]]
-        if not high_low_close.empty:
+        if high_lt_close:
             issues.append(
                 ValidationIssue(
                     symbol=symbol,
                     issue_type="high_less_than_close",
                     severity=ValidationSeverity.ERROR,
-                    message="Found {len(high_low_close)} records where High < Close",
-                    timestamp=datetime.now(),
+                    message=f"Found {high_lt_close} records where High < Close",
+                    timestamp=now,
                     data_source=data_source,
-                    affected_rows=len(high_low_close),
+                    affected_rows=high_lt_close,
                 )
             )
 
         # Low should be <= Open, Close
-        low_high_open = df_clean[df_clean["low"] > df_clean["open"]]
-        if not low_high_open.empty:
+        if low_gt_open:
             issues.append(
                 ValidationIssue(
                     symbol=symbol,
                     issue_type="low_greater_than_open",
                     severity=ValidationSeverity.ERROR,
-                    message="Found {len(low_high_open)} records where Low > Open",
-                    timestamp=datetime.now(),
+                    message=f"Found {low_gt_open} records where Low > Open",
+                    timestamp=now,
                     data_source=data_source,
-                    affected_rows=len(low_high_open),
+                    affected_rows=low_gt_open,
                 )
             )
 
-        low_high_close = df_clean[df_clean["low"] > df_clean["close"]]
-        if not low_high_close.empty:
+        if low_gt_close:
             issues.append(
                 ValidationIssue(
                     symbol=symbol,
                     issue_type="low_greater_than_close",
                     severity=ValidationSeverity.ERROR,
-                    message="Found {len(low_high_close)} records where Low > Close",
-                    timestamp=datetime.now(),
+                    message=f"Found {low_gt_close} records where Low > Close",
+                    timestamp=now,
                     data_source=data_source,
-                    affected_rows=len(low_high_close),
+                    affected_rows=low_gt_close,
                 )
             )
 
         # 3. Volume validation
-        if "volume" in df.columns:
-            # Check for negative volume
-            negative_volume = df_clean[df_clean["volume"] < 0]
-            if not negative_volume.empty:
-                issues.append(
-                    ValidationIssue(
-                        symbol=symbol,
-                        issue_type="negative_volume",
-                        severity=ValidationSeverity.ERROR,
-                        message="Found {len(negative_volume)} negative volume records",
-                        timestamp=datetime.now(),
-                        data_source=data_source,
-                        affected_rows=len(negative_volume),
-                    )
+        # Check for negative volume
+        if negative_volume:
+            issues.append(
+                ValidationIssue(
+                    symbol=symbol,
+                    issue_type="negative_volume",
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Found {negative_volume} negative volume records",
+                    timestamp=now,
+                    data_source=data_source,
+                    affected_rows=negative_volume,
                 )
+            )
 
-            # Check for suspiciously high volume (>100x median)
-            if len(df_clean) > 10:  # Need enough data for median
-                median_volume = df_clean["volume"].median()
-                if median_volume > 0:
-                    high_volume = df_clean[df_clean["volume"] > median_volume * 100]
-                    if not high_volume.empty:
-                        issues.append(
-                            ValidationIssue(
-                                symbol=symbol,
-                                issue_type="suspiciously_high_volume",
-                                severity=ValidationSeverity.WARNING,
-                                message="Found {len(high_volume)} records with volume >100x median",
-                                timestamp=datetime.now(),
-                                data_source=data_source,
-                                affected_rows=len(high_volume),
-                            )
-                        )
+        # Check for suspiciously high volume (>100x median)
+        if high_volume:
+            issues.append(
+                ValidationIssue(
+                    symbol=symbol,
+                    issue_type="suspiciously_high_volume",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Found {high_volume} records with volume >100x median",
+                    timestamp=now,
+                    data_source=data_source,
+                    affected_rows=high_volume,
+                )
+            )
 
         # 4. Daily price change validation
-        if len(df_clean) > 1:
-            df_clean_sorted = (
-                df_clean.sort_index()
-                if hasattr(df_clean.index, "sort_values")
-                else df_clean
+        if extreme_changes:
+            issues.append(
+                ValidationIssue(
+                    symbol=symbol,
+                    issue_type="extreme_daily_change",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Found {extreme_changes} days with >{self.price_limits['max_daily_change']:.0%} price change",
+                    timestamp=now,
+                    data_source=data_source,
+                    affected_rows=extreme_changes,
+                    suggested_action="Check for stock splits, bonuses, or data errors",
+                )
             )
-            df_clean_sorted["prev_close"] = df_clean_sorted["close"].shift(1)
-            df_clean_sorted["daily_change"] = (
-                df_clean_sorted["close"] - df_clean_sorted["prev_close"]
-            ) / df_clean_sorted["prev_close"]
-
-            extreme_changes = df_clean_sorted[
-                abs(df_clean_sorted["daily_change"])
-                > self.price_limits["max_daily_change"]
-            ]
-            if not extreme_changes.empty:
+
+        return issues
+
+    def _missing_issues(
+        self,
+        missing_counts: list[tuple[str, int]],
+        n_rows: int,
+        large_gaps: int,
+        symbol: str,
+        data_source: DataSource,
+        now: datetime,
+    ) -> list[ValidationIssue]:
+        """
+        Turn the counts of the missing-data checks into issues.
+
+        Args:
+            missing_counts: (column, number of missing values) per price column
+            n_rows: Number of rows checked
+            large_gaps: Number of date gaps of more than 5 days
+            symbol: Stock symbol
+            data_source: Source of the data
+            now: Timestamp for the issues
+
+        Returns:
+            List of issues, one per non-zero count
+        """
+        issues = []
+        for col, missing_count in missing_counts:
+            if missing_count > 0:
+                missing_pct = (missing_count / n_rows) * 100
+                severity = (
+                    ValidationSeverity.ERROR
+                    if missing_pct > 10
+                    else ValidationSeverity.WARNING
+                )
+
                 issues.append(
                     ValidationIssue(
                         symbol=symbol,
-                        issue_type="extreme_daily_change",
-                        severity=ValidationSeverity.WARNING,
-                        message="Found {len(extreme_changes)} days with >20% price change",
-                        timestamp=datetime.now(),
+                        issue_type="missing_price_data",
+                        severity=severity,
+                        message=f"Missing {missing_count} ({missing_pct:.1f}%) {col} values",
+                        timestamp=now,
                         data_source=data_source,
-                        affected_rows=len(extreme_changes),
-                        suggested_action="Check for stock splits, bonuses, or data errors",
+                        affected_rows=missing_count,
+                        suggested_action="Interpolate or fetch missing data",
                     )
                 )
 
-        is_valid = all(
-            issue.severity != ValidationSeverity.CRITICAL for issue in issues
-        )
-        return ValidationResult(is_valid=is_valid, issues=issues, cleaned_data=df_clean)
+        if large_gaps:
+            issues.append(
+                ValidationIssue(
+                    symbol=symbol,
+                    issue_type="date_gaps",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Found {large_gaps} date gaps >5 days",
+                    timestamp=now,
+                    data_source=data_source,
+                    affected_rows=large_gaps,
+                    suggested_action="Check for holidays or data source gaps",
+                )
+            )
+
+        return issues
+
+    def _market_hours_issues(
+        self,
+        outside_hours: int,
+        weekend_data: int,
+        symbol: str,
+        data_source: DataSource,
+        now: datetime,
+    ) -> list[ValidationIssue]:
+        """
+        Turn the counts of the intraday market-hours checks into issues.
+
+        Args:
+            outside_hours: Number of bars outside market hours
+            weekend_data: Number of bars on a Saturday or Sunday
+            symbol: Stock symbol
+            data_source: Source of the data
+            now: Timestamp for the issues
+
+        Returns:
+            List of issues, one per non-zero count
+        """
+        issues = []
+        if outside_hours:
+            issues.append(
+                ValidationIssue(
+                    symbol=symbol,
+                    issue_type="outside_market_hours",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Found {outside_hours} records outside market hours (9:15-15:30 IST)",
+                    timestamp=now,
+                    data_source=data_source,
+                    affected_rows=outside_hours,
+                    suggested_action="Filter data to market hours only",
+                )
+            )
+
+        if weekend_data:
+            issues.append(
+                ValidationIssue(
+                    symbol=symbol,
+                    issue_type="weekend_data",
+                    severity=ValidationSeverity.INFO,
+                    message=f"Found {weekend_data} weekend records",
+                    timestamp=now,
+                    data_source=data_source,
+                    affected_rows=weekend_data,
+                )
+            )
+
+        return issues
 
     def validate_missing_data(
         self,
@@ -513,58 +1144,33 @@ class MarketDataValidator:
             ValidationResult with missing data analysis
         """
         issues = []
+        now = datetime.now()
 
         if df.empty:
             return ValidationResult(is_valid=False, issues=[])
 
         # Check for missing values in critical columns
-        critical_columns = ["open", "high", "low", "close"]
-        for col in critical_columns:
-            if col in df.columns:
-                missing_count = df[col].isna().sum()
-                if missing_count > 0:
-                    missing_pct = (missing_count / len(df)) * 100
-                    severity = (
-                        ValidationSeverity.ERROR
-                        if missing_pct > 10
-                        else ValidationSeverity.WARNING
-                    )
-
-                    issues.append(
-                        ValidationIssue(
-                            symbol=symbol,
-                            issue_type="missing_price_data",
-                            severity=severity,
-                            message="Missing {missing_count} ({missing_pct:.1f}%) {col} values",
-                            timestamp=datetime.now(),
-                            data_source=data_source,
-                            affected_rows=missing_count,
-                            suggested_action="Interpolate or fetch missing data",
-                        )
-                    )
+        missing_counts = [
+            (col, _missing_count(df[col]))
+            for col in _PRICE_COLUMNS
+            if col in df.columns
+        ]
 
         # Check for date gaps (if data has date index)
+        large_gaps = 0
         if isinstance(df.index, pd.DatetimeIndex) and len(df) > 1:
-            date_diff = df.index.to_series().diff().dt.days
-            # Look for gaps > 5 days (accounting for weekends)
-            large_gaps = date_diff[date_diff > 5]
-            if not large_gaps.empty:
-                issues.append(
-                    ValidationIssue(
-                        symbol=symbol,
-                        issue_type="date_gaps",
-                        severity=ValidationSeverity.WARNING,
-                        message="Found {len(large_gaps)} date gaps >5 days",
-                        timestamp=datetime.now(),
-                        data_source=data_source,
-                        affected_rows=len(large_gaps),
-                        suggested_action="Check for holidays or data source gaps",
-                    )
-                )
-
-        is_valid = all(
-            issue.severity != ValidationSeverity.CRITICAL for issue in issues
+            date_diff = np.diff(df.index.to_numpy())
+            # Look for gaps > 5 days (accounting for weekends). In whole days,
+            # as .dt.days counts them, that is at least 6 days; NaT never is
+            large_gaps = int(np.count_nonzero(date_diff >= np.timedelta64(6, "D")))
+
+        issues.extend(
+            self._missing_issues(
+                missing_counts, len(df), large_gaps, symbol, data_source, now
+            )
         )
+
+        is_valid = not _has_severity(issues, ValidationSeverity.CRITICAL)
         return ValidationResult(is_valid=is_valid, issues=issues)
 
     def validate_against_market_hours(
@@ -585,6 +1191,7 @@ class MarketDataValidator:
             ValidationResult with market hours validation
         """
         issues = []
+        now = datetime.now()
 
         if not isinstance(df.index, pd.DatetimeIndex):
             # Skip if no datetime index
@@ -592,48 +1199,41 @@ class MarketDataValidator:
 
         # Check for data outside market hours (only for intraday data)
         if len(df) > 0:
+            # Work on wall-clock time as integer offsets from the epoch in
+            # the index's own unit; NaT drops out of every count below
+            wall_clock = df.index.tz_localize(None) if df.index.tz else df.index
+            unit = np.datetime_data(wall_clock.dtype)[0]
+            per_day = np.timedelta64(1, "D") // np.timedelta64(1, unit)
+            stamps = wall_clock.asi8
+            if wall_clock.hasnans:
+                stamps = stamps[~wall_clock.isna()]
+            days = stamps // per_day
+
             # Detect if this is intraday data (multiple records per day)
-            dates = df.index.date
-            unique_dates = pd.Series(dates).nunique()
+            unique_dates = len(pd.unique(days))
             is_intraday = len(df) > unique_dates * 2  # More than 2 records per day
 
             if is_intraday:
                 # Check market hours for intraday data
-                market_start = self.indian_market_hours["start"]
-                market_end = self.indian_market_hours["end"]
-
-                outside_hours = df[
-                    (df.index.time < market_start) | (df.index.time > market_end)
-                ]
+                market_start, market_end = self._market_hours_bounds
 
-                if not outside_hours.empty:
-                    issues.append(
-                        ValidationIssue(
-                            symbol=symbol,
-                            issue_type="outside_market_hours",
-                            severity=ValidationSeverity.WARNING,
-                            message="Found {len(outside_hours)} records outside market hours (9:15-15:30 IST)",
-                            timestamp=datetime.now(),
-                            data_source=data_source,
-                            affected_rows=len(outside_hours),
-                            suggested_action="Filter data to market hours only",
-                        )
+                time_of_day = (stamps - days * per_day).view(f"m8[{unit}]")
+                outside_hours = int(
+                    np.count_nonzero(
+                        (time_of_day < market_start) | (time_of_day > market_end)
                     )
+                )
 
                 # Check for weekend data
-                weekend_data = df[df.index.weekday >= 5]  # Saturday=5, Sunday=6
-                if not weekend_data.empty:
-                    issues.append(
-                        ValidationIssue(
-                            symbol=symbol,
-                            issue_type="weekend_data",
-                            severity=ValidationSeverity.INFO,
-                            message="Found {len(weekend_data)} weekend records",
-                            timestamp=datetime.now(),
-                            data_source=data_source,
-                            affected_rows=len(weekend_data),
-                        )
+                # Saturday=5, Sunday=6
+                # (1970-01-01 was a Thursday, weekday 3)
+                weekend_data = int(np.count_nonzero((days + 3) % 7 >= 5))
+
+                issues.extend(
+                    self._market_hours_issues(
+                        outside_hours, weekend_data, symbol, data_source, now
                     )
+                )
 
         is_valid = True  # Market hours validation is usually not critical
         return ValidationResult(is_valid=is_valid, issues=issues)
@@ -662,6 +1262,7 @@ class MarketDataValidator:
             ValidationResult with cross-validation results
         """
         issues = []
+        now = datetime.now()
 
         if df1.empty or df2.empty:
             issues.append(
@@ -670,7 +1271,7 @@ class MarketDataValidator:
                     issue_type="insufficient_data_for_cross_validation",
                     severity=ValidationSeverity.WARNING,
                     message="One or both data sources are empty",
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     data_source=DataSource.UNKNOWN,
                     suggested_action="Ensure both data sources have data for comparison",
                 )
@@ -681,72 +1282,69 @@ class MarketDataValidator:
         if isinstance(df1.index, pd.DatetimeIndex) and isinstance(
             df2.index, pd.DatetimeIndex
         ):
-            common_dates = df1.index.intersection(df2.index)
-            if len(common_dates) == 0:
+            # One inner join aligns the shared columns on the common dates
+            shared = [
+                col
+                for col in ("close", "volume")
+                if col in df1.columns and col in df2.columns
+            ]
+            common = df1[shared].join(
+                df2[shared], how="inner", lsuffix="_1", rsuffix="_2"
+            )
+            if len(common) == 0:
                 issues.append(
                     ValidationIssue(
                         symbol=symbol,
                         issue_type="no_common_dates",
                         severity=ValidationSeverity.ERROR,
                         message="No common dates between data sources",
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         data_source=DataSource.UNKNOWN,
                         suggested_action="Check date ranges and formatting",
                     )
                 )
                 return ValidationResult(is_valid=False, issues=issues)
 
-            df1_common = df1.loc[common_dates]
-            df2_common = df2.loc[common_dates]
+            # Volume can vary significantly, so use higher tolerance
+            volume_tolerance = 0.20  # 20%
+            close1, close2 = _aligned_pair(common, "close")
+            volume1, volume2 = _aligned_pair(common, "volume")
+            large_differences, avg_diff, large_vol_diff = _cross_source_diffs(
+                close1, close2, volume1, volume2, tolerance, volume_tolerance
+            )
 
             # Compare close prices (most important)
-            if "close" in df1_common.columns and "close" in df2_common.columns:
-                price_diff = (
-                    abs(df1_common["close"] - df2_common["close"]) / df1_common["close"]
-                )
-                large_differences = price_diff[price_diff > tolerance]
-
-                if not large_differences.empty:
-                    avg_diff = large_differences.mean() * 100
-                    issues.append(
-                        ValidationIssue(
-                            symbol=symbol,
-                            issue_type="price_discrepancy",
-                            severity=ValidationSeverity.WARNING,
-                            message="Found {len(large_differences)} days with >{tolerance*100}% price difference (avg: {avg_diff:.2f}%)",
-                            timestamp=datetime.now(),
-                            data_source=DataSource.UNKNOWN,
-                            affected_rows=len(large_differences),
-                            suggested_action="Investigate price differences between {source1.value} and {source2.value}",
-                        )
+            if large_differences:
+                avg_diff *= 100
+                issues.append(
+                    ValidationIssue(
+                        symbol=symbol,
+                        issue_type="price_discrepancy",
+                        severity=ValidationSeverity.WARNING,
+                        message=f"Found {large_differences} days with >{tolerance*100}% price difference (avg: {avg_diff:.2f}%)",
+                        timestamp=now,
+                        data_source=DataSource.UNKNOWN,
+                        affected_rows=large_differences,
+                        suggested_action=f"Investigate price differences between {source1.value} and {source2.value}",
                     )
+                )
 
             # Compare volumes if available
-            if "volume" in df1_common.columns and "volume" in df2_common.columns:
-                # Volume can vary significantly, so use higher tolerance
-                volume_tolerance = 0.20  # 20%
-                volume_diff = abs(df1_common["volume"] - df2_common["volume"]) / (
-                    df1_common["volume"] + 1
-                )  # +1 to avoid division by zero
-                large_vol_diff = volume_diff[volume_diff > volume_tolerance]
-
-                if not large_vol_diff.empty:
-                    issues.append(
-                        ValidationIssue(
-                            symbol=symbol,
-                            issue_type="volume_discrepancy",
-                            severity=ValidationSeverity.INFO,
-                            message="Found {len(large_vol_diff)} days with >{volume_tolerance*100}% volume difference",
-                            timestamp=datetime.now(),
-                            data_source=DataSource.UNKNOWN,
-                            affected_rows=len(large_vol_diff),
-                        )
+            if large_vol_diff:
+                issues.append(
+                    ValidationIssue(
+                        symbol=symbol,
+                        issue_type="volume_discrepancy",
+                        severity=ValidationSeverity.INFO,
+                        message=f"Found {large_vol_diff} days with >{volume_tolerance*100}% volume difference",
+                        timestamp=now,
+                        data_source=DataSource.UNKNOWN,
+                        affected_rows=large_vol_diff,
                     )
+                )
 
-        is_valid = all(
-            issue.severity
-            not in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]
-            for issue in issues
+        is_valid = not _has_severity(
+            issues, ValidationSeverity.ERROR, ValidationSeverity.CRITICAL
         )
         return ValidationResult(is_valid=is_valid, issues=issues)
 
@@ -771,82 +1369,122 @@ class MarketDataValidator:
         Returns:
             ValidationResult with comprehensive validation results
         """
+        # A nightly run can emit issues by the hundred thousand for a few
+        # hundred symbols; interning keeps one string per symbol among them
+        symbol = _intern_symbol(symbol)
         all_issues = []
-        cleaned_data = df.copy()
 
         logger.info(
-            "🔍 Starting comprehensive validation for {symbol} from {data_source.value}"
+            "🔍 Starting comprehensive validation for %s from %s",
+            symbol,
+            data_source.value,
         )
 
-        # 1. Structure validation
-        structure_result = self.validate_dataframe_structure(df, symbol, data_source)
+        # Lowercase the column labels once for the validators that need them
+        normalized = None if df.empty else _lowercase_columns(df)
+
+        # 1. Structure validation. Empty frames and frames missing required
+        # columns stop here, before the frame is copied or scanned
+        structure_result = self.validate_dataframe_structure(
+            df, symbol, data_source, _normalized=normalized
+        )
         all_issues.extend(structure_result.issues)
 
         if not structure_result.is_valid:
-            logger.error("❌ Structure validation failed for {symbol}")
+            logger.error("❌ Structure validation failed for %s", symbol)
             return ValidationResult(is_valid=False, issues=all_issues)
 
         # 2. Price data validation
-        price_result = self.validate_price_data(df, symbol, data_source)
+        price_result = self.validate_price_data(
+            df, symbol, data_source, _normalized=normalized
+        )
         all_issues.extend(price_result.issues)
-        if price_result.cleaned_data is not None:
-            cleaned_data = price_result.cleaned_data
-
-        # 3. Missing data validation
-        missing_result = self.validate_missing_data(cleaned_data, symbol, data_source)
-        all_issues.extend(missing_result.issues)
+        cleaned_data = (
+            price_result.cleaned_data if price_result.cleaned_data is not None else df
+        )
 
-        # 4. Market hours validation
-        hours_result = self.validate_against_market_hours(
-            cleaned_data, symbol, data_source
+        # Only the structure and price checks raise CRITICAL issues, and
+        # strict mode raises on those below, so the remaining checks cannot
+        # change the outcome and are skipped
+        doomed = self.strict_mode and _has_severity(
+            price_result.issues, ValidationSeverity.CRITICAL
         )
-        all_issues.extend(hours_result.issues)
+        if not doomed:
+            # 3. Missing data validation
+            missing_result = self.validate_missing_data(
+                cleaned_data, symbol, data_source
+            )
+            all_issues.extend(missing_result.issues)
 
-        # 5. Cross-validation if reference data provided
-        if reference_df is not None and reference_source is not None:
-            cross_result = self.cross_validate_sources(
-                cleaned_data, reference_df, symbol, data_source, reference_source
+            # 4. Market hours validation
+            hours_result = self.validate_against_market_hours(
+                cleaned_data, symbol, data_source
             )
-            all_issues.extend(cross_result.issues)
+            all_issues.extend(hours_result.issues)
 
-        # Determine overall validity
-        critical_issues = [
-            i for i in all_issues if i.severity == ValidationSeverity.CRITICAL
-        ]
-        error_issues = [i for i in all_issues if i.severity == ValidationSeverity.ERROR]
+            # 5. Cross-validation if reference data provided
+            if reference_df is not None and reference_source is not None:
+                cross_result = self.cross_validate_sources(
+                    cleaned_data, reference_df, symbol, data_source, reference_source
+                )
+                all_issues.extend(cross_result.issues)
 
-        is_valid = len(critical_issues) == 0 and (
-            not self.strict_mode or len(error_issues) == 0
+        return self._finish_validation(
+            all_issues, cleaned_data, len(cleaned_data), symbol, data_source
         )
 
+    def _finish_validation(
+        self,
+        all_issues: list[ValidationIssue],
+        cleaned_data: Optional[pd.DataFrame],
+        n_rows: int,
+        symbol: str,
+        data_source: DataSource,
+    ) -> ValidationResult:
+        """
+        Build the comprehensive_validation result from all the issues found.
+
+        Raises:
+            ValueError: In strict mode, when there are critical issues
+        """
+        # Determine overall validity from one count of the severities
+        severity_counts = Counter(issue.severity for issue in all_issues)
+        critical_count = severity_counts[ValidationSeverity.CRITICAL]
+        error_count = severity_counts[ValidationSeverity.ERROR]
+
+        is_valid = critical_count == 0 and (not self.strict_mode or error_count == 0)
+
         # Create validation summary
         validation_summary = {
             "total_issues": len(all_issues),
-            "critical_issues": len(critical_issues),
-            "error_issues": len(error_issues),
-            "warning_issues": len(
-                [i for i in all_issues if i.severity == ValidationSeverity.WARNING]
-            ),
-            "info_issues": len(
-                [i for i in all_issues if i.severity == ValidationSeverity.INFO]
-            ),
-            "data_rows": len(cleaned_data),
+            "critical_issues": critical_count,
+            "error_issues": error_count,
+            "warning_issues": severity_counts[ValidationSeverity.WARNING],
+            "info_issues": severity_counts[ValidationSeverity.INFO],
+            "data_rows": n_rows,
             "validation_timestamp": datetime.now(),
             "data_source": data_source.value,
             "symbol": symbol,
         }
 
         logger.info(
-            "✅ Validation complete for {symbol}: {validation_summary['total_issues']} issues found"
+            "✅ Validation complete for %s: %d issues found", symbol, len(all_issues)
         )
 
         if self.strict_mode and not is_valid:
-            error_msg = "Validation failed for {symbol}: {len(critical_issues)} critical, {len(error_issues)} error issues"
-            logger.error(error_msg)
-            if critical_issues:
-                raise ValueError(
-                    "Critical validation issues found: {[i.message for i in critical_issues]}"
+            logger.error(
+                "Validation failed for %s: %d critical, %d error issues",
+                symbol,
+                critical_count,
+                error_count,
+            )
+            if critical_count:
+                messages = ", ".join(
+                    i.message
+                    for i in all_issues
+                    if i.severity == ValidationSeverity.CRITICAL
                 )
+                raise ValueError(f"Critical validation issues found: {messages}")
 
         return ValidationResult(
             is_valid=is_valid,
@@ -855,8 +1493,215 @@ class MarketDataValidator:
             validation_summary=validation_summary,
         )
 
+    def comprehensive_validation_batch(
+        self,
+        df_long: pd.DataFrame,
+        data_source: DataSource = DataSource.UNKNOWN,
+        symbol_column: str = "symbol",
+        date_column: str = "date",
+    ) -> dict[str, ValidationResult]:
+        """
+        Run comprehensive_validation for many symbols at once.
+
+        Takes a long-format frame with one row per symbol and bar. The
+        structure check runs once, as every symbol shares the columns, and
+        the price, missing-data and market-hours checks run as vectorized
+        passes over the whole frame sorted into one run per symbol. Each
+        symbol gets the result comprehensive_validation gives for its rows
+        in date order, indexed by date_column. There is no reference data,
+        so no cross-source check.
+
+        Args:
+            df_long: Frame with a symbol column, a date column and OHLCV
+                columns
+            data_source: Source of the data
+            symbol_column: Column holding the symbol
+            date_column: Column holding the bar date; the index is used when
+                there is no such column
+
+        Returns:
+            Dict mapping each symbol to its ValidationResult. cleaned_data is
+            not set, so the frame is never split per symbol.
+
+        Raises:
+            ValueError: In strict mode, for the first symbol with critical
+                issues
+        """
+        now = datetime.now()
+        df_work = _lowercase_columns(df_long)
+        symbols, order, starts, sizes, dates = _symbol_runs(
+            df_work, symbol_column, date_column
+        )
+        if not order.size:
+            return {}
+
+        logger.info(
+            "🔍 Starting batch validation for %d symbols from %s",
+            len(symbols),
+            data_source.value,
+        )
+
+        # 1. Structure validation, on one row standing in for every symbol
+        sample = df_long.iloc[:1]
+        if date_column.lower() in df_work.columns:
+            position = df_work.columns.get_loc(date_column.lower())
+            sample = sample.set_index(df_long.columns[position])
+        structure_result = self.validate_dataframe_structure(sample, "", data_source)
+        if not structure_result.is_valid:
+            logger.error("❌ Structure validation failed for %d symbols", len(symbols))
+            return {
+                symbol: ValidationResult(
+                    is_valid=False,
+                    issues=[
+                        replace(issue, symbol=symbol)
+                        for issue in structure_result.issues
+                    ],
+                )
+                for symbol in symbols
+            }
+
+        # 2. Price data validation
+        prices = df_work[list(_PRICE_COLUMNS)].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )[order]
+        volume = df_work["volume"].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+        price_issues = self._price_batch_issues(
+            prices, volume, starts, sizes, symbols, data_source, now
+        )
+
+        # 3. Missing data validation
+        missing_counts = np.add.reduceat(
+            np.isnan(prices).T.view(np.int8), starts, axis=1, dtype=np.int32
+        ).T
+        n_groups = len(symbols)
+        large_gaps = np.zeros(n_groups, dtype=np.int64)
+        outside_hours = np.zeros(n_groups, dtype=np.int64)
+        weekend_data = np.zeros(n_groups, dtype=np.int64)
+
+        if isinstance(dates, pd.DatetimeIndex):
+            # Gaps between consecutive bars of a symbol, never across symbols
+            instants = dates.tz_convert("UTC") if dates.tz is not None else dates
+            gap = np.zeros(len(dates), dtype=bool)
+            gap[1:] = np.diff(instants.to_numpy()) >= np.timedelta64(6, "D")
+            gap[starts] = False
+            large_gaps = np.add.reduceat(gap.view(np.int8), starts, dtype=np.int32)
+
+            # 4. Market hours validation, on the wall clock as in
+            # validate_against_market_hours
+            wall_clock = dates.tz_localize(None) if dates.tz is not None else dates
+            unit = np.datetime_data(wall_clock.dtype)[0]
+            per_day = np.timedelta64(1, "D") // np.timedelta64(1, unit)
+            valid = ~wall_clock.isna()
+            stamps = wall_clock.asi8
+            days = stamps // per_day
+            time_of_day = (stamps - days * per_day).view(f"m8[{unit}]")
+            market_start, market_end = self._market_hours_bounds
+
+            # More than 2 records per day makes a symbol intraday
+            group = np.repeat(np.arange(n_groups), sizes)
+            unique_dates = (
+                pd.Series(days[valid])
+                .groupby(group[valid])
+                .nunique()
+                .reindex(range(n_groups), fill_value=0)
+                .to_numpy()
+            )
+            is_intraday = sizes > unique_dates * 2
+
+            outside = valid & (
+                (time_of_day < market_start) | (time_of_day > market_end)
+            )
+            # Saturday=5, Sunday=6 (1970-01-01 was a Thursday, weekday 3)
+            weekend = valid & ((days + 3) % 7 >= 5)
+            hours_counts = np.add.reduceat(
+                np.vstack([outside, weekend]).view(np.int8),
+                starts,
+                axis=1,
+                dtype=np.int32,
+            )
+            outside_hours = np.where(is_intraday, hours_counts[0], 0)
+            weekend_data = np.where(is_intraday, hours_counts[1], 0)
+
+        results = {}
+        for i, symbol in enumerate(symbols):
+            n_rows = int(sizes[i])
+            all_issues = [
+                replace(issue, symbol=symbol) for issue in structure_result.issues
+            ]
+            all_issues.extend(price_issues[i])
+
+            # Same short-circuit as comprehensive_validation
+            doomed = self.strict_mode and _has_severity(
+                price_issues[i], ValidationSeverity.CRITICAL
+            )
+            if not doomed:
+                all_issues.extend(
+                    self._missing_issues(
+                        list(zip(_PRICE_COLUMNS, missing_counts[i].tolist())),
+                        n_rows,
+                        int(large_gaps[i]),
+                        symbol,
+                        data_source,
+                        now,
+                    )
+                )
+                all_issues.extend(
+                    self._market_hours_issues(
+                        int(outside_hours[i]),
+                        int(weekend_data[i]),
+                        symbol,
+                        data_source,
+                        now,
+                    )
+                )
+
+            results[symbol] = self._finish_validation(
+                all_issues, None, n_rows, symbol, data_source
+            )
+        return results
+
+    def validate_many(
+        self,
+        frames: dict[str, pd.DataFrame],
+        data_source: DataSource = DataSource.UNKNOWN,
+        max_workers: Optional[int] = None,
+    ) -> dict[str, ValidationResult]:
+        """
+        Run comprehensive_validation on many symbols in a thread pool.
+
+        Symbols are independent and the validator keeps no per-call state,
+        so each frame is validated in a worker thread. The scans run in
+        NumPy (or numba), which release the GIL, so threads overlap.
+
+        Args:
+            frames: DataFrames keyed by symbol
+            data_source: Source of the data
+            max_workers: Number of threads; None uses all CPUs, 1 validates
+                in the calling thread
+
+        Returns:
+            ValidationResult per symbol, in the input order
+        """
+        items = list(frames.items())
+        n_workers = min(max_workers or os.cpu_count() or 1, len(items))
+
+        def validate(item: tuple[str, pd.DataFrame]) -> ValidationResult:
+            symbol, df = item
+            return self.comprehensive_validation(df, symbol, data_source)
+
+        if n_workers <= 1:
+            results = [validate(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(validate, items))
+
+        return {symbol: result for (symbol, _), result in zip(items, results)}
+
     def generate_validation_report(
-        self, results: list[ValidationResult], output_file: Optional[str] = None
+        self,
+        results: list[ValidationResult],
+        output_file: Optional[str] = None,
+        return_content: bool = True,
     ) -> str:
         """
         Generate a comprehensive validation report.
@@ -864,67 +1709,77 @@ class MarketDataValidator:
         Args:
             results: List of validation results
             output_file: Optional file path to save the report
+            return_content: With output_file, set to False to write the report
+                straight to the file without holding it in memory
 
         Returns:
-            String containing the validation report
+            String containing the validation report, or an empty string when
+            it was only written to output_file
         """
-        report_lines = []
-        report_lines.append("# Market Data Validation Report")
-        report_lines.append("Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("=" * 60)
+        if output_file and not return_content:
+            with open(output_file, "w") as f:
+                self._write_validation_report(results, f.write)
+            logger.info("Validation report saved to %s", output_file)
+            return ""
+
+        buf = io.StringIO()
+        self._write_validation_report(results, buf.write)
+        report_content = buf.getvalue()
+
+        if output_file:
+            with open(output_file, "w") as f:
+                f.write(report_content)
+            logger.info("Validation report saved to %s", output_file)
+
+        return report_content
+
+    def _write_validation_report(
+        self, results: list[ValidationResult], w: Callable[[str], Any]
+    ) -> None:
+        """Write the text of generate_validation_report through w."""
+        # Every line after the first is written with its leading newline, so
+        # the text matches a "\n".join of the lines
+        w("# Market Data Validation Report")
+        w(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        w("\n" + "=" * 60)
 
         total_symbols = len(results)
         valid_symbols = sum(1 for r in results if r.is_valid)
 
-        report_lines.append("\n## Summary")
-        report_lines.append("- Total symbols validated: {total_symbols}")
-        report_lines.append("- Valid symbols: {valid_symbols}")
-        report_lines.append("- Failed validation: {total_symbols - valid_symbols}")
-
-        # Issues by severity
-        all_issues = []
-        for result in results:
-            all_issues.extend(result.issues)
+        w("\n\n## Summary")
+        w(f"\n- Total symbols validated: {total_symbols}")
+        w(f"\n- Valid symbols: {valid_symbols}")
+        w(f"\n- Failed validation: {total_symbols - valid_symbols}")
 
-        severity_counts = {}
-        for issue in all_issues:
-            severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+        # Issues by severity, in order of first appearance
+        severity_counts = Counter(
+            issue.severity for result in results for issue in result.issues
+        )
 
-        report_lines.append("\n## Issues by Severity")
+        w("\n\n## Issues by Severity")
         for severity, count in severity_counts.items():
-            report_lines.append("- {severity.value.title()}: {count}")
+            w(f"\n- {severity.value.title()}: {count}")
 
         # Detailed results
-        report_lines.append("\n## Detailed Results")
+        w("\n\n## Detailed Results")
         for result in results:
             if result.validation_summary:
                 summary = result.validation_summary
                 symbol = summary["symbol"]
                 data_source = summary["data_source"]
 
-                report_lines.append("\n### {symbol} ({data_source})")
-                report_lines.append(
-                    "- Status: {'✅ Valid' if result.is_valid else '❌ Invalid'}"
-                )
-                report_lines.append("- Data rows: {summary['data_rows']}")
-                report_lines.append("- Total issues: {summary['total_issues']}")
+                w(f"\n\n### {symbol} ({data_source})")
+                w(f"\n- Status: {'✅ Valid' if result.is_valid else '❌ Invalid'}")
+                w(f"\n- Data rows: {summary['data_rows']}")
+                w(f"\n- Total issues: {summary['total_issues']}")
 
                 if result.issues:
-                    report_lines.append("- Issues:")
+                    w("\n- Issues:")
                     for issue in result.issues:
-                        report_lines.append(
-                            "  - {issue.severity.value.upper()}: {issue.issue_type} - {issue.message}"
+                        w(
+                            f"\n  - {issue.severity.value.upper()}: {issue.issue_type} - {issue.message}"
                         )
 
-        report_content = "\n".join(report_lines)
-
-        if output_file:
-            with open(output_file, "w") as f:
-                f.write(report_content)
-            logger.info("Validation report saved to {output_file}")
-
-        return report_content
-
 
 class DataValidator:
     """
@@ -968,12 +1823,7 @@ class DataValidator:
         issues = []
         if not result["is_valid"]:
             # Create a validation issue based on the message
-            data_source = DataSource.UNKNOWN
-            if source.lower() in ["yahoo", "yfinance"]:
-                data_source = DataSource.YAHOO_FINANCE
-            elif source.lower() in ["kite", "kiteconnect"]:
-                data_source = DataSource.KITECONNECT
-
+            data_source = _SOURCE_MAP.get(source.lower(), DataSource.UNKNOWN)
             issues.append(
                 ValidationIssue(
                     symbol=symbol,
@@ -1043,6 +1893,28 @@ def validate_kiteconnect_data(
     return validator.comprehensive_validation(df, symbol, DataSource.KITECONNECT)
 
 
+def validate_many(
+    frames: dict[str, pd.DataFrame],
+    source: DataSource = DataSource.UNKNOWN,
+    strict_mode: bool = False,
+    max_workers: Optional[int] = None,
+) -> dict[str, ValidationResult]:
+    """
+    Validate the frames of many symbols from one source in a thread pool.
+
+    Args:
+        frames: DataFrames keyed by symbol
+        source: Source of the data
+        strict_mode: Whether to use strict validation
+        max_workers: Number of threads; None uses all CPUs
+
+    Returns:
+        ValidationResult per symbol, in the input order
+    """
+    validator = MarketDataValidator(strict_mode=strict_mode)
+    return validator.validate_many(frames, source, max_workers=max_workers)
+
+
 def cross_validate_yahoo_vs_kite(
     yahoo_df: pd.DataFrame, kite_df: pd.DataFrame, symbol: str, tolerance: float = 0.05
 ) -> ValidationResult:
@@ -1069,41 +1941,6 @@ def cross_validate_yahoo_vs_kite(
     )
 
 
-# Example usage and testing
-if __name__ == "__main__":
-    # Example validation workflow
-    print("🔍 Market Data Validation Framework")
-    print("=" * 40)
-
-    # Test with sample data
-    import yfinance as yf
-
-    # Fetch sample data
-    ticker = "RELIANCE.NS"
-    data = yf.download(ticker, start="2024-01-01", end="2024-12-31", progress=False)
-
-    if not data.empty:
-        # Clean column names
-        data.columns = [col.lower() for col in data.columns]
-
-        # Validate
-        result = validate_yahoo_finance_data(data, "RELIANCE")
-
-        print("Validation result for RELIANCE:")
-        print("- Valid: {result.is_valid}")
-        print("- Issues found: {len(result.issues)}")
-
-        for issue in result.issues[:5]:  # Show first 5 issues
-            print("  - {issue.severity.value.upper()}: {issue.message}")
-
-    print("\n✅ Validation framework ready for use!")
-    print("Next steps:")
-    print("1. Integrate with your data ingestion pipeline")
-    print("2. Set up automated validation checks")
-    print("3. Configure alerts for critical issues")
-    print("4. Implement data cleaning based on validation results")
-
-
 def validate_data_integrity(
     data: pd.DataFrame,
     symbol: str,
@@ -1138,99 +1975,171 @@ def validate_data_integrity(
     if required_columns is None:
         required_columns = ["open", "high", "low", "close", "volume"]
 
-    result = ValidationResult(
-        symbol=symbol,
-        source=source,
-        is_valid=True,
-        issues=[],
-        metadata={
-            "row_count": len(data) if data is not None and not data.empty else 0,
-            "column_count": (
-                len(data.columns) if data is not None and not data.empty else 0
-            ),
-            "duplicate_count": 0,
-            "missing_value_count": 0,
-        },
-    )
+    symbol = _intern_symbol(symbol)
+    now = datetime.now()
+    issues: list[ValidationIssue] = []
+    has_data = data is not None and not data.empty
+    summary = {
+        "row_count": len(data) if has_data else 0,
+        "column_count": len(data.columns) if has_data else 0,
+        "duplicate_count": 0,
+        "missing_value_count": 0,
+    }
+
+    def add_issue(
+        issue_type: str,
+        message: str,
+        severity: ValidationSeverity,
+        affected_rows: Optional[int] = None,
+    ) -> None:
+        issues.append(
+            ValidationIssue(
+                symbol=symbol,
+                issue_type=issue_type,
+                severity=severity,
+                message=message,
+                timestamp=now,
+                data_source=source,
+                affected_rows=affected_rows,
+            )
+        )
 
     # Check if data is None or empty
-    if data is None or data.empty:
-        result.is_valid = False
-        result.add_issue("No data available for validation", ValidationSeverity.ERROR)
-        return result
+    if not has_data:
+        add_issue(
+            "no_data", "No data available for validation", ValidationSeverity.ERROR
+        )
+        return ValidationResult(
+            is_valid=False, issues=issues, validation_summary=summary
+        )
+
+    is_valid = True
+
+    # Plain set of the labels for the membership checks below, instead of
+    # having pandas build the Index hash engine for each new frame
+    column_set = frozenset(data.columns)
 
     # Check required columns
     if required_columns:
-        missing_cols = [col for col in required_columns if col not in data.columns]
+        missing_cols = [col for col in required_columns if col not in column_set]
         if missing_cols:
-            result.is_valid = False
-            result.add_issue(
+            is_valid = False
+            add_issue(
+                "missing_columns",
                 f"Missing required columns: {', '.join(missing_cols)}",
                 ValidationSeverity.ERROR,
             )
 
     # Check sufficient data points
     if len(data) < min_rows:
-        result.is_valid = False
-        result.add_issue(
+        is_valid = False
+        add_issue(
+            "insufficient_data",
             f"Insufficient data points: {len(data)} (minimum {min_rows})",
             ValidationSeverity.ERROR,
         )
 
     # Check for duplicates if requested
     if check_duplicates:
-        duplicate_count = data.duplicated().sum()
-        result.metadata["duplicate_count"] = int(duplicate_count)
+        duplicate_count = int(data.duplicated().sum())
+        summary["duplicate_count"] = duplicate_count
         if duplicate_count > 0:
-            result.add_issue(
-                f"Found {duplicate_count} duplicate rows", ValidationSeverity.WARNING
+            add_issue(
+                "duplicate_rows",
+                f"Found {duplicate_count} duplicate rows",
+                ValidationSeverity.WARNING,
+                duplicate_count,
             )
 
     # Check for missing values
-    missing_count = data.isnull().sum().sum()
-    result.metadata["missing_value_count"] = int(missing_count)
+    # One count over the frame's missing-value mask instead of a per-column
+    # sum Series that is then summed again
+    missing_count = int(np.count_nonzero(data.isna().to_numpy()))
+    summary["missing_value_count"] = missing_count
     if missing_count > 0:
         missing_pct = missing_count / (len(data) * len(data.columns))
         if missing_pct > max_missing_pct:
-            result.is_valid = False
-            result.add_issue(
+            is_valid = False
+            add_issue(
+                "missing_values",
                 f"High percentage of missing values: {missing_pct:.2%} (max allowed: {max_missing_pct:.2%})",
                 ValidationSeverity.ERROR,
+                missing_count,
             )
         else:
-            result.add_issue(
+            add_issue(
+                "missing_values",
                 f"Contains {missing_count} missing values ({missing_pct:.2%})",
                 ValidationSeverity.WARNING,
+                missing_count,
             )
 
     # Price continuity check (if price columns exist)
-    price_cols = [
-        col for col in ["open", "high", "low", "close"] if col in data.columns
-    ]
-    if price_cols:
-        # Check for unrealistic price jumps
-        for col in price_cols:
-            if len(data) > 1:
-                price_changes = data[col].pct_change().abs()
-                extreme_changes = price_changes[
-                    price_changes > 0.2
-                ]  # 20% change threshold
-                if not extreme_changes.empty:
-                    result.add_issue(
-                        f"Extreme price changes detected in '{col}' column: {len(extreme_changes)} instances",
-                        ValidationSeverity.WARNING,
-                    )
+    price_cols = [col for col in _PRICE_COLUMNS if col in column_set]
+    if price_cols and len(data) > 1:
+        # Check for unrealistic price jumps (20% change threshold), counted
+        # for all price columns at once on one 2D block
+        prices = data[price_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        extreme_counts = _count_extreme_changes(prices, 0.2)
+        for col, count in zip(price_cols, extreme_counts.tolist()):
+            if count:
+                add_issue(
+                    "extreme_price_change",
+                    f"Extreme price changes detected in '{col}' column: {count} instances",
+                    ValidationSeverity.WARNING,
+                    count,
+                )
 
     # Additional validation for specific data types could be added here
 
     # Log validation summary
-    if result.is_valid:
+    if is_valid:
         logger.info(
-            f"✅ Data integrity validation passed for {symbol} ({source.value})"
+            "✅ Data integrity validation passed for %s (%s)", symbol, source.value
         )
     else:
         logger.warning(
-            f"⚠️ Data integrity validation failed for {symbol} ({source.value}): {len(result.issues)} issues found"
+            "⚠️ Data integrity validation failed for %s (%s): %d issues found",
+            symbol,
+            source.value,
+            len(issues),
         )
 
-    return result
+    return ValidationResult(
+        is_valid=is_valid, issues=issues, validation_summary=summary
+    )
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    # Example validation workflow
+    print("🔍 Market Data Validation Framework")
+    print("=" * 40)
+
+    # Test with sample data
+    import yfinance as yf
+
+    # Fetch sample data
+    ticker = "RELIANCE.NS"
+    data = yf.download(ticker, start="2024-01-01", end="2024-12-31", progress=False)
+
+    if not data.empty:
+        # Clean column names
+        data.columns = [col.lower() for col in data.columns]
+
+        # Validate
+        result = validate_yahoo_finance_data(data, "RELIANCE")
+
+        print("Validation result for RELIANCE:")
+        print(f"- Valid: {result.is_valid}")
+        print(f"- Issues found: {len(result.issues)}")
+
+        for issue in result.issues[:5]:  # Show first 5 issues
+            print(f"  - {issue.severity.value.upper()}: {issue.message}")
+
+    print("\n✅ Validation framework ready for use!")
+    print("Next steps:")
+    print("1. Integrate with your data ingestion pipeline")
+    print("2. Set up automated validation checks")
+    print("3. Configure alerts for critical issues")
+    print("4. Implement data cleaning based on validation results")
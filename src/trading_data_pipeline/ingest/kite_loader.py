@@ -22,7 +22,9 @@ Licensed by SJ Trading
 
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -70,6 +72,40 @@ except ImportError:
 
 logger = setup_logger(__name__)
 
+# Kite allows 3 historical data requests per second
+HISTORICAL_REQUESTS_PER_SECOND = 3.0
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` acquisitions per second.
+
+    The bucket holds at most one token, so acquisitions are spaced 1/rate
+    seconds apart and never burst above the limit.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = 1.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class KiteDataLoader:
     """
@@ -82,13 +118,20 @@ class KiteDataLoader:
     4. SEBI-compliant trade execution
     """
 
-    def __init__(self, api_key: str = None, access_token: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        access_token: str = None,
+        historical_requests_per_second: float = HISTORICAL_REQUESTS_PER_SECOND,
+    ):
         """
         Initialize KiteConnect integration.
 
         Args:
             api_key: Zerodha API key (optional, can be set via environment)
             access_token: Valid access token (optional, can be set via environment)
+            historical_requests_per_second: Rate limit shared by every
+                historical data request made through this loader
         """
         if not KITE_AVAILABLE:
             raise ImportError(
@@ -131,6 +174,10 @@ class KiteDataLoader:
         self._symbol_to_token = {}
         self._token_to_symbol = {}
 
+        # Shared by all threads and calls, so concurrent and back-to-back
+        # fetches together stay within Kite's historical data limit
+        self._historical_limiter = _TokenBucket(historical_requests_per_second)
+
         # Real-time data storage
         self.live_data = {}
         self.subscribed_tokens = set()
@@ -197,13 +244,13 @@ class KiteDataLoader:
             instruments = self.kite.instruments(exchange)
             df = pd.DataFrame(instruments)
 
-            # Build mapping caches
-            for _, row in df.iterrows():
-                symbol = row["tradingsymbol"]
-                token = row["instrument_token"]
-
-                self._symbol_to_token[symbol] = token
-                self._token_to_symbol[token] = symbol
+            # Build mapping caches from the two columns at once instead of
+            # boxing every row into a Series
+            if not df.empty:
+                symbols = df["tradingsymbol"].tolist()
+                tokens = df["instrument_token"].tolist()
+                self._symbol_to_token.update(zip(symbols, tokens))
+                self._token_to_symbol.update(zip(tokens, symbols))
 
             self._instruments_cache[exchange] = df
             logger.info("Loaded {len(df)} instruments for {exchange}")
@@ -252,6 +299,7 @@ class KiteDataLoader:
                 raise ValueError("Instrument token not found for {symbol}")
 
             # Fetch historical data
+            self._historical_limiter.acquire()
             data = self.kite.historical_data(
                 instrument_token=token,
                 from_date=start_date,
@@ -301,39 +349,54 @@ class KiteDataLoader:
         end_date: datetime,
         interval: str = "day",
         exchange: str = "NSE",
+        max_workers: int = 3,
     ) -> dict[str, pd.DataFrame]:
         """
         Fetch historical data for multiple symbols efficiently.
 
+        Requests run concurrently in a thread pool, so their network round
+        trips overlap, while the loader's token bucket keeps the request
+        rate within Kite's historical data limit.
+
         Args:
             symbols: List of trading symbols
             start_date: Start date for data
             end_date: End date for data
             interval: Data interval
             exchange: Exchange name
+            max_workers: Number of requests in flight at once
 
         Returns:
-            Dictionary mapping symbols to their DataFrames
+            Dictionary mapping symbols to their DataFrames, in the input order
         """
-        results = {}
+        # Load the instrument map once up front rather than in every worker.
+        # On failure each fetch below retries the load and logs its own error.
+        if exchange not in self._instruments_cache:
+            try:
+                self.load_instruments(exchange)
+            except Exception as e:
+                logger.warning("Could not preload %s instruments: %s", exchange, e)
 
-        for symbol in symbols:
+        def fetch(symbol: str) -> Optional[pd.DataFrame]:
             try:
-                df = self.fetch_historical_data(
+                return self.fetch_historical_data(
                     symbol, start_date, end_date, interval, exchange
                 )
-                if not df.empty:
-                    results[symbol] = df
+            except Exception as e:
+                logger.error("Failed to fetch data for %s: %s", symbol, e)
+                return None
 
-                # Rate limiting to avoid API limits
-                time.sleep(0.1)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            frames = list(executor.map(fetch, symbols))
 
-            except Exception as e:
-                logger.error("Failed to fetch data for {symbol}: {e}")
-                continue
+        results = {
+            symbol: df
+            for symbol, df in zip(symbols, frames)
+            if df is not None and not df.empty
+        }
 
         logger.info(
-            "Successfully fetched data for {len(results)}/{len(symbols)} symbols"
+            "Successfully fetched data for %d/%d symbols", len(results), len(symbols)
         )
         return results
 
@@ -0,0 +1,174 @@
+"""
+Tests for the BigQuery DatabaseManager: buffered writes and query caching.
+"""
+
+import threading
+from datetime import date
+
+from google.cloud import bigquery
+
+from trading_data_pipeline.database.schema import DatabaseManager
+
+
+class FakeBigQueryClient:
+    """Records streaming inserts; tables in ``failing`` return row errors."""
+
+    def __init__(self, project="test-project", failing=()):
+        self.project = project
+        self.failing = set(failing)
+        self.inserts = []
+        self._lock = threading.Lock()
+
+    def dataset(self, dataset_id):
+        return bigquery.DatasetReference(self.project, dataset_id)
+
+    def insert_rows_json(self, table_ref, rows, retry=None):
+        with self._lock:
+            self.inserts.append((table_ref.table_id, list(rows)))
+        if table_ref.table_id in self.failing:
+            return [{"index": 0, "errors": ["rejected"]}]
+        return []
+
+    def rows_for(self, table):
+        return [row for name, rows in self.inserts if name == table for row in rows]
+
+
+def _manager(client, **kwargs):
+    db = DatabaseManager(
+        project_id="test-project",
+        use_storage_write=False,
+        flush_interval=0,
+        **kwargs,
+    )
+    db.bq_client = client
+    return db
+
+
+def test_rows_are_batched_per_table():
+    """Full batches are written as they fill; flush() sends the remainder."""
+    client = FakeBigQueryClient()
+    db = _manager(client, max_batch=3)
+    try:
+        for i in range(7):
+            assert db.insert_trading_signal({"signal_id": str(i), "symbol": "AAPL"})
+        db.insert_paper_trade({"trade_id": "t1", "symbol": "AAPL"})
+        db._write_q.join()
+
+        # Only the two full signal batches have been written so far
+        assert sorted(len(rows) for _, rows in client.inserts) == [3, 3]
+
+        assert db.flush()
+        assert sorted((name, len(rows)) for name, rows in client.inserts) == [
+            ("paper_trades", 1),
+            ("trading_signals", 1),
+            ("trading_signals", 3),
+            ("trading_signals", 3),
+        ]
+        signals = client.rows_for("trading_signals")
+        assert sorted(int(row["signal_id"]) for row in signals) == list(range(7))
+        assert all("created_at" in row for row in signals)
+    finally:
+        db.close()
+
+
+def test_flush_reports_failures_of_its_own_table():
+    """A failed batch is reported once, by a flush of its table or of all."""
+    client = FakeBigQueryClient(failing={"paper_trades"})
+    db = _manager(client)
+    try:
+        db.insert_paper_trade({"trade_id": "t1", "symbol": "AAPL"})
+        db._dispatch_pending("paper_trades")
+        db.insert_trading_signal({"signal_id": "s1", "symbol": "AAPL"})
+
+        assert db.flush("trading_signals")
+        assert not db.flush("paper_trades")
+        assert db.flush("paper_trades")
+
+        db.insert_paper_trade({"trade_id": "t2", "symbol": "AAPL"})
+        assert not db.flush()
+        assert db.flush()
+    finally:
+        db.close()
+
+
+def test_close_writes_buffered_rows_and_stops_writers():
+    """close() flushes what is buffered and joins the writer threads."""
+    client = FakeBigQueryClient()
+    db = _manager(client, max_batch=2, writer_threads=3)
+    db.insert_market_data([{"symbol": "AAPL", "close": float(i)} for i in range(5)])
+    writers = list(db._writers)
+    db.close()
+
+    assert len(writers) == 3
+    assert not any(thread.is_alive() for thread in writers)
+    assert db._writers == []
+    assert len(client.rows_for("market_data")) == 5
+
+
+def test_cached_daily_performance_rows_are_copies(monkeypatch):
+    """Mutating returned rows does not change what later cache hits return."""
+    client = FakeBigQueryClient()
+    client.query = lambda query, job_config=None: object()
+    db = _manager(client)
+    db._daily_perf_cache = {}
+    queries = []
+
+    def query_rows(query_job):
+        queries.append(query_job)
+        return [{"date": date(2024, 1, 2), "total_pnl": 1.0}]
+
+    monkeypatch.setattr(db, "_query_rows", query_rows)
+
+    first = db.get_daily_performance(date(2024, 1, 1), date(2024, 1, 31))
+    first[0]["total_pnl"] = 99.0
+    second = db.get_daily_performance(date(2024, 1, 1), date(2024, 1, 31))
+    second[0]["total_pnl"] = 42.0
+    third = db.get_daily_performance(date(2024, 1, 1), date(2024, 1, 31))
+
+    assert len(queries) == 1
+    assert third[0]["total_pnl"] == 1.0
+
+
+def test_buffered_rows_are_copies_of_the_callers_dicts():
+    """Reusing a row dict after insert_* returns doesn't change what is written."""
+    client = FakeBigQueryClient()
+    db = _manager(client)
+    try:
+        row = {"signal_id": "s1", "symbol": "AAPL"}
+        assert db.insert_trading_signal(row)
+        row["symbol"] = "MSFT"
+        row["signal_id"] = "s2"
+        assert db.insert_trading_signal(row)
+        assert db.flush()
+
+        written = client.rows_for("trading_signals")
+        assert [(r["signal_id"], r["symbol"]) for r in written] == [
+            ("s1", "AAPL"),
+            ("s2", "MSFT"),
+        ]
+        assert "created_at" not in row
+    finally:
+        db.close()
+
+
+def test_cleanup_keeps_ingestion_time_retention_by_default():
+    """Backfilled history is only dropped by trading date when asked to."""
+    client = FakeBigQueryClient()
+    queries = []
+
+    class Job:
+        def result(self):
+            return []
+
+    def query(sql, job_config=None):
+        queries.append(" ".join(sql.split()))
+        return Job()
+
+    client.query = query
+    db = _manager(client)
+
+    db.cleanup_old_data()
+    db.cleanup_old_data(by_trading_date=True)
+
+    assert "WHERE created_at < TIMESTAMP_SUB" in queries[0]
+    assert "WHERE date < DATE_SUB" in queries[1]
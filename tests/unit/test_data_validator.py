@@ -2,7 +2,12 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from trading_data_pipeline.ingest.data_validator import validate_data
+from trading_data_pipeline.ingest.data_validator import (
+    MarketDataValidator,
+    ValidationSeverity,
+    validate_data,
+    validate_data_integrity,
+)
 
 
 def test_validate_data():
@@ -48,3 +53,133 @@ def test_validate_data():
 
     result = validate_data(missing_df, symbol="MISSING", source="yahoo")
     assert isinstance(result["cleaned_data"], pd.DataFrame)
+
+
+def test_validate_price_batch_matches_per_symbol():
+    """Batch validation finds the same issues as validating each symbol alone."""
+    dates = pd.date_range("2023-01-02", periods=15, freq="B")
+    frames = []
+    for i, symbol in enumerate(["AAPL", "MSFT", "GOOG"]):
+        close = np.linspace(100, 110, len(dates)) * (i + 1)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "date": dates,
+                    "open": close - 1,
+                    "high": close + 2,
+                    "low": close - 2,
+                    "close": close,
+                    "volume": np.full(len(dates), 1000.0),
+                }
+            )
+        )
+    frames[0].loc[3, "high"] = 50.0
+    frames[1].loc[5, "close"] = 2000.0
+    frames[2].loc[7, "volume"] = 1e9
+
+    validator = MarketDataValidator()
+    batch = validator.validate_price_batch(
+        pd.concat(frames).sample(frac=1, random_state=0)
+    )
+
+    for frame in frames:
+        symbol = frame["symbol"].iloc[0]
+        expected = validator.validate_price_data(frame.set_index("date"), symbol)
+        result = batch[symbol]
+        assert result.is_valid == expected.is_valid
+        assert [(i.issue_type, i.severity, i.affected_rows) for i in result.issues] == [
+            (i.issue_type, i.severity, i.affected_rows) for i in expected.issues
+        ]
+
+
+def test_comprehensive_validation_batch_matches_per_symbol():
+    """Batch comprehensive validation gives each symbol's own result."""
+    dates = pd.date_range("2023-01-02 09:15", periods=40, freq="30min")
+    frames = []
+    for i, symbol in enumerate(["AAPL", "MSFT"]):
+        close = np.linspace(100, 110, len(dates)) * (i + 1)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "symbol": symbol,
+                    "date": dates,
+                    "open": close - 1,
+                    "high": close + 2,
+                    "low": close - 2,
+                    "close": close,
+                    "volume": np.full(len(dates), 1000.0),
+                }
+            )
+        )
+    frames[0].loc[3:8, "close"] = np.nan
+    frames[1].loc[5, "low"] = -1.0
+
+    validator = MarketDataValidator()
+    batch = validator.comprehensive_validation_batch(
+        pd.concat(frames).sample(frac=1, random_state=0)
+    )
+
+    for frame in frames:
+        symbol = frame["symbol"].iloc[0]
+        expected = validator.comprehensive_validation(frame.set_index("date"), symbol)
+        result = batch[symbol]
+        assert result.is_valid == expected.is_valid
+        assert [(i.issue_type, i.message) for i in result.issues] == [
+            (i.issue_type, i.message) for i in expected.issues
+        ]
+        assert result.validation_summary["data_rows"] == len(frame)
+
+
+def test_validate_data_integrity():
+    """Integrity checks report issues; price jumps match abs(pct_change()) > 20%."""
+    close = np.linspace(100, 110, 30)
+    df = pd.DataFrame(
+        {
+            "open": close - 1,
+            "high": close + 2,
+            "low": close - 2,
+            "close": close,
+            "volume": np.full(30, 1000.0),
+        },
+        index=pd.date_range("2023-01-02", periods=30, freq="B"),
+    )
+
+    result = validate_data_integrity(df, symbol="AAPL")
+    assert result.is_valid
+    assert result.issues == []
+    assert result.validation_summary["row_count"] == 30
+
+    broken = df.copy()
+    broken.loc[broken.index[5], "close"] = 200.0  # jump up and back down
+    broken.loc[broken.index[10], "low"] = 0.0  # change from zero counts
+    broken.loc[broken.index[20], "open"] = np.nan
+    broken.iloc[25] = broken.iloc[24]
+
+    result = validate_data_integrity(broken, symbol="AAPL")
+    by_type = {}
+    for issue in result.issues:
+        by_type.setdefault(issue.issue_type, []).append(issue)
+
+    assert result.is_valid  # only warnings
+    assert by_type["duplicate_rows"][0].affected_rows == 1
+    assert by_type["missing_values"][0].affected_rows == 1
+    expected = {
+        col: int((broken[col].pct_change().abs() > 0.2).sum())
+        for col in ["open", "high", "low", "close"]
+    }
+    assert {
+        issue.message.split("'")[1]: issue.affected_rows
+        for issue in by_type["extreme_price_change"]
+    } == {col: count for col, count in expected.items() if count}
+    assert expected["close"] == 2 and expected["low"] == 2
+
+    result = validate_data_integrity(df.head(5).drop(columns="volume"), "AAPL")
+    assert not result.is_valid
+    assert {issue.issue_type for issue in result.issues} == {
+        "missing_columns",
+        "insufficient_data",
+    }
+    assert all(i.severity == ValidationSeverity.ERROR for i in result.issues)
+
+    assert not validate_data_integrity(pd.DataFrame(), "AAPL").is_valid
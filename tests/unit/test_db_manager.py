@@ -0,0 +1,215 @@
+"""
+Tests for the SQLite database manager's queued writer.
+"""
+
+import gc
+import threading
+import time
+import weakref
+
+import numpy as np
+import pytest
+
+from trading_data_pipeline.database import db_manager
+from trading_data_pipeline.database.db_manager import (
+    DatabaseManager,
+    DatabaseMode,
+    decode_metadata,
+    encode_metadata,
+)
+
+
+def _bars(n, close=100.0):
+    return [
+        {
+            "timestamp": f"2024-01-02 {i // 60:02d}:{i % 60:02d}:00",
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 1000,
+        }
+        for i in range(n)
+    ]
+
+
+def _flush_within(db, timeout=10.0):
+    """Run db.flush() and fail instead of hanging if it never returns."""
+    thread = threading.Thread(target=db.flush, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "flush() did not return"
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DatabaseManager(DatabaseMode.TESTING)
+    yield manager
+    manager.close()
+
+
+def _count(db, table, db_type="source_db"):
+    conn = db.get_connection(db_type)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_queued_writes_are_committed_on_flush(db):
+    """Market data and backtest results land after flush(); re-ingest is a no-op."""
+    db.save_market_data("AAPL", _bars(100), "test")
+    db.save_market_data("AAPL", _bars(100), "test")
+    db.save_backtest_result(
+        {
+            "strategy": "rsi",
+            "symbol": "AAPL",
+            "start_date": "2024-01-01",
+            "end_date": "2024-06-30",
+            "metadata": {"k": 1},
+        }
+    )
+    _flush_within(db)
+
+    assert _count(db, "market_data") == 100
+    assert _count(db, "backtest_results", "results_db") == 1
+
+
+def test_bad_record_does_not_drop_the_batch(db):
+    """A failing write is retried alone; the rest of the batch commits."""
+    bad = _bars(1)
+    bad[0]["open"] = None  # violates NOT NULL
+    db.save_market_data("BAD", bad, "test")
+    db.save_market_data("AAPL", _bars(5), "test")
+    _flush_within(db)
+
+    assert _count(db, "market_data") == 5
+
+
+def test_writer_survives_errors_outside_the_retry(db, monkeypatch):
+    """An exception after the commit must not stop the writer thread."""
+    db._analyze_after = 1
+
+    def failing_analyze(db_type="source_db"):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(db, "analyze", failing_analyze)
+    db.save_market_data("AAPL", _bars(5), "test")
+    _flush_within(db)
+
+    db.save_market_data("MSFT", _bars(5), "test")
+    _flush_within(db)
+
+    assert db._writer_thread.is_alive()
+    assert _count(db, "market_data") == 10
+
+
+def test_close_drains_the_queue(tmp_path, monkeypatch):
+    """close() commits whatever is still queued before stopping the writer."""
+    monkeypatch.chdir(tmp_path)
+    db = DatabaseManager(DatabaseMode.TESTING)
+    db.save_market_data("AAPL", _bars(20), "test")
+    db.close()
+
+    assert not db._writer_thread.is_alive()
+    reader = DatabaseManager(DatabaseMode.TESTING)
+    try:
+        assert _count(reader, "market_data") == 20
+    finally:
+        reader.close()
+
+
+def test_backtest_metadata_round_trips(db):
+    """Metadata stored as a BLOB is read back as a dict."""
+    period = {"symbol": "AAPL", "start_date": "2024-01-01", "end_date": "2024-06-30"}
+    db.save_backtest_result(
+        {"strategy": "rsi", "metadata": {"period": 14, "tags": ["a"]}, **period}
+    )
+    db.save_backtest_result({"strategy": "sma", **period})
+    _flush_within(db)
+
+    (result,) = db.get_backtest_results(strategy="rsi", symbol="AAPL")
+    assert result["metadata"] == {"period": 14, "tags": ["a"]}
+    assert [r["strategy"] for r in db.get_backtest_results(symbol="AAPL")] == [
+        "sma",
+        "rsi",
+    ]
+    assert db.get_backtest_results(strategy="sma")[0]["metadata"] == {}
+
+
+def test_database_stats_skip_internal_tables(db):
+    """ANALYZE's sqlite_stat1 and sqlite_sequence are not counted as data."""
+    db.save_market_data("AAPL", _bars(3), "test")
+    _flush_within(db)
+    db.analyze("source_db")
+
+    source = db.get_database_stats()["databases"]["source_db"]
+    assert not any(table.startswith("sqlite_") for table in source["tables"])
+    assert source["total_records"] == 3
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_metadata_accepts_int_and_numpy_keys(monkeypatch, use_orjson):
+    """Non-string keys are stored as strings, as json.dumps does."""
+    if use_orjson and not db_manager.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(db_manager, "USE_ORJSON", use_orjson)
+
+    metadata = {1: "x", np.int64(2): {np.float64(0.5): [np.int32(3)]}, "a": None}
+
+    assert decode_metadata(encode_metadata(metadata)) == {
+        "1": "x",
+        "2": {"0.5": [3]},
+        "a": None,
+    }
+
+
+def test_backtest_result_with_int_metadata_keys_is_saved(db):
+    """A result whose metadata has int keys is written, not dropped."""
+    db.save_backtest_result(
+        {
+            "strategy": "rsi",
+            "symbol": "AAPL",
+            "start_date": "2024-01-01",
+            "end_date": "2024-06-30",
+            "metadata": {14: 0.6, np.int64(28): 0.4},
+        }
+    )
+    _flush_within(db)
+
+    (result,) = db.get_backtest_results(strategy="rsi")
+    assert result["metadata"] == {"14": 0.6, "28": 0.4}
+
+
+def test_writes_after_close_are_rejected(tmp_path, monkeypatch):
+    """Saving to a closed manager fails fast instead of queueing forever."""
+    monkeypatch.chdir(tmp_path)
+    db = DatabaseManager(DatabaseMode.TESTING)
+    assert db.save_market_data("AAPL", _bars(2), "test")
+    db.close()
+
+    assert not db.save_market_data("AAPL", _bars(2), "test")
+    assert not db.save_backtest_result({"strategy": "rsi", "symbol": "AAPL"})
+    _flush_within(db)
+
+
+def test_unclosed_manager_can_be_garbage_collected(tmp_path, monkeypatch):
+    """Nothing keeps a dropped manager alive; its writer thread then exits."""
+    monkeypatch.chdir(tmp_path)
+    db = DatabaseManager(DatabaseMode.TESTING)
+    db.save_market_data("AAPL", _bars(2), "test")
+    _flush_within(db)
+    ref = weakref.ref(db)
+    writer = db._writer_thread
+
+    del db
+    # The writer thread lets go of the manager once it is idle
+    deadline = time.monotonic() + 10
+    while ref() is not None and time.monotonic() < deadline:
+        gc.collect()
+        time.sleep(0.01)
+
+    assert ref() is None
+    writer.join(10)
+    assert not writer.is_alive()
@@ -0,0 +1,87 @@
+"""
+Tests for the ingest data_cleaner module.
+"""
+
+import numpy as np
+import pandas as pd
+
+from trading_data_pipeline.ingest.data_cleaner import (
+    clean_ohlcv_data,
+    enforce_ohlc_consistency,
+    get_outlier_bounds,
+    impute_missing_values,
+    remove_outliers,
+)
+
+
+def test_remove_outliers():
+    """Outliers are capped per column and other columns are left as-is."""
+    df = pd.DataFrame(
+        {
+            "Close": [100.0, 101.0, 99.0, 100.5, 1000.0, np.nan],
+            "Volume": [1000, 1100, 900, 1050, 950, 1000],
+            "symbol": ["AAPL"] * 6,
+        }
+    )
+
+    cleaned = remove_outliers(df, method="iqr", threshold=1.5)
+
+    q1, q3 = df["Close"].quantile([0.25, 0.75])
+    assert cleaned.loc[4, "Close"] == q3 + 1.5 * (q3 - q1), "Spike should be capped"
+    assert np.isnan(cleaned.loc[5, "Close"]), "NaN should be left for imputation"
+    pd.testing.assert_series_equal(cleaned["Volume"], df["Volume"])
+    assert df.loc[4, "Close"] == 1000.0, "Input frame should not be modified"
+
+    # zscore caps to mean +/- threshold * std
+    capped = remove_outliers(df, method="zscore", threshold=1.0)
+    close = df["Close"]
+    assert capped["Close"].max() <= close.mean() + close.std() + 1e-9
+
+    # Bounds computed once give the same result when passed back in
+    bounds = get_outlier_bounds(df, method="iqr", threshold=1.5)
+    pd.testing.assert_frame_equal(
+        remove_outliers(df, precomputed_bounds=bounds), cleaned
+    )
+
+
+def test_clean_ohlcv_data_fused_matches_stages():
+    """The single-pass clean gives the same result as the individual stages."""
+    df = pd.DataFrame(
+        {
+            "Open": [100.0, np.nan, 102.0, 101.0, 103.0, 102.5],
+            "High": [101.0, 102.0, 101.5, 102.0, 104.0, 103.0],
+            "Low": [99.0, 100.0, 101.0, np.nan, 102.0, 101.0],
+            "Close": [100.5, 101.5, 101.0, 101.5, 5000.0, 102.0],
+            "Volume": [1000, 1100, 900, 1050, 950, 1000],
+        }
+    )
+
+    cleaned = clean_ohlcv_data(df, validate=False)
+
+    expected = enforce_ohlc_consistency(remove_outliers(impute_missing_values(df)))
+    pd.testing.assert_frame_equal(cleaned, expected)
+    assert not cleaned.isna().any().any()
+    assert (cleaned["High"] >= cleaned[["Open", "Close"]].max(axis=1)).all()
+
+
+def test_clean_ohlcv_data_default_validation_keeps_labels():
+    """Validation only reports; the caller's labels and the OHLC fix are kept."""
+    df = pd.DataFrame(
+        {
+            "Open": [100.0, 101.0, 102.0, 101.0, 103.0],
+            "High": [101.0, 102.0, 100.0, 102.0, 104.0],
+            "Low": [99.0, 100.0, 99.5, 100.0, 102.0],
+            "Close": [100.5, 101.5, 103.0, 101.5, 103.5],
+            "Volume": [1000, 1100, 900, 1050, 950],
+        },
+        index=pd.date_range("2023-01-02", periods=5, freq="B"),
+    )
+
+    for validate in ("pre", "both"):
+        cleaned = clean_ohlcv_data(df, validate=validate)
+
+        assert list(cleaned.columns) == list(df.columns)
+        pd.testing.assert_frame_equal(cleaned, clean_ohlcv_data(df, validate=False))
+        assert (
+            cleaned.loc[df.index[2], "High"] == 103.0
+        ), "High should be raised to Close"
@@ -0,0 +1,113 @@
+"""
+Tests for fetching many symbols through the Kite loader, with a fake client.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from trading_data_pipeline.ingest import kite_loader
+from trading_data_pipeline.ingest.kite_loader import KiteDataLoader
+
+INSTRUMENTS = [
+    {"tradingsymbol": symbol, "instrument_token": token}
+    for token, symbol in enumerate(["INFY", "TCS", "EMPTY", "BROKEN", "WIPRO"], 1)
+]
+
+
+class FakeKiteConnect:
+    """Serves instruments and one daily bar per symbol; BROKEN fails."""
+
+    instruments_error = None
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.request_times = []
+
+    def set_access_token(self, access_token):
+        pass
+
+    def instruments(self, exchange):
+        if self.instruments_error:
+            raise self.instruments_error
+        return INSTRUMENTS
+
+    def historical_data(self, instrument_token, from_date, to_date, interval):
+        self.request_times.append(time.monotonic())
+        symbol = INSTRUMENTS[instrument_token - 1]["tradingsymbol"]
+        if symbol == "BROKEN":
+            raise ConnectionError("timed out")
+        if symbol == "EMPTY":
+            return []
+        return [
+            {
+                "date": "2024-01-02",
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": float(instrument_token),
+                "volume": 100,
+            }
+        ]
+
+
+@pytest.fixture
+def make_loader(monkeypatch):
+    monkeypatch.setattr(kite_loader, "KITE_AVAILABLE", True)
+    monkeypatch.setattr(kite_loader, "KiteConnect", FakeKiteConnect, raising=False)
+    monkeypatch.setattr(FakeKiteConnect, "instruments_error", None)
+
+    def make(rate=1000.0):
+        return KiteDataLoader(
+            api_key="key", access_token="token", historical_requests_per_second=rate
+        )
+
+    return make
+
+
+@pytest.fixture
+def loader(make_loader):
+    return make_loader()
+
+
+def _fetch(loader, symbols):
+    return loader.fetch_multiple_symbols(
+        symbols, datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+
+def test_fetch_multiple_symbols_keeps_order_and_skips_failures(loader):
+    """Results follow the input order; failed and empty symbols are left out."""
+    symbols = ["WIPRO", "BROKEN", "INFY", "UNKNOWN", "EMPTY", "TCS"]
+
+    results = _fetch(loader, symbols)
+
+    assert list(results) == ["WIPRO", "INFY", "TCS"]
+    assert results["INFY"]["close"].iloc[0] == 1.0
+    assert (results["TCS"]["symbol"] == "TCS").all()
+
+
+def test_fetch_multiple_symbols_logs_instrument_failures(loader, monkeypatch):
+    """An instrument load failure is logged per symbol, not raised."""
+    monkeypatch.setattr(
+        FakeKiteConnect, "instruments_error", RuntimeError("instruments down")
+    )
+    assert _fetch(loader, ["INFY", "TCS"]) == {}
+
+    loader.is_authenticated = False
+    assert _fetch(loader, ["INFY"]) == {}
+
+
+def test_historical_requests_are_spaced_by_the_rate_limit(make_loader):
+    """No burst: requests are 1/rate apart, within and across calls."""
+    rate = 20.0
+    loader = make_loader(rate)
+
+    _fetch(loader, ["INFY", "TCS", "WIPRO", "INFY"])
+    _fetch(loader, ["TCS", "WIPRO", "INFY"])
+
+    times = sorted(loader.kite.request_times)
+    assert len(times) == 7
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert min(gaps) >= 0.9 / rate